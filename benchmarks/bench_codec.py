@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk json codec benchmarks
+"""
+from datary.requests import get_codec
+from datary.requests.codec import orjson
+
+from .common import SIZES, make_rows
+
+CODECS = ['json'] + (['orjson'] if orjson is not None else [])
+
+
+class JsonCodec(object):
+    """
+    DataryJsonCodec encode & decode of kern blobs
+    """
+    params = (SIZES[:3], CODECS)
+    param_names = ['rows', 'codec']
+
+    def setup(self, n_rows, codec):
+        self.codec = get_codec(codec)
+        self.blob = {'__kern': make_rows(n_rows), '__meta': {}}
+        self.data = self.codec.dumpb(self.blob)
+
+    def time_dumpb(self, n_rows, codec):
+        self.codec.dumpb(self.blob)
+
+    def time_loads(self, n_rows, codec):
+        self.codec.loads(self.data)
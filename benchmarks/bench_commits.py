@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk commits benchmarks
+"""
+import os
+
+from .common import SIZES, make_datary, make_commit, make_difference
+
+
+def path_key(row):
+    """
+    Returns:
+        (str) path + basename of a commit row.
+    """
+    return os.path.join(row[0], row[1])
+
+
+class MakeIndex(object):
+    """
+    DataryCommits.make_index benchmarks
+    """
+    params = SIZES
+    param_names = ['paths']
+
+    def setup(self, n_paths):
+        self.datary = make_datary()
+        self.commit = make_commit(n_paths)
+
+    def time_make_index(self, n_paths):
+        self.datary.make_index(self.commit)
+
+    def peakmem_make_index(self, n_paths):
+        self.datary.make_index(self.commit)
+
+
+class CompareCommits(object):
+    """
+    DataryCommits.compare_commits benchmarks
+    """
+    params = SIZES
+    param_names = ['paths']
+
+    def setup(self, n_paths):
+        self.datary = make_datary()
+        self.last_commit = make_commit(n_paths)
+        self.actual_commit = make_commit(n_paths, sha1_suffix='_new')
+        self.sorted_last_commit = sorted(self.last_commit, key=path_key)
+        self.sorted_actual_commit = sorted(self.actual_commit, key=path_key)
+
+    def time_compare_commits(self, n_paths):
+        self.datary.compare_commits(self.last_commit, self.actual_commit)
+
+    def time_compare_sorted_commits(self, n_paths):
+        for _ in self.datary.compare_sorted_commits(
+                self.sorted_last_commit, self.sorted_actual_commit):
+            pass
+
+    def peakmem_compare_commits(self, n_paths):
+        self.datary.compare_commits(self.last_commit, self.actual_commit)
+
+
+class CommitDiffToString(object):
+    """
+    DataryCommits.commit_diff_tostring benchmarks
+    """
+    params = SIZES
+    param_names = ['paths']
+
+    def setup(self, n_paths):
+        self.datary = make_datary()
+        self.difference = make_difference(n_paths)
+
+    def time_commit_diff_tostring(self, n_paths):
+        self.datary.commit_diff_tostring(self.difference)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk datasets benchmarks
+"""
+import io
+import json
+
+import mock
+import requests
+
+from .common import SIZES, make_datary, make_rows
+
+
+class GetOriginal(object):
+    """
+    DataryDatasets.get_original benchmarks, decoding a served dataset
+    """
+    params = SIZES[:3]
+    param_names = ['rows']
+
+    def setup(self, n_rows):
+        self.datary = make_datary()
+        self.body = json.dumps({
+            '__kern': make_rows(n_rows), '__meta': {}}).encode('utf-8')
+
+        def get(url, **kwargs):
+            response = requests.models.Response()
+            response.status_code = 200
+            response._content = self.body
+            return response
+
+        self.session = mock.patch.object(
+            self.datary, 'session', **{'get.side_effect': get})
+        self.session.start()
+
+    def teardown(self, n_rows):
+        self.session.stop()
+
+    def time_get_original(self, n_rows):
+        self.datary.get_original('dataset', 'repo', 'wdir')
+
+    def peakmem_get_original(self, n_rows):
+        self.datary.get_original('dataset', 'repo', 'wdir')
+
+
+class IterKern(object):
+    """
+    DataryDatasets.iter_kern benchmarks, streaming a served dataset kern
+    """
+    params = SIZES[:3]
+    param_names = ['rows']
+
+    def setup(self, n_rows):
+        self.datary = make_datary()
+        self.body = json.dumps(make_rows(n_rows)).encode('utf-8')
+
+        def get(url, **kwargs):
+            response = requests.models.Response()
+            response.status_code = 200
+            response.raw = io.BytesIO(self.body)
+            return response
+
+        self.session = mock.patch.object(
+            self.datary, 'session', **{'get.side_effect': get})
+        self.session.start()
+
+    def teardown(self, n_rows):
+        self.session.stop()
+
+    def time_iter_kern(self, n_rows):
+        for _ in self.datary.iter_kern('dataset', 'repo', 'wdir'):
+            pass
+
+    def peakmem_iter_kern(self, n_rows):
+        for _ in self.datary.iter_kern('dataset', 'repo', 'wdir'):
+            pass
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk import time benchmarks, run in a new interpreter
+"""
+
+
+class ImportDatary(object):
+    """
+    Cold start benchmarks: importing the sdk and building a client
+    """
+
+    def timeraw_import_datary(self):
+        return "import datary"
+
+    def timeraw_import_client(self):
+        return "from datary import Datary"
+
+    def timeraw_make_client(self):
+        # no sign-in until the first request
+        return """
+        from datary import Datary
+        Datary(username='benchmark', password='benchmark')
+        """
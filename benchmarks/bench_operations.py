@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk modify operation benchmarks
+"""
+import copy
+
+import mock
+import requests
+
+from .common import SIZES, make_datary, make_rows
+
+
+class UpdateArraysElements(object):
+    """
+    DataryModifyOperation.update_arrays_elements benchmarks
+    """
+    params = (SIZES, [True, False])
+    param_names = ['rows', 'is_rowzero_header']
+
+    def setup(self, n_rows, is_rowzero_header):
+        self.datary = make_datary()
+        self.original = make_rows(n_rows, header=is_rowzero_header)
+        self.update = make_rows(n_rows, header=is_rowzero_header)
+
+    def time_update_arrays_elements(self, n_rows, is_rowzero_header):
+        # not header arrays are extended in place
+        self.datary.update_arrays_elements(
+            list(self.original), self.update, is_rowzero_header)
+
+
+class UpdateElements(object):
+    """
+    DataryModifyOperation.update_elements benchmarks
+    """
+    params = (SIZES, ['list', 'dict'])
+    param_names = ['rows', 'kern']
+
+    def setup(self, n_rows, kern):
+        self.datary = make_datary()
+        rows = make_rows(n_rows)
+
+        if kern == 'list':
+            self.stored_element = {
+                '__kern': rows,
+                '__meta': {'axisHeaders': {'*': rows[0]}}}
+            self.update_element = {'data': {'kern': make_rows(n_rows)}}
+        else:
+            self.stored_element = {
+                '__kern': {'a': rows},
+                '__meta': {'axisHeaders': {'a': rows[0]}}}
+            self.update_element = {
+                'data': {'kern': {'a': make_rows(n_rows)}}}
+
+    def time_update_elements(self, n_rows, kern):
+        # update_elements updates the stored element in place
+        stored_kern = self.stored_element['__kern']
+        stored_element = {
+            '__kern': (
+                list(stored_kern) if isinstance(stored_kern, list) else
+                {k: list(v) for k, v in stored_kern.items()}),
+            '__meta': copy.deepcopy(self.stored_element['__meta'])}
+
+        self.datary.update_elements(stored_element, self.update_element)
+
+
+class ReloadMeta(object):
+    """
+    DataryModifyOperation.reload_meta benchmarks
+    """
+    params = (SIZES, [True, False])
+    param_names = ['rows', 'is_rowzero_header']
+
+    def setup(self, n_rows, is_rowzero_header):
+        self.datary = make_datary()
+        self.kern = {'a': make_rows(n_rows, header=is_rowzero_header)}
+        self.meta = {'title': 'benchmark'}
+
+    def time_reload_meta(self, n_rows, is_rowzero_header):
+        self.datary.reload_meta(
+            self.kern, self.meta, path_key='a',
+            is_rowzero_header=is_rowzero_header)
+
+
+class CalculateRowzeroheaderConfidence(object):
+    """
+    DataryModifyOperation.calculate_rowzeroheader_confidence benchmarks
+
+    Its cost grows with the square of the header columns, so it is scaled
+    from 1k to 10k columns.
+    """
+    params = SIZES[:2]
+    param_names = ['columns']
+
+    def setup(self, n_columns):
+        self.datary = make_datary()
+        self.axisheaders = ['header_{}'.format(x) for x in range(n_columns)]
+        self.row_zero = list(reversed(self.axisheaders))
+
+    def time_calculate_rowzeroheader_confidence(self, n_columns):
+        self.datary.calculate_rowzeroheader_confidence(
+            self.axisheaders, self.row_zero)
+
+
+class AddFile(object):
+    """
+    DataryAddOperation.add_file benchmarks, uploading a dataset
+    """
+    params = SIZES[:3]
+    param_names = ['rows']
+
+    def setup(self, n_rows):
+        self.datary = make_datary()
+        self.element = {
+            'path': 'path', 'basename': 'dataset',
+            'data': {'kern': make_rows(n_rows), 'meta': {}}}
+
+        def post(url, data=None, **kwargs):
+            # sent as requests does, by blocks.
+            while data.read(16384):
+                pass
+            response = requests.models.Response()
+            response.status_code = 200
+            return response
+
+        self.session = mock.patch.object(
+            self.datary, 'session', **{'post.side_effect': post})
+        self.session.start()
+
+    def teardown(self, n_rows):
+        self.session.stop()
+
+    def time_add_file(self, n_rows):
+        self.datary.add_file('wdir', self.element)
+
+    def peakmem_add_file(self, n_rows):
+        self.datary.add_file('wdir', self.element)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk workdirs benchmarks
+"""
+from .common import SIZES, make_datary, make_wdir_changes
+
+
+class FormatWdirChanges(object):
+    """
+    DataryWorkdirs.format_wdir_changes benchmarks
+    """
+    params = SIZES
+    param_names = ['paths']
+
+    def setup(self, n_paths):
+        self.datary = make_datary()
+        self.changes = make_wdir_changes(n_paths)
+
+    def time_format_wdir_changes(self, n_paths):
+        self.datary.format_wdir_changes(self.changes.values())
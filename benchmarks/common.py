@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk benchmarks synthetic inputs
+"""
+from datary import Datary
+
+# rows or paths of the synthetic inputs
+SIZES = [1000, 10000, 100000, 1000000]
+
+
+def make_datary():
+    """
+    Returns:
+        (Datary) offline client, signed in with a fake token.
+    """
+    return Datary(token='benchmark-token')
+
+
+def make_commit(n_paths, sha1_suffix='', dirs=100):
+    """
+    Returns:
+        (list) commit of n_paths [path, basename, data, sha1] rows.
+    """
+    return [
+        ['path/{}'.format(x % dirs), 'dataset_{}'.format(x), None,
+         'sha1_{}{}'.format(x, sha1_suffix if x % 3 else '')]
+        for x in range(n_paths)]
+
+
+def make_difference(n_paths):
+    """
+    Returns:
+        (dict) compare_commits like difference with n_paths elements.
+    """
+    elements = [
+        {'path': 'path/{}'.format(x % 100), 'basename': 'dataset_{}'.format(x),
+         'data': None, 'sha1': 'sha1_{}'.format(x)} for x in range(n_paths)]
+
+    return {
+        'add': elements[:n_paths // 3],
+        'update': elements[n_paths // 3:2 * n_paths // 3],
+        'delete': elements[2 * n_paths // 3:]}
+
+
+def make_rows(n_rows, n_columns=5, header=True):
+    """
+    Returns:
+        (list) n_rows tabular kern, with a header row if header.
+    """
+    rows = [
+        ['row_{}_{}'.format(x, y) for y in range(n_columns)]
+        for x in range(n_rows)]
+
+    if header:
+        rows.insert(0, ['header_{}'.format(y) for y in range(n_columns)])
+
+    return rows
+
+
+def make_wdir_changes(n_paths, dirs=100):
+    """
+    Returns:
+        (dict) workdir changes with n_paths elements.
+    """
+    elements = [
+        {'dirname': 'path/{}'.format(x % dirs),
+         'basename': 'dataset_{}'.format(x),
+         'inode': 'inode_{}'.format(x)} for x in range(n_paths)]
+
+    return {
+        'addedElements': elements[:n_paths // 2],
+        'modifiedElements': elements[n_paths // 2:],
+        'removedElements': [],
+        'renamedElements': []}
@@ -1,84 +1,51 @@
 # -*- coding: utf-8 -*-
 """
 Main datary sdk module
-"""
-import structlog
-
-from .categories import DataryCategories
-from .operations import (
-    DataryAddOperation,
-    DataryModifyOperation,
-    DataryRenameOperation,
-    DataryRemoveOperation,
-    DataryCleanOperation,
-    DataryOperationLimits,
-)
-
-from .commits import DataryCommits
-from .datasets import (
-    DataryDatasets)
 
-from .members import DataryMembers
-from .operations import (
-    DataryOperations)
+The sdk classes are imported on their first use (`from datary import
+Datary`), so importing the package doesn't import the sdk modules and their
+dependencies.
+"""
+import importlib
 
 from . import version
+from .lazy import get_logger
 
-logger = structlog.getLogger(__name__)
-URL_BASE = "http://api.datary.io/"
-
+logger = get_logger(__name__)
 
-class Datary(DataryCategories, DataryCommits, DataryMembers):
-    """
-    Datary main api class.
-    Inherits from the rest of Datary modules its api functionality :
-    - DataryAuth
-    - DataryCategories
-    - DataryCommits
-    - DataryDatasets
-    - DataryWorkdirs
-    - DataryMembers
-    - DataryAddOperation
-    - DataryRepos
-    - DataryModifyOperation
-    - DataryRemoveOperation
-    """
-
-    __version__ = version.__version__
-
-    # Datary Entity Meta Field Allowed
-    ALLOWED_DATARY_META_FIELDS = [
-        "axisHeaders",
-        "caption",
-        "citation",
-        "description",
-        "dimension",
-        "downloadUrl",
-        "includesAxisHeaders",
-        "lastUpdateAt",
-        "period",
-        "propOrder",
-        "rootAleas",
-        "size",
-        "sha1",
-        "sourceUrl",
-        "summary",
-        "title",
-        "traverseOnly",
-        "bigdata",
-        "dimension"]
-
-
-class DatarySizeLimitException(Exception):
-    """
-    Datary exception for size limit exceed
-    """
-
-    def __init__(self, msg='', src_path='', size=-1):
-        super(DatarySizeLimitException, self).__init__(self, msg)
-        self.msg = msg
-        self.src_path = src_path
-        self.size = size
+URL_BASE = "http://api.datary.io/"
 
-    def __str__(self):
-        return "{};{};{}".format(self.msg, self.src_path, self.size)
+# sdk classes by the module defining them, imported on first access.
+_LAZY_ATTRIBUTES = {
+    'Datary': '.datary',
+    'DatarySizeLimitException': '.datary',
+    'AsyncDatary': '.aio',
+    'DataryCategories': '.categories',
+    'DataryCommits': '.commits',
+    'DataryDatasets': '.datasets',
+    'DataryMembers': '.members',
+    'DataryOperations': '.operations',
+    'DataryAddOperation': '.operations',
+    'DataryModifyOperation': '.operations',
+    'DataryRenameOperation': '.operations',
+    'DataryRemoveOperation': '.operations',
+    'DataryCleanOperation': '.operations',
+    'DataryOperationLimits': '.operations',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES) + ['URL_BASE', 'logger', 'version']
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
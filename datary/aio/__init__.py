@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Asyncio Module
+"""
+from .aio import AsyncDatary
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Asyncio File
+"""
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncDatary(object):
+    """
+    Datary asyncio api class.
+
+    Exposes awaitable versions of the Datary api methods. Every call goes
+    through the same Datary client (and so through the same pooled transport,
+    error semantics and structlog fields), running on a bounded executor so
+    one event loop can keep up to `max_workers` requests in flight.
+    """
+
+    _DEFAULT_MAX_WORKERS = 100
+
+    def __init__(self, datary=None, **kwargs):
+        """
+        AsyncDatary Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        datary            Datary          client to wrap (default: a new
+                                          Datary built with kwargs)
+        max_workers       int             max requests in flight
+                                          (default 100)
+        ================  =============   ====================================
+        """
+        self.max_workers = int(
+            kwargs.pop('max_workers', self._DEFAULT_MAX_WORKERS))
+
+        if datary is None:
+            from datary import Datary
+
+            # size the pool to keep a connection per in-flight request
+            kwargs.setdefault('pool_maxsize', self.max_workers)
+            datary = Datary(**kwargs)
+
+        self.datary = datary
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='datary')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Wait for in-flight calls and close the wrapped client session.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True))
+        self.datary.close()
+
+    async def run(self, method, *args, **kwargs):
+        """
+        Await any Datary client method.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        method            str             Datary method name
+        ================  =============   ====================================
+
+        Returns:
+            what the Datary method returns.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(getattr(self.datary, method), *args, **kwargs))
+
+    async def get_describerepo(self, *args, **kwargs):
+        """
+        Awaitable Datary.get_describerepo
+        """
+        return await self.run('get_describerepo', *args, **kwargs)
+
+    async def get_wdir_filetree(self, wdir_uuid):
+        """
+        Awaitable Datary.get_wdir_filetree
+        """
+        return await self.run('get_wdir_filetree', wdir_uuid)
+
+    async def get_original(self, dataset_uuid, *args, **kwargs):
+        """
+        Awaitable Datary.get_original
+        """
+        return await self.run('get_original', dataset_uuid, *args, **kwargs)
+
+    async def add_file(self, wdir_uuid, element):
+        """
+        Awaitable Datary.add_file
+        """
+        return await self.run('add_file', wdir_uuid, element)
+
+    async def modify_file(self, wdir_uuid, element, *args, **kwargs):
+        """
+        Awaitable Datary.modify_file
+        """
+        return await self.run(
+            'modify_file', wdir_uuid, element, *args, **kwargs)
+
+    async def delete_file(self, wdir_uuid, element):
+        """
+        Awaitable Datary.delete_file
+        """
+        return await self.run('delete_file', wdir_uuid, element)
+
+    async def commit(self, repo_uuid, commit_message):
+        """
+        Awaitable Datary.commit
+        """
+        return await self.run('commit', repo_uuid, commit_message)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Asyncio test file
+"""
+import asyncio
+import threading
+
+import mock
+
+from datary.aio import AsyncDatary
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class AsyncDataryTestCase(DataryTestCase):
+    """
+    AsyncDatary Test case
+    """
+
+    def test_init(self):
+        """
+        Test AsyncDatary init
+        """
+        async_datary = AsyncDatary(datary=self.datary, max_workers=4)
+        self.assertIs(async_datary.datary, self.datary)
+        self.assertEqual(async_datary.max_workers, 4)
+
+        async_datary2 = AsyncDatary(token=self.test_token, max_workers=8)
+        self.assertEqual(async_datary2.datary.token, self.test_token)
+        adapter = async_datary2.datary.session.get_adapter(self.url)
+        self.assertEqual(adapter._pool_maxsize, 8)
+
+        asyncio.run(async_datary2.close())
+
+    @mock.patch('datary.Datary.request')
+    def test_methods(self, mock_request):
+        """
+        Test AsyncDatary awaitable api methods
+        """
+        wdir_uuid = self.json_repo.get('workdir', {}).get('uuid')
+
+        async def run():
+            async with AsyncDatary(datary=self.datary) as async_datary:
+                mock_request.return_value = MockRequestResponse(
+                    "", json=self.json_repo)
+                repo = await async_datary.get_describerepo(self.repo_uuid)
+                self.assertEqual(repo, self.json_repo)
+
+                mock_request.return_value = MockRequestResponse(
+                    "", json=self.workdir)
+                filetree = await async_datary.get_wdir_filetree(wdir_uuid)
+                self.assertEqual(filetree, self.workdir)
+
+                mock_request.return_value = MockRequestResponse(
+                    "", json=self.original)
+                original = await async_datary.get_original(
+                    self.dataset_uuid, self.repo_uuid)
+                self.assertEqual(original, self.original)
+
+                mock_request.return_value = MockRequestResponse("")
+                await async_datary.add_file(wdir_uuid, self.element)
+                await async_datary.modify_file(wdir_uuid, self.element)
+                await async_datary.delete_file(wdir_uuid, self.element)
+                await async_datary.commit(self.repo_uuid, 'test commit msg')
+
+                # same error semantics than the sync client
+                mock_request.return_value = None
+                filetree2 = await async_datary.get_wdir_filetree(wdir_uuid)
+                self.assertEqual(filetree2, {})
+
+        asyncio.run(run())
+        self.assertEqual(mock_request.call_count, 8)
+
+    @mock.patch('datary.Datary.request')
+    def test_concurrency(self, mock_request):
+        """
+        Test AsyncDatary keeps many requests in flight
+        """
+        n_requests = 10
+        barrier = threading.Barrier(n_requests, timeout=5)
+
+        def request(*args, **kwargs):
+            # blocks until every request is in flight at the same time.
+            barrier.wait()
+            return MockRequestResponse("", json=self.workdir)
+
+        mock_request.side_effect = request
+
+        async def run():
+            async_datary = AsyncDatary(
+                datary=self.datary, max_workers=n_requests)
+            async with async_datary:
+                return await asyncio.gather(*[
+                    async_datary.get_wdir_filetree(self.wdir_uuid)
+                    for _ in range(n_requests)])
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [self.workdir] * n_requests)
+        self.assertEqual(mock_request.call_count, n_requests)
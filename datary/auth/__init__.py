@@ -3,3 +3,4 @@
 Datary sdk Auth Module
 """
 from .auth import DataryAuth
+from .store import DataryTokenStore
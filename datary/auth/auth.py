@@ -2,11 +2,13 @@
 """
 Datary sdk Auth File
 """
+import threading
+
 from urllib.parse import urljoin
 from datary.requests import DataryRequests
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryAuth(DataryRequests):
@@ -17,15 +19,33 @@ class DataryAuth(DataryRequests):
     def __init__(self, **kwargs):
         """
         DataryAuth Init method
+
+        The client doesn't sign in until its first authenticated request
+        (or an explicit `sign_in()`), so it's built without network work.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        username          str             Datary username
+        password          str             Datary password
+        token             str             Datary session token
+        commit_limit      int             max changes of a commit
+        token_store       TokenStore      store of the session tokens shared
+                                          between processes, read before
+                                          signing in (default None, see
+                                          DataryTokenStore)
+        ================  =============   ====================================
         """
         super(DataryAuth, self).__init__(**kwargs)
         self._username = kwargs.get('username', '')
         self._password = kwargs.get('password', '')
         self._token = kwargs.get('token', '')
         self._commit_limit = int(kwargs.get('commit_limit', 30))
+        self.token_store = kwargs.get('token_store')
 
-        # call to sign-in
-        self.sign_in()
+        # concurrent first requests share a single sign-in.
+        self._sign_in_lock = threading.RLock()
+        self.attach_token_header()
 
     @property
     def username(self):
@@ -86,27 +106,132 @@ class DataryAuth(DataryRequests):
 
     def attach_token_header(self):
         """
-        Class method to attach datary token to requests headers.
+        Class method to attach datary token to requests headers, replacing
+        the base headers (they're read only, shared between threads).
         """
+        headers = dict(self.headers)
         if self.token:
-            self.headers['Authorization'] = 'Bearer {}'.format(self.token)
+            headers['Authorization'] = 'Bearer {}'.format(self.token)
+        else:
+            headers.pop('Authorization', None)
+        self.headers = headers
+
+    @property
+    def token_store_key(self):
+        """
+        Returns:
+            (str) key of the client token in its token store.
+        """
+        return self.token_store.key(self.URL_BASE, self.username)
 
     def sign_in(self, member_uuid='me'):
         """
-        Sign-in and assert has a token in requests headers.
+        Sign-in and assert has a token in requests headers. With a token
+        store, its token is used and it's only signed in without one.
         """
-        if self.token:
-            self.attach_token_header()
+        with self._sign_in_lock:
+            if self.token:
+                self.attach_token_header()
 
-        elif self.username and self.password:
-            self.token = self.get_user_token(member_uuid='me')
-            self.attach_token_header()
+            elif self.username and self.password:
+                if self.token_store is None:
+                    self.token = self.get_user_token(member_uuid='me')
 
-        else:
+                # other processes wait for a single sign-in.
+                else:
+                    with self.token_store.lock():
+                        token = self.token_store.get(self.token_store_key)
+                        if not token:
+                            token = self.get_user_token(member_uuid='me')
+                            if token:
+                                self.token_store.set(
+                                    self.token_store_key, token)
+                        self.token = token
+
+                self.attach_token_header()
+
+            else:
+                logger.error(
+                    'Can`t sign-in, useraname or password incorrect',
+                    username=self.username,
+                    password=self.password)
+
+    def refresh_token(self):
+        """
+        Sign-in again, discarding the actual (expired) token from the client
+        and from its token store.
+        """
+        with self._sign_in_lock:
+            expired = self.token
+            self.token = None
+
+            if self.token_store is not None and expired:
+                self.token_store.delete(self.token_store_key, expired)
+
+            self.sign_in()
+
+    def reauthenticate(self, url, http_method, kwargs):
+        """
+        Refresh the token of an unauthorized request, once even if several
+        threads were unauthorized with the same token (see
+        DataryRequests.reauthenticate).
+
+        Returns:
+            (dict) request arguments with the refreshed token, None if the
+            client has no credentials to sign in again.
+        """
+        headers = kwargs.get('headers') or {}
+        authorization = headers.get('Authorization')
+
+        if not authorization:
+            return None
+
+        if not (self.username and self.password):
             logger.error(
-                'Can`t sign-in, useraname or password incorrect',
-                username=self.username,
-                password=self.password)
+                'Unauthorized request, the token is expired or invalid and '
+                'there are no credentials to sign-in again.',
+                url=url, http_method=http_method)
+            return None
+
+        with self._sign_in_lock:
+            # refreshed meanwhile by another thread.
+            if authorization == 'Bearer {}'.format(self.token):
+                self.refresh_token()
+
+            token = self.token
+
+        if not token:
+            return None
+
+        return dict(kwargs, headers=dict(
+            headers, Authorization='Bearer {}'.format(token)))
+
+    def request(self, url, http_method, **kwargs):
+        """
+        Sends an authenticated request to Datary (see
+        DataryRequests.request), signing in first when the client has no
+        token yet. Concurrent first requests wait for a single sign-in.
+
+        ==============   =============   ====================================
+        Parameter        Type            Description
+        ==============   =============   ====================================
+        url              str             destination url
+        http_method      str             http methods of request
+        authenticate     bool            sign in first if needed and send the
+                                         token, refreshing it once if it's
+                                         unauthorized (default True)
+        ==============   =============   ====================================
+        """
+        if not kwargs.pop('authenticate', True):
+            kwargs['reauthenticate'] = False
+
+        elif not self._token and self._username and self._password:
+            with self._sign_in_lock:
+                if not self._token:
+                    self.sign_in()
+
+        # the token is in the base headers merged by DataryRequests.
+        return super(DataryAuth, self).request(url, http_method, **kwargs)
 
     def get_user_token(self, user=None, password=None, member_uuid='me'):
         """
@@ -145,7 +270,12 @@ class DataryAuth(DataryRequests):
             self.URL_BASE, "/members/{}/sessions".format(member_uuid))
 
         response = self.request(
-            url, 'POST', **{'headers': self.headers, 'data': payload})
+            url, 'POST', authenticate=False, **{'data': payload})
+
+        if not response:
+            logger.error(
+                'Fail to sign-in to Datary', username=payload['username'])
+            return ''
 
         user_token = str(response.headers.get("x-set-token", ''))
 
@@ -166,9 +296,11 @@ class DataryAuth(DataryRequests):
             self.URL_BASE, "/members/{}/sessions".format(member_uuid))
 
         # Make sign_out request.
-        response = self.request(url, 'DELETE', **{'headers': self.headers})
+        response = self.request(url, 'DELETE')
 
         if response:
+            if self.token_store is not None and self.token:
+                self.token_store.delete(self.token_store_key, self.token)
             self.token = None
             logger.info('Sign Out Succesfull!')
 
@@ -201,10 +333,11 @@ class DataryAuth(DataryRequests):
             }
 
             url = urljoin(self.URL_BASE, "/connection/signIn")
-            self.headers = {"Content-Type": "application/x-www-form-urlencoded"}
+            headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
             response = self.request(
-                url, 'POST', **{'headers': self.headers, 'data': payload})
+                url, 'POST', authenticate=False,
+                **{'headers': headers, 'data': payload})
 
             # Devuelve el token del usuario.
             user_token = str(response.headers.get("x-set-token", ''))
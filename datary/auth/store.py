@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Auth Token Store File
+"""
+import os
+import json
+import hashlib
+import tempfile
+import threading
+
+from contextlib import contextmanager
+
+from datary.lazy import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+def default_token_store_path():
+    """
+    Returns:
+        (str) tokens file in the user cache dir
+        ($XDG_CACHE_HOME or ~/.cache).
+    """
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'datary', 'tokens.json')
+
+
+class DataryTokenStore(object):
+    """
+    Session tokens stored in a locked file, shared between every process on
+    the host using the same path, so a fleet of short lived workers signs in
+    once instead of once per process.
+
+    Tokens are kept by api url and username (never the password), in a file
+    only readable by its owner.
+    """
+
+    def __init__(self, path=None):
+        """
+        DataryTokenStore Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        path              str             tokens file path (default
+                                          default_token_store_path())
+        ================  =============   ====================================
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                'DataryTokenStore needs fcntl file locks (POSIX).')
+
+        super(DataryTokenStore, self).__init__()
+        self.path = path or default_token_store_path()
+        self._lock = threading.RLock()
+        self._fd = None
+
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def key(url_base, username):
+        """
+        Returns:
+            (str) store key of an user of an api.
+        """
+        return hashlib.sha1('{} {}'.format(
+            url_base, username).encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def lock(self):
+        """
+        Context manager holding the store lock, between the threads of the
+        process and between the processes. Processes signing in inside it
+        wait for the first one and read its token.
+        """
+        with self._lock:
+            # reentrant: a second flock of the process would wait for itself.
+            if self._fd is not None:
+                yield self
+                return
+
+            self._fd = os.open(
+                self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+                yield self
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as tokens_file:
+                tokens = json.load(tokens_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def _dump(self, tokens):
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)))
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(tokens, tmp_file)
+            os.replace(tmp_path, self.path)
+        except (IOError, OSError) as ex:
+            logger.warning(
+                'Fail writing token store - {}'.format(ex), path=self.path)
+
+    def get(self, key):
+        """
+        Returns:
+            (str) stored token of the key, None if there's not.
+        """
+        with self.lock():
+            return self._load().get(key)
+
+    def set(self, key, token):
+        """
+        Store the token of the key.
+        """
+        with self.lock():
+            tokens = self._load()
+            tokens[key] = token
+            self._dump(tokens)
+
+    def delete(self, key, token=None):
+        """
+        Remove the token of the key, only if it's still the given token.
+        """
+        with self.lock():
+            tokens = self._load()
+            if key in tokens and token in (None, tokens[key]):
+                del tokens[key]
+                self._dump(tokens)
@@ -5,6 +5,7 @@ Datary python sdk Auth test file
 import mock
 
 from datary import Datary
+from datary.requests import DataryMetrics
 from datary.test.test_datary import DataryTestCase
 from datary.test.mock_requests import MockRequestResponse
 
@@ -25,7 +26,7 @@ class DataryAuthTestCase(DataryTestCase):
         self.test_password2 = 'ssap'
         self.test_commit_limit2 = 12
 
-    @mock.patch('datary.requests.requests.requests.post')
+    @mock.patch('datary.requests.requests.requests.Session.post')
     def test_properties(self, mock_request):
         """
         Test Datary auth getter/setter properties
@@ -36,6 +37,8 @@ class DataryAuthTestCase(DataryTestCase):
         self.datary = Datary(**{
             'username': self.test_username,
             'password': self.test_password})
+        self.assertEqual(mock_request.call_count, 0)
+        self.datary.sign_in()
         self.assertEqual(mock_request.call_count, 1)
 
         self.assertEqual(self.datary.username, self.test_username)
@@ -76,8 +79,11 @@ class DataryAuthTestCase(DataryTestCase):
         self.datary.sign_out()
         self.assertEqual(mock_delete_member_session.call_count, 1)
 
-    @mock.patch('datary.requests.requests.requests.delete')
+    @mock.patch('datary.requests.requests.requests.Session.delete')
     def test_delete_member_session(self, mock_request):
+        # the signed out client is shared by the other test cases.
+        self.addCleanup(setattr, self.datary, 'token', self.datary.token)
+
         # Fail sign out
         mock_request.return_value = MockRequestResponse(
             "Err", status_code=500)
@@ -101,7 +107,7 @@ class DataryAuthTestCase(DataryTestCase):
 #                           DEPRECATED
 # ##########################################################################
 
-    @mock.patch('datary.requests.requests.requests.post')
+    @mock.patch('datary.requests.requests.requests.Session.post')
     def test_get_connection_sign_in(self, mock_request):
         """
         Test datary auth get_user_token
@@ -119,10 +125,12 @@ class DataryAuthTestCase(DataryTestCase):
         self.assertEqual(self.datary.token, self.test_token)
         self.assertEqual(mock_request.call_count, 0)
 
-        # Assert get token in __init__
+        # Assert get token on sign-in, not in __init__
         mock_request.return_value = MockRequestResponse(
             "", headers={'x-set-token': self.test_token})
         self.datary = Datary(**{'username': 'pepe', 'password': 'pass'})
+        self.assertEqual(mock_request.call_count, 0)
+        self.datary.sign_in()
         self.assertEqual(mock_request.call_count, 1)
 
         # Assert get token by the method without args.
@@ -143,7 +151,7 @@ class DataryAuthTestCase(DataryTestCase):
 
         self.assertEqual(mock_request.call_count, 4)
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_connection_sign_out(self, mock_request):
         """
         Test datary auth sign_out
@@ -173,3 +181,86 @@ class DataryAuthTestCase(DataryTestCase):
         self.datary.get_connection_sign_out()
         self.assertEqual(self.datary.token, None)
         self.assertEqual(mock_request.call_count, 1)
+
+    @mock.patch('time.sleep')
+    @mock.patch('datary.requests.requests.requests.Session.post')
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_reauthenticate(self, mock_get, mock_post, mock_sleep):
+        """
+        Test unauthorized requests refresh the token once and are replayed
+        """
+        datary = Datary(username='pepe', password='pass', token='expired')
+        mock_post.return_value = MockRequestResponse(
+            "", headers={'x-set-token': self.test_token})
+        unauthorized = MockRequestResponse("", status_code=401)
+        mock_get.side_effect = [
+            unauthorized,
+            MockRequestResponse("", json=[{'name': 'r'}])]
+
+        self.assertEqual(
+            datary.get_describerepo(repo_name='r'), {'name': 'r'})
+        self.assertTrue(unauthorized.closed)
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(datary.token, self.test_token)
+        self.assertEqual(
+            mock_get.call_args[1]['headers']['Authorization'],
+            'Bearer {}'.format(self.test_token))
+        self.assertEqual(mock_sleep.call_count, 0)
+
+        # refreshed once, a refreshed token still unauthorized fails
+        mock_get.side_effect = None
+        mock_get.return_value = MockRequestResponse("", status_code=401)
+        mock_get.reset_mock()
+        mock_post.reset_mock()
+        self.assertEqual(datary.get_describerepo(repo_name='r'), {})
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_post.call_count, 1)
+
+        # without credentials it's not refreshed
+        datary = Datary(token='expired')
+        mock_get.reset_mock()
+        self.assertEqual(datary.get_describerepo(repo_name='r'), {})
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(datary.token, 'expired')
+
+    @mock.patch('time.sleep')
+    @mock.patch('datary.requests.requests.requests.Session.post')
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_reauthenticate_retry(self, mock_get, mock_post, mock_sleep):
+        """
+        Test the replay with a refreshed token doesn't take a try
+        """
+        metrics = DataryMetrics()
+        datary = Datary(
+            username='pepe', password='pass', token='expired',
+            tries_limit=2, observers=[metrics])
+        mock_post.return_value = MockRequestResponse(
+            "", headers={'x-set-token': self.test_token})
+        mock_get.side_effect = [
+            MockRequestResponse("", status_code=401),
+            MockRequestResponse("", status_code=503),
+            MockRequestResponse("", json=[{'name': 'r'}])]
+
+        with datary.request_budget() as budget:
+            self.assertEqual(
+                datary.get_describerepo(repo_name='r'), {'name': 'r'})
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+        # the replay is a request of its own, not a retry
+        self.assertEqual(budget.by_endpoint['GET me/repos'], 2)
+        stats = metrics.dump()['endpoints']['GET me/repos']
+        self.assertEqual(stats['tries'], 3)
+        self.assertEqual(stats['retries'], 1)
+
+    @mock.patch('datary.requests.requests.requests.Session.post')
+    def test_reauthenticate_sign_in(self, mock_post):
+        """
+        Test unauthorized sign-ins are not refreshed
+        """
+        datary = Datary(username='pepe', password='bad', token='expired')
+        mock_post.return_value = MockRequestResponse("", status_code=401)
+
+        self.assertEqual(datary.get_user_token(), '')
+        self.assertEqual(mock_post.call_count, 1)
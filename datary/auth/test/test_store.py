@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Auth Token Store test file
+"""
+import os
+import stat
+import tempfile
+import threading
+import unittest
+
+import mock
+
+from datary import Datary
+from datary.auth import DataryTokenStore
+from datary.auth.store import default_token_store_path
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryTokenStoreTestCase(unittest.TestCase):
+    """
+    DataryTokenStore Test case
+    """
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'datary', 'tokens.json')
+
+    def test_default_path(self):
+        """
+        Test tokens file in the user cache dir
+        """
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': '/tmp/cache'}):
+            self.assertEqual(
+                default_token_store_path(), '/tmp/cache/datary/tokens.json')
+
+    def test_store(self):
+        """
+        Test tokens shared between stores of the same path
+        """
+        store1 = DataryTokenStore(self.path)
+        store2 = DataryTokenStore(self.path)
+        key = DataryTokenStore.key('http://api.datary.io/', 'pepe')
+
+        self.assertNotEqual(
+            key, DataryTokenStore.key('http://api.datary.io/', 'manolo'))
+        self.assertIsNone(store1.get(key))
+
+        store1.set(key, '123')
+        self.assertEqual(store2.get(key), '123')
+        self.assertEqual(
+            stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        # only deleted if it's still the given token
+        store2.delete(key, '456')
+        self.assertEqual(store1.get(key), '123')
+        store2.delete(key, '123')
+        self.assertIsNone(store1.get(key))
+
+        # corrupted files are empty stores
+        with open(self.path, 'w') as tokens_file:
+            tokens_file.write('[1, ')
+        self.assertIsNone(store1.get(key))
+
+        # reentrant lock
+        with store1.lock():
+            store1.set(key, '789')
+        self.assertEqual(store2.get(key), '789')
+
+    @mock.patch('datary.requests.requests.requests.Session.post')
+    def test_sign_in(self, mock_post):
+        """
+        Test clients sharing a token store sign in once
+        """
+        mock_post.return_value = MockRequestResponse(
+            "", headers={'x-set-token': '123'})
+
+        clients = [
+            Datary(username='pepe', password='pass',
+                   token_store=DataryTokenStore(self.path))
+            for _ in range(4)]
+
+        threads = [
+            threading.Thread(target=client.sign_in) for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual([c.token for c in clients], ['123'] * 4)
+
+        # signed out tokens are removed from the store
+        with mock.patch('datary.requests.requests.requests.Session.delete',
+                        return_value=MockRequestResponse("OK")):
+            clients[0].sign_out()
+
+        self.assertIsNone(clients[1].token_store.get(
+            clients[1].token_store_key))
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Cache Module
+"""
+from .cache import DataryContentCache
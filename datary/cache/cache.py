@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Cache File
+"""
+import os
+import hashlib
+import tempfile
+import threading
+
+from collections import OrderedDict
+
+from datary.requests.codec import get_codec
+
+from datary.lazy import get_logger
+
+logger = get_logger(__name__)
+
+
+class DataryContentCache(object):
+    """
+    Content addressed cache.
+
+    Stores contents addressed by a sha1 (commit filetrees, committed
+    datasets..). The same sha1 always addresses the same content, so
+    entries never need to be invalidated. Keeps an in-memory LRU bounded
+    by bytes and, if a path is given, a disk copy shared between processes.
+
+    Both keep the encoded contents, decoded on every read: each call gets
+    its own object and can mutate it without changing the cached content.
+    """
+
+    _DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes=_DEFAULT_MAX_BYTES, path=None, codec=None):
+        """
+        DataryContentCache Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        max_bytes         int             max bytes kept in memory
+        path              str             disk cache directory
+                                          (default None, memory only)
+        codec             str or Codec    json codec of the contents
+                                          (default orjson when installed)
+        ================  =============   ====================================
+        """
+        super(DataryContentCache, self).__init__()
+        self.codec = get_codec(codec)
+        self.max_bytes = max_bytes
+        self.path = path
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (
+            self.path is not None and os.path.exists(self.filepath(key)))
+
+    def filepath(self, key):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        key               str             cache key
+        ================  =============   ====================================
+
+        Returns:
+            (str) disk path of the key.
+        """
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, digest[:2], digest + '.json')
+
+    def get(self, key, default=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        key               str             cache key
+        default                           returned value if not cached
+        ================  =============   ====================================
+
+        Returns:
+            cached content of the key or default.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+
+        if data is not None:
+            return self.codec.loads(data)
+
+        if self.path is None:
+            return default
+
+        try:
+            with open(self.filepath(key), 'rb') as cache_file:
+                data = cache_file.read()
+        except (IOError, OSError):
+            return default
+
+        try:
+            value = self.codec.loads(data)
+        except ValueError as ex:
+            logger.warning(
+                'Fail reading content cache - {}'.format(ex), key=key)
+            return default
+
+        self._remember(key, data)
+        return value
+
+    def put(self, key, value):
+        """
+        Cache the content of a key.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        key               str             cache key
+        value                             json serializable content
+        ================  =============   ====================================
+        """
+        data = self.codec.dumpb(value)
+        self._remember(key, data)
+
+        if self.path is None:
+            return
+
+        filepath = self.filepath(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath))
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, filepath)
+        except (IOError, OSError) as ex:
+            logger.warning(
+                'Fail writing content cache - {}'.format(ex), key=key)
+
+            # don't leave the partial content behind.
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def clear(self):
+        """
+        Remove every content kept in memory.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remember(self, key, data):
+        """
+        Keep an encoded content in the memory LRU, evicting the least
+        recently used ones above max_bytes.
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+
+            self._entries[key] = data
+            self.size += len(data)
+
+            while self.size > self.max_bytes:
+                self.size -= len(self._entries.popitem(last=False)[1])
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Cache test file
+"""
+import os
+import tempfile
+
+import mock
+
+from datary import Datary
+from datary.cache import DataryContentCache
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryContentCacheTestCase(DataryTestCase):
+    """
+    DataryContentCache Test case
+    """
+
+    def test_memory(self):
+        """
+        Test DataryContentCache in-memory lru bounded by bytes
+        """
+        cache = DataryContentCache(max_bytes=20, codec='json')
+
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', {}), {})
+
+        cache.put('a', [1, 2, 3])  # 9 bytes
+        cache.put('b', [4, 5, 6])  # 9 bytes
+        self.assertEqual(cache.size, 18)
+        self.assertEqual(cache.get('a'), [1, 2, 3])
+
+        # evicts the least recently used
+        cache.put('c', [7, 8])
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('a'), [1, 2, 3])
+        self.assertEqual(cache.get('c'), [7, 8])
+        self.assertEqual(cache.size, 15)
+
+        # contents bigger than the cache aren't kept in memory
+        cache.put('d', list(range(100)))
+        self.assertEqual(cache.get('d'), None)
+        self.assertNotIn('d', cache)
+
+        # every read gets its own object
+        cache.get('a').append(4)
+        self.assertEqual(cache.get('a'), [1, 2, 3])
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_disk(self):
+        """
+        Test DataryContentCache disk storage
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = DataryContentCache(max_bytes=10, path=tmp_dir)
+            cache.put('commits/1/filetree', self.workdir)
+            self.assertIn('commits/1/filetree', cache)
+
+            # other cache (or process) sharing the disk path
+            cache2 = DataryContentCache(path=tmp_dir)
+            self.assertEqual(cache2.get('commits/1/filetree'), self.workdir)
+            self.assertEqual(len(cache2), 1)
+            self.assertEqual(cache2.get('commits/2/filetree'), None)
+
+            # corrupted files are cache misses
+            with open(cache2.filepath('commits/1/filetree'), 'w') as f:
+                f.write('{')
+            cache3 = DataryContentCache(path=tmp_dir)
+            self.assertEqual(cache3.get('commits/1/filetree'), None)
+
+            # failed writes don't leave their temp file
+            filepath = cache3.filepath('commits/3/filetree')
+            with mock.patch('os.replace', side_effect=OSError('full')):
+                cache3.put('commits/3/filetree', self.workdir)
+            self.assertEqual(os.listdir(os.path.dirname(filepath)), [])
+
+    @mock.patch('datary.Datary.request')
+    def test_get_commit_filetree(self, mock_request):
+        """
+        Test get_commit_filetree looks first in the content cache
+        """
+        datary = Datary(
+            token=self.test_token, content_cache=DataryContentCache())
+
+        mock_request.return_value = MockRequestResponse("", json=self.workdir)
+        for _ in range(3):
+            filetree = datary.get_commit_filetree(
+                self.repo_uuid, self.commit_sha1)
+            self.assertEqual(filetree, self.workdir)
+        self.assertEqual(mock_request.call_count, 1)
+
+        # failed requests aren't cached
+        mock_request.return_value = None
+        self.assertEqual(datary.get_commit_filetree(self.repo_uuid, 'x'), {})
+        self.assertEqual(datary.get_commit_filetree(self.repo_uuid, 'x'), {})
+        self.assertEqual(mock_request.call_count, 3)
+
+    @mock.patch('datary.Datary.request')
+    def test_get_kern(self, mock_request):
+        """
+        Test get_kern looks first in the content cache given the sha1
+        """
+        datary = Datary(
+            token=self.test_token, content_cache=DataryContentCache())
+        kern = self.element.get('data', {}).get('kern')
+
+        mock_request.return_value = MockRequestResponse("", json=kern)
+        for _ in range(3):
+            result = datary.get_kern(
+                self.dataset_uuid, self.repo_uuid, sha1='aa_sha1')
+            self.assertEqual(result, kern)
+        self.assertEqual(mock_request.call_count, 1)
+
+        # editing a returned kern doesn't change the cached one
+        result.clear()
+        self.assertEqual(
+            datary.get_kern(
+                self.dataset_uuid, self.repo_uuid, sha1='aa_sha1'), kern)
+
+        # without sha1 isn't cached
+        datary.get_kern(self.dataset_uuid, self.repo_uuid)
+        self.assertEqual(mock_request.call_count, 2)
+
+    @mock.patch('datary.Datary.request')
+    def test_recollect_last_commit(self, mock_request):
+        """
+        Test recollect_last_commit with a warm content cache
+        """
+        datary = Datary(
+            token=self.test_token, content_cache=DataryContentCache())
+        repo = dict(self.json_repo)
+
+        def request(url, http_method, **kwargs):
+            if 'filetree' in url:
+                return MockRequestResponse("", json=self.workdir)
+            return MockRequestResponse(
+                "", json=self.element.get('data', {}).get('meta'))
+
+        mock_request.side_effect = request
+
+        result = datary.recollect_last_commit(repo)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(mock_request.call_count, 4)
+
+        result2 = datary.recollect_last_commit(repo)
+        self.assertEqual(result2, result)
+        self.assertEqual(mock_request.call_count, 4)
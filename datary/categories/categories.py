@@ -5,10 +5,10 @@ Datary sdk Categories File
 from urllib.parse import urljoin
 from datary.auth import DataryAuth
 
-import structlog
+from datary.lazy import get_logger
 
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryCategories(DataryAuth):
@@ -36,8 +36,6 @@ class DataryCategories(DataryAuth):
         "other"
     ]
 
-    headers = {}
-
     def get_categories(self):
         """
         Returns:
@@ -45,5 +43,7 @@ class DataryCategories(DataryAuth):
         """
         url = urljoin(self.URL_BASE, "search/categories")
 
-        response = self.request(url, 'GET', **{'headers': self.headers})
-        return response.json() if response else self.DATARY_CATEGORIES
+        response = self.request(url, 'GET')
+        return (
+            self.response_json(response) if response
+            else self.DATARY_CATEGORIES)
@@ -13,7 +13,7 @@ class DataryCategoriesTestCase(DataryTestCase):
     DataryCategories Test case
     """
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_categories(self, mock_request):
         """
         Test get_categories
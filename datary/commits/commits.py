@@ -5,14 +5,16 @@ Datary sdk Commits File
 """
 import os
 
+from collections import OrderedDict
 from datetime import datetime
 from urllib.parse import urljoin
 from datary.operations import DataryOperations
-from scrapbag import nested_dict_to_list
 
-import structlog
+from datary.lazy import get_logger, lazy_module
 
-logger = structlog.getLogger(__name__)
+concurrent_futures = lazy_module('concurrent.futures')
+scrapbag = lazy_module('scrapbag')
+logger = get_logger(__name__)
 
 
 class DataryCommits(DataryOperations):
@@ -21,6 +23,9 @@ class DataryCommits(DataryOperations):
     """
     COMMIT_ACTIONS = {'add': '+', 'update': 'm', 'delete': '-'}
 
+    _DEFAULT_RECOLLECT_WORKERS = 10
+    _DEFAULT_APPLY_WORKERS = 10
+
     def commit(self, repo_uuid, commit_message):
         """
         Commits changes.
@@ -41,14 +46,20 @@ class DataryCommits(DataryOperations):
         response = self.request(
             url,
             'POST',
-            **{'data': {'message': commit_message}, 'headers': self.headers})
+            **{'data': {'message': commit_message}})
         if response:
             logger.info("Changes commited", commit_message=commit_message)
 
-    def recollect_last_commit(self, repo=None):
+    def recollect_last_commit(self, repo=None, max_workers=None):
         """
-        Parameter:
-            (dict) repo
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        repo              dict            repo description
+        max_workers       int             max metadata requests in flight
+                                          (default 10, 1 to do them one by
+                                          one)
+        ================  =============   ====================================
 
         Raises:
             - No repo found with given uuid.
@@ -63,6 +74,9 @@ class DataryCommits(DataryOperations):
         if repo is None:
             repo = {}
 
+        if max_workers is None:
+            max_workers = self._DEFAULT_RECOLLECT_WORKERS
+
         ftree = {}
         last_commit = []
         filetree_matrix = []
@@ -73,13 +87,23 @@ class DataryCommits(DataryOperations):
             ftree = self.get_last_commit_filetree(repo)
 
             # List of Path | basename | Sha1
-            filetree_matrix = nested_dict_to_list("", ftree)
+            filetree_matrix = scrapbag.nested_dict_to_list("", ftree)
+
+            def get_metadata(row):
+                return self.get_commit_metadata(repo, row[2])
 
             # Take metadata to retrieve sha-1 and compare with
-            for path, basename, dataset_uuid in filetree_matrix:
-                metadata = self.get_metadata(
-                    repo_uuid=repo.get('uuid'),
-                    dataset_uuid=dataset_uuid)
+            if max_workers > 1 and len(filetree_matrix) > 1:
+                with concurrent_futures.ThreadPoolExecutor(
+                        max_workers=min(max_workers, len(filetree_matrix))
+                        ) as executor:
+                    metadatas = executor.map(get_metadata, filetree_matrix)
+            else:
+                metadatas = map(get_metadata, filetree_matrix)
+
+            # keeps the filetree order whatever the order of the responses
+            for (path, basename, _), metadata in zip(
+                    filetree_matrix, metadatas):
 
                 # append format path | basename | data (not required) | sha1
                 last_commit.append(
@@ -93,6 +117,39 @@ class DataryCommits(DataryOperations):
 
         return last_commit
 
+    def get_commit_metadata(self, repo, dataset_uuid):
+        """
+        Retrieve the metadata of a dataset in the last commit of the repo,
+        cached by commit sha1 since a commit never changes.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        repo              dict            repo description
+        dataset_uuid      str             dataset uuid
+        ================  =============   ====================================
+
+        Returns:
+            (dict) dataset metadata.
+        """
+        commit_sha1 = repo.get('apex', {}).get('commit')
+        cache_key = 'commits/{}/datasets/{}/meta'.format(
+            commit_sha1, dataset_uuid)
+
+        if self.content_cache is not None and commit_sha1:
+            metadata = self.content_cache.get(cache_key)
+            if metadata is not None:
+                return metadata
+
+        metadata = self.get_metadata(
+            repo_uuid=repo.get('uuid'),
+            dataset_uuid=dataset_uuid)
+
+        if self.content_cache is not None and commit_sha1 and metadata:
+            self.content_cache.put(cache_key, metadata)
+
+        return metadata
+
     def get_last_commit_filetree(self, repo=None):
         """
         Datary get_last_commit_filetree
@@ -247,28 +304,23 @@ class DataryCommits(DataryOperations):
             last_index = self.make_index(last_commit)
             actual_index = self.make_index(actual_commit)
 
-            last_index_keys = list(last_index.keys())
-
             for key, value in actual_index.items():
-
-                # Update
-                if key in last_index_keys:
-                    last_index_sha1 = last_index.get(key, {}).get('sha1')
-                    # sha1 values don't match
-                    if value.get('sha1') != last_index_sha1:
-                        difference['update'].append(value)
-
-                    # Pop last inspected key
-                    last_index_keys.remove(key)
+                last_value = last_index.get(key)
 
                 # Add
-                else:
+                if last_value is None:
                     difference['add'].append(value)
 
+                # Update if sha1 values don't match
+                elif value.get('sha1') != last_value.get('sha1'):
+                    difference['update'].append(value)
+
             # Remove elements when stay in last_commit and not in actual if
             # stric is enabled else omit this
-            difference['delete'] = [last_index.get(
-                key, {}) for key in last_index_keys if strict]
+            if strict:
+                difference['delete'] = [
+                    value for key, value in last_index.items()
+                    if key not in actual_index]
 
         except Exception as ex:
             logger.error(
@@ -277,8 +329,90 @@ class DataryCommits(DataryOperations):
 
         return difference
 
-    def operation_commit(
-            self, wdir_uuid, last_commit, actual_commit, **kwargs):
+    @classmethod
+    def _make_commit_element(cls, row):
+        """
+        Transforms a commit row, list [path, basename, data, sha1] or dict,
+        into its index key and element.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        row               list or dict    commit row
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) path + basename key, element dict.
+        """
+        if isinstance(row, dict):
+            path, basename = row.get('path'), row.get('basename')
+            data, sha1 = row.get('data'), row.get('sha1')
+        else:
+            path, basename, data, sha1 = row
+
+        return os.path.join(path, basename), {
+            'path': path, 'basename': basename, 'data': data, 'sha1': sha1}
+
+    def compare_sorted_commits(self, last_commit, actual_commit, strict=True):
+        """
+        Streaming compare_commits. Consumes two commits sorted by
+        path + basename and yields their differences as it goes, without
+        building an index of them.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        last_commit       iterable        [path|basename|data|sha1] sorted
+        actual_commit     iterable        [path|basename|data|sha1] sorted
+        strict            Boolean         Default is True
+        ================  =============   ====================================
+
+        Returns:
+            (generator) of (action, element) with action add, update or
+            delete.
+
+        Raises:
+            ValueError if a commit isn't sorted by path + basename.
+        """
+        def sorted_elements(commit):
+            previous_key = None
+            for row in commit:
+                key, element = self._make_commit_element(row)
+                if previous_key is not None and key <= previous_key:
+                    raise ValueError(
+                        'Commit not sorted by path + basename at {}'.format(
+                            key))
+                previous_key = key
+                yield key, element
+
+        last_elements = sorted_elements(last_commit)
+        actual_elements = sorted_elements(actual_commit)
+        last_key, last_value = next(last_elements, (None, None))
+        actual_key, actual_value = next(actual_elements, (None, None))
+
+        while last_key is not None or actual_key is not None:
+
+            # Remove elements in last_commit and not in actual if strict
+            if actual_key is None or (
+                    last_key is not None and last_key < actual_key):
+                if strict:
+                    yield 'delete', last_value
+                last_key, last_value = next(last_elements, (None, None))
+
+            # Add
+            elif last_key is None or actual_key < last_key:
+                yield 'add', actual_value
+                actual_key, actual_value = next(actual_elements, (None, None))
+
+            # Update if sha1 values don't match
+            else:
+                if actual_value.get('sha1') != last_value.get('sha1'):
+                    yield 'update', actual_value
+                last_key, last_value = next(last_elements, (None, None))
+                actual_key, actual_value = next(actual_elements, (None, None))
+
+    def operation_commit(self, wdir_uuid, last_commit, actual_commit,
+                         max_workers=None, **kwargs):
         """
         Given the last commit and actual commit,
         takes hot elements to ADD, UPDATE or DELETE.
@@ -289,8 +423,12 @@ class DataryCommits(DataryOperations):
         wdir_uuid         str             working directory uuid
         last_commit       list            [path|basename|sha1]
         actual_commit     list            [path|basename|sha1]
+        max_workers       int             max operations in flight
         ================  =============   =======================
 
+        Returns:
+            (dict) applied elements by action and failed operations, see
+            apply_operations.
         """
         # compares commits and retrieves hot elements -> new, modified, deleted
         hot_elements = self.compare_commits(
@@ -303,17 +441,138 @@ class DataryCommits(DataryOperations):
                 len(hot_elements.get('update')),
                 len(hot_elements.get('delete'))))
 
-        for element in hot_elements.get('add', []):
-            super(DataryCommits, self).add_file(
-                wdir_uuid, element)
+        operations = [
+            (action, element)
+            for action in ['add', 'update', 'delete']
+            for element in hot_elements.get(action, [])]
+
+        return self.apply_operations(
+            wdir_uuid, operations, max_workers=max_workers, **kwargs)
+
+    def apply_operations(self, wdir_uuid, operations, max_workers=None,
+                         **kwargs):
+        """
+        Applies operations to a workdir concurrently.
+
+        Operations on different paths are sent concurrently, up to
+        max_workers at a time. Operations on the same path + basename are
+        sent one after another in the given order, and skipped once one of
+        them fails. A failed operation doesn't stop the rest.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        wdir_uuid         str             working directory uuid
+        operations        list            (action, element) with action add,
+                                          update or delete
+        max_workers       int             max operations in flight
+                                          (default 10, 1 to apply them one
+                                          by one)
+        ================  =============   ====================================
+
+        Returns:
+            (dict) applied elements by action and failed operations, in the
+            operations order:
+            {'add': [], 'update': [], 'delete': [],
+             'failed': [{'action', 'element', 'error'}]}
+        """
+        if max_workers is None:
+            max_workers = self._DEFAULT_APPLY_WORKERS
+
+        # error of every operation by index, None if applied.
+        errors = [None] * len(operations)
+
+        # group operations by path keeping their order.
+        path_operations = OrderedDict()
+        for index, (action, element) in enumerate(operations):
+            key = os.path.join(
+                element.get('path') or '', element.get('basename') or '')
+            path_operations.setdefault(key, []).append(
+                (index, action, element))
+
+        def apply_path(path_group):
+            failed = False
+
+            for index, action, element in path_group:
+                if failed:
+                    errors[index] = (
+                        'Previous operation on the same path failed')
+                    continue
+
+                try:
+                    if not self.apply_operation(
+                            wdir_uuid, action, element, **kwargs):
+                        errors[index] = 'Fail to {} element'.format(action)
+                except Exception as ex:
+                    errors[index] = str(ex)
+
+                failed = errors[index] is not None
+
+        if max_workers > 1 and len(path_operations) > 1:
+            with concurrent_futures.ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(path_operations))
+                    ) as executor:
+                futures = [
+                    executor.submit(apply_path, x)
+                    for x in path_operations.values()]
+                for future in futures:
+                    future.result()
+        else:
+            for path_group in path_operations.values():
+                apply_path(path_group)
+
+        # results in the operations order, whatever the threads order.
+        result = {'add': [], 'update': [], 'delete': [], 'failed': []}
+        for (action, element), error in zip(operations, errors):
+            if error is None:
+                result[action].append(element)
+            else:
+                result['failed'].append({
+                    'action': action,
+                    'element': element,
+                    'error': error})
+
+        if result['failed']:
+            logger.error(
+                "Fail applying operations to workdir",
+                wdir_uuid=wdir_uuid,
+                failed=len(result['failed']),
+                errors=[
+                    (x['action'], x['element'].get('path'),
+                     x['element'].get('basename'), x['error'])
+                    for x in result['failed']])
+
+        return result
+
+    def apply_operation(self, wdir_uuid, action, element, **kwargs):
+        """
+        Applies an operation to a workdir.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        wdir_uuid         str             working directory uuid
+        action            str             add, update or delete
+        element           dict            element to apply the action
+        ================  =============   ====================================
+
+        Returns:
+            (bool) if the operation has been applied.
 
-        for element in hot_elements.get('update', []):
-            super(DataryCommits, self).modify_file(
+        Raises:
+            ValueError with unknown actions.
+        """
+        if action == 'add':
+            return super(DataryCommits, self).add_file(wdir_uuid, element)
+
+        elif action == 'update':
+            return super(DataryCommits, self).modify_file(
                 wdir_uuid, element, **kwargs)
 
-        for element in hot_elements.get('delete', []):
-            super(DataryCommits, self).delete_file(
-                wdir_uuid, element)
+        elif action == 'delete':
+            return super(DataryCommits, self).delete_file(wdir_uuid, element)
+
+        raise ValueError('Unknown operation action {}'.format(action))
 
     def commit_diff_tostring(self, difference):
         """
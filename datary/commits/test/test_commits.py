@@ -2,6 +2,10 @@
 """
 Datary python sdk Commits test file
 """
+import os
+import threading
+import time
+
 from unittest.mock import patch
 from datary.test.test_datary import DataryTestCase
 from datary.test.mock_requests import MockRequestResponse
@@ -14,7 +18,7 @@ class DataryCommitsTestCase(DataryTestCase):
     Test DataryCommits Test Case
     """
 
-    @mock.patch('datary.requests.requests.requests.post')
+    @mock.patch('datary.requests.requests.requests.Session.post')
     def test_commit(self, mock_request):
         """
         Test Datary commit
@@ -81,6 +85,50 @@ class DataryCommitsTestCase(DataryTestCase):
         self.assertEqual(result5, [])
         self.assertEqual(result6, [])
 
+    @mock.patch('datary.commits.DataryCommits.get_commit_metadata')
+    @mock.patch('datary.commits.DataryCommits.get_last_commit_filetree')
+    def test_recollect_last_commit_concurrency(self, mock_filetree,
+                                               mock_metadata):
+        """
+        Test datary commits recollect_last_commit concurrent metadata fetch
+        """
+        n_datasets = 20
+        mock_filetree.return_value = {
+            'dataset_{:02d}'.format(x): 'uuid_{:02d}'.format(x)
+            for x in range(n_datasets)}
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def get_commit_metadata(repo, dataset_uuid):
+            with lock:
+                in_flight.append(dataset_uuid)
+                max_in_flight.append(len(in_flight))
+            # first datasets finish last
+            time.sleep(0.001 * (n_datasets - int(dataset_uuid[-2:])))
+            with lock:
+                in_flight.remove(dataset_uuid)
+            return {'sha1': dataset_uuid + '_sha1'}
+
+        mock_metadata.side_effect = get_commit_metadata
+        expected = [
+            ('', 'dataset_{:02d}'.format(x), None,
+             'uuid_{:02d}_sha1'.format(x)) for x in range(n_datasets)]
+
+        # same order than the filetree
+        result = self.datary.recollect_last_commit(
+            {'uuid': self.repo_uuid}, max_workers=5)
+        self.assertEqual(result, expected)
+        self.assertLessEqual(max(max_in_flight), 5)
+        self.assertGreater(max(max_in_flight), 1)
+
+        # one by one
+        del max_in_flight[:]
+        result2 = self.datary.recollect_last_commit(
+            {'uuid': self.repo_uuid}, max_workers=1)
+        self.assertEqual(result2, result)
+        self.assertEqual(max(max_in_flight), 1)
+
     @mock.patch('datary.commits.DataryCommits._make_index_dict')
     @mock.patch('datary.commits.DataryCommits._make_index_list')
     def test_make_index(self, mock_index_list, mock_index_dict):
@@ -191,6 +239,77 @@ class DataryCommitsTestCase(DataryTestCase):
             self.assertTrue(isinstance(result2, dict))
             self.assertEqual(result2, {'update': [], 'delete': [], 'add': []})
 
+    def test_compare_commits_big(self):
+        """
+        Test Datary compare_commits with many datasets
+        """
+        n_datasets = 20000
+        last_commit = [
+            ['path/{}'.format(x % 100), 'dataset_{}'.format(x), None,
+             'sha1_{}'.format(x)] for x in range(n_datasets)]
+        actual_commit = [
+            ['path/{}'.format(x % 100), 'dataset_{}'.format(x), None,
+             'sha1_{}'.format(x if x % 3 else -x)]
+            for x in range(n_datasets // 2, n_datasets + n_datasets // 2)]
+
+        result = self.datary.compare_commits(last_commit, actual_commit)
+
+        self.assertEqual(
+            [x['basename'] for x in result['add']],
+            ['dataset_{}'.format(x)
+             for x in range(n_datasets, n_datasets + n_datasets // 2)])
+        self.assertEqual(
+            [x['basename'] for x in result['delete']],
+            ['dataset_{}'.format(x) for x in range(n_datasets // 2)])
+        self.assertEqual(
+            [x['basename'] for x in result['update']],
+            ['dataset_{}'.format(x)
+             for x in range(n_datasets // 2, n_datasets) if not x % 3])
+
+        result2 = self.datary.compare_commits(
+            last_commit, actual_commit, strict=False)
+        self.assertEqual(result2['delete'], [])
+
+    def test_compare_sorted_commits(self):
+        """
+        Test Datary compare_sorted_commits
+        """
+        def sort_key(row):
+            return os.path.join(row[0], row[1])
+
+        last_commit = sorted(self.commit_test1, key=sort_key)
+        actual_commit = sorted(self.commit_test2, key=sort_key)
+
+        for strict in [True, False]:
+            expected = self.datary.compare_commits(
+                last_commit, actual_commit, strict=strict)
+
+            result = {'add': [], 'update': [], 'delete': []}
+            for action, element in self.datary.compare_sorted_commits(
+                    iter(last_commit), iter(actual_commit), strict=strict):
+                result[action].append(element)
+
+            self.assertEqual(result, expected)
+
+        # list of dicts commits
+        actual_dicts = [
+            {'path': x[0], 'basename': x[1], 'data': x[2], 'sha1': x[3]}
+            for x in actual_commit]
+        result2 = list(self.datary.compare_sorted_commits(
+            [], actual_dicts))
+        self.assertEqual(
+            [x[0] for x in result2], ['add'] * len(actual_dicts))
+        self.assertEqual([x[1] for x in result2], actual_dicts)
+
+        # empty commits
+        self.assertEqual(
+            list(self.datary.compare_sorted_commits([], [])), [])
+
+        # not sorted commits
+        with self.assertRaises(ValueError):
+            list(self.datary.compare_sorted_commits(
+                [], list(reversed(actual_commit))))
+
     @mock.patch('datary.operations.DataryRemoveOperation.delete_file')
     @mock.patch('datary.operations.DataryAddOperation.add_file')
     @mock.patch('datary.operations.DataryModifyOperation.modify_file')
@@ -222,6 +341,104 @@ class DataryCommitsTestCase(DataryTestCase):
         self.assertEqual(mock_delete.call_count, 0)
         self.assertEqual(mock_modify.call_count, 1)
 
+    @mock.patch('datary.operations.DataryRemoveOperation.delete_file')
+    @mock.patch('datary.operations.DataryAddOperation.add_file')
+    @mock.patch('datary.operations.DataryModifyOperation.modify_file')
+    def test_apply_operations(self, mock_modify, mock_add, mock_delete):
+        """
+        Test datary apply_operations
+        """
+        wdir_uuid = self.json_repo.get('workdir').get('uuid')
+        calls = []
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        def operation(action):
+            def apply(wdir_uuid, element, **kwargs):
+                with lock:
+                    in_flight.append(element)
+                    max_in_flight.append(len(in_flight))
+                time.sleep(0.001)
+                with lock:
+                    in_flight.remove(element)
+                    calls.append((action, element['basename']))
+                if element.get('sha1') == 'fail':
+                    return False
+                if element.get('sha1') == 'raise':
+                    raise Exception('test exception')
+                return True
+            return apply
+
+        mock_add.side_effect = operation('add')
+        mock_modify.side_effect = operation('update')
+        mock_delete.side_effect = operation('delete')
+
+        operations = [
+            ('add', {'path': 'a', 'basename': str(x), 'sha1': str(x)})
+            for x in range(20)]
+        operations += [
+            ('update', {'path': 'a', 'basename': '0', 'sha1': 'fail'}),
+            ('delete', {'path': 'a', 'basename': '0', 'sha1': '0'}),
+            ('update', {'path': 'a', 'basename': '1', 'sha1': 'raise'}),
+            ('delete', {'path': 'a', 'basename': '2', 'sha1': '2'}),
+        ]
+
+        result = self.datary.apply_operations(
+            wdir_uuid, operations, max_workers=4)
+
+        self.assertEqual(len(result['add']), 20)
+        self.assertEqual(result['update'], [])
+        self.assertEqual(len(result['delete']), 1)
+        self.assertEqual(
+            [(x['action'], x['element']['basename'], x['error'])
+             for x in result['failed']],
+            [('update', '0', 'Fail to update element'),
+             ('delete', '0', 'Previous operation on the same path failed'),
+             ('update', '1', 'test exception')])
+
+        # concurrency bounded
+        self.assertLessEqual(max(max_in_flight), 4)
+        self.assertGreater(max(max_in_flight), 1)
+
+        # operations on the same path keep their order
+        for basename in ['0', '1', '2']:
+            self.assertEqual(
+                [x[0] for x in calls if x[1] == basename][0], 'add')
+        self.assertEqual(len(calls), 23)
+
+        with self.assertRaises(ValueError):
+            self.datary.apply_operation(wdir_uuid, 'rename', {})
+
+    @mock.patch('datary.operations.DataryRemoveOperation.delete_file')
+    @mock.patch('datary.operations.DataryAddOperation.add_file')
+    @mock.patch('datary.operations.DataryModifyOperation.modify_file')
+    def test_operation_commit_result(self, mock_modify, mock_add,
+                                     mock_delete):
+        """
+        Test datary operation_commit structured result
+        """
+        mock_add.return_value = True
+        mock_modify.return_value = False
+        mock_delete.return_value = True
+
+        for max_workers in [1, 10]:
+            result = self.datary.operation_commit(
+                wdir_uuid=self.json_repo.get('workdir').get('uuid'),
+                last_commit=self.commit_test1,
+                actual_commit=self.commit_test2,
+                strict=True,
+                max_workers=max_workers)
+
+            self.assertEqual(
+                [x['sha1'] for x in result['add']], ['caa_sha1'])
+            self.assertEqual(
+                [x['sha1'] for x in result['delete']], ['bb_sha1'])
+            self.assertEqual(result['update'], [])
+            self.assertEqual(
+                [x['element']['sha1'] for x in result['failed']],
+                ['dd2_sha1'])
+
     @mock.patch('datary.commits.commits.datetime')
     def test_commit_diff_tostring(self, mock_datetime):
         """
@@ -6,11 +6,12 @@ import os
 
 from urllib.parse import urljoin
 from datary.workdirs import DataryWorkdirs
-from scrapbag import exclude_empty_values, get_element
+from .stream import DataryKernStream
 
-import structlog
+from datary.lazy import get_logger, lazy_module
 
-logger = structlog.getLogger(__name__)
+scrapbag = lazy_module('scrapbag')
+logger = get_logger(__name__)
 
 
 class DataryDatasets(DataryWorkdirs):
@@ -18,24 +19,40 @@ class DataryDatasets(DataryWorkdirs):
     Datary Datasets module
     """
 
-    headers = {}
+    # bytes read at once from the streamed responses.
+    _DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
 
-    def get_kern(self, dataset_uuid, repo_uuid='', wdir_uuid='', scope=''):
+    def get_kern(self, dataset_uuid, repo_uuid='', wdir_uuid='', scope='',
+                 sha1=''):
         """
         ================  =============   ====================================
         Parameter         Type            Description
         ================  =============   ====================================
         repo_uuid         int             repository id
         dataset_uuid      str
+        sha1              str             dataset sha1 (from its meta), the
+                                          kern is cached by it if given
         ================  =============   ====================================
 
         Returns:
             (dict) dataset kern
 
         """
-        return self.get_original(
+        # datasets contents never change for the same sha1.
+        cache_key = 'datasets/{}/kern'.format(sha1)
+        if self.content_cache is not None and sha1:
+            kern = self.content_cache.get(cache_key)
+            if kern is not None:
+                return kern
+
+        kern = self.get_original(
             dataset_uuid, repo_uuid, wdir_uuid, 'kern', scope)
 
+        if self.content_cache is not None and sha1 and kern:
+            self.content_cache.put(cache_key, kern)
+
+        return kern
+
     def get_metadata(self, dataset_uuid, repo_uuid='', wdir_uuid='', scope=''):
         """
         ================  =============   ====================================
@@ -66,7 +83,7 @@ class DataryDatasets(DataryWorkdirs):
         Returns:
             (dict) dataset original data
         """
-        response = None
+        original = {}
 
         if (repo_uuid or wdir_uuid) and dataset_uuid:
             url = urljoin(
@@ -75,22 +92,25 @@ class DataryDatasets(DataryWorkdirs):
 
             # look in changes or namespace only if not wdir_uuid
             if scope != 'repo':
-                params = exclude_empty_values(
+                params = scrapbag.exclude_empty_values(
                     {'namespace': repo_uuid, 'scope': wdir_uuid})
                 response = self.request(
-                    url, 'GET', **{'headers': self.headers, 'params': params})
+                    url, 'GET', **{'params': params})
+                original = self.response_json(response) if response else {}
 
-            if not response or not response.json():
+            if not original:
                 logger.info(
                     "Dataset original not retrieved from wdir scope",
                     namespace=repo_uuid,
                     scope=wdir_uuid,
                     dataset_uuid=dataset_uuid)
 
-                params = exclude_empty_values(
+                params = scrapbag.exclude_empty_values(
                     {'namespace': repo_uuid, 'scope': repo_uuid})
                 response = self.request(
-                    url, 'GET', **{'headers': self.headers, 'params': params})
+                    url, 'GET', **{'params': params})
+                original = self.response_json(response) if response else {}
+
                 if not response:
                     logger.error(
                         "Not original retrieved from repo scope",
@@ -98,7 +118,65 @@ class DataryDatasets(DataryWorkdirs):
                         scope=repo_uuid,
                         dataset_uuid=dataset_uuid)
 
-        return response.json() if response else {}
+        return original
+
+    def iter_kern(self, dataset_uuid, repo_uuid='', wdir_uuid='', scope='',
+                  batch=DataryKernStream.DEFAULT_BATCH,
+                  chunk_size=_DEFAULT_STREAM_CHUNK_SIZE):
+        """
+        Streams the kern of a dataset, decoding it incrementally as it
+        arrives, so the memory doesn't grow with the dataset size. Meant for
+        the datasets flagged `bigdata` in their meta.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        dataset_uuid      str             dataset uuid
+        repo_uuid         str             repository uuid
+        wdir_uuid         str             workingdir uuid (looks in its
+                                          changes if scope isn't 'repo')
+        batch             int             max rows of the dict kerns pairs
+        chunk_size        int             bytes read from the socket at once
+        ================  =============   ====================================
+
+        Returns:
+            (generator) kern rows for list kerns, (keypath, rows) for dict
+            kerns. Nothing if the dataset isn't found.
+        """
+        if not (dataset_uuid and (repo_uuid or wdir_uuid)):
+            return
+
+        url = urljoin(self.URL_BASE, "datasets/{}/kern".format(dataset_uuid))
+        scopes = [wdir_uuid] if wdir_uuid and scope != 'repo' else []
+        scopes.append(repo_uuid)
+
+        for scope_uuid in scopes:
+            params = scrapbag.exclude_empty_values(
+                {'namespace': repo_uuid, 'scope': scope_uuid})
+            response = self.request(url, 'GET', **{
+                'params': params, 'stream': True})
+
+            if not response:
+                continue
+
+            try:
+                stream = DataryKernStream(
+                    response.iter_content(chunk_size=chunk_size),
+                    batch=batch)
+                found = False
+                for item in stream:
+                    found = True
+                    yield item
+            finally:
+                response.close()
+
+            # an empty kern in the wdir scope, look in the repo scope.
+            if found:
+                return
+
+        logger.info(
+            "Dataset kern not streamed", namespace=repo_uuid,
+            scope=wdir_uuid, dataset_uuid=dataset_uuid)
 
     def get_dataset_uuid(self, wdir_uuid, path='', basename=''):
         """
@@ -126,8 +204,9 @@ class DataryDatasets(DataryWorkdirs):
                 self.get_wdir_changes(wdir_uuid).values())
 
             # retrieve dataset uuid
-            dataset_uuid = (get_element(wdir_changes_filetree, filepath)) or (
-                get_element(wdir_filetree, filepath)) or None
+            dataset_uuid = (
+                scrapbag.get_element(wdir_changes_filetree, filepath) or
+                scrapbag.get_element(wdir_filetree, filepath) or None)
 
         return dataset_uuid
 
@@ -150,11 +229,11 @@ class DataryDatasets(DataryWorkdirs):
         if pathname:
             url = urljoin(self.URL_BASE,
                           "/workdirs/{}/workdir".format(wdir_uuid))
-            params = exclude_empty_values({'pathname': pathname})
+            params = scrapbag.exclude_empty_values({'pathname': pathname})
             response = self.request(
-                url, 'GET', **{'headers': self.headers, 'params': params})
+                url, 'GET', **{'params': params})
             if not response:
                 logger.error(
                     "Not response retrieved.")
 
-        return response.json() if response else {}
+        return self.response_json(response) if response else {}
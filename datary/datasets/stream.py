@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Datasets Stream File
+
+Incremental decoding of dataset kerns, reading the json document chunk by
+chunk so the memory stays bounded by the size of a row, not of the dataset.
+"""
+import codecs
+import json
+
+
+class DataryKernStream(object):
+    """
+    Incremental decoder of a dataset kern json document.
+
+    Walks the document structure and decodes only one row at a time. It
+    accepts an original (`{"__kern": .., "__meta": ..}`) or a bare kern:
+
+    - list kerns yield their rows.
+    - dict kerns yield `(keypath, rows)` pairs, rows being up to `batch`
+      consecutive rows of the array at the keypath (`a/b`).
+
+    Rows may be any json value, scalars are decoded once delimited.
+    """
+
+    DEFAULT_BATCH = 1000
+    _WHITESPACE = ' \t\n\r'
+    _DELIMITERS = _WHITESPACE + ',:]}'
+
+    # consumed buffer prefix dropped once it's longer than this.
+    _COMPACT_SIZE = 64 * 1024
+
+    def __init__(self, chunks, batch=DEFAULT_BATCH, encoding='utf-8'):
+        """
+        DataryKernStream Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        chunks            iterable        bytes (or str) chunks of the json
+                                          document
+        batch             int             max rows of the dict kerns pairs
+        encoding          str             encoding of the bytes chunks
+        ================  =============   ====================================
+        """
+        super(DataryKernStream, self).__init__()
+        self.chunks = iter(chunks)
+        self.batch = batch
+        self.meta = None
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self._skip()
+        char = self._peek()
+
+        if char == '{':
+            self._pos += 1
+            key = self._next_key()
+
+            # original document, only the kern is streamed.
+            if key in ('__kern', '__meta'):
+                while key is not None:
+                    if key == '__kern':
+                        for item in self._kern():
+                            yield item
+                    elif key == '__meta':
+                        self.meta = self._value()
+                    else:
+                        self._value()
+                    key = self._next_key()
+
+            # bare dict kern, already into it.
+            else:
+                for item in self._dict_kern(key, []):
+                    yield item
+
+        else:
+            for item in self._kern():
+                yield item
+
+    def _fill(self):
+        """
+        Read the next chunk into the buffer.
+
+        Returns:
+            (bool) if more data has been read.
+        """
+        if self._eof:
+            return False
+
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._text_decoder.decode(chunk)
+            if chunk:
+                if self._pos > self._COMPACT_SIZE:
+                    self._buffer = self._buffer[self._pos:]
+                    self._pos = 0
+                self._buffer += chunk
+                return True
+
+        self._eof = True
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        return False
+
+    def _skip(self):
+        """
+        Skip whitespaces, reading more data if needed.
+        """
+        while True:
+            while (self._pos < len(self._buffer) and
+                   self._buffer[self._pos] in self._WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def _peek(self):
+        """
+        Returns:
+            (str) next not whitespace char, '' at the end.
+        """
+        self._skip()
+        return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, chars):
+        """
+        Returns:
+            (str) next not whitespace char, one of chars.
+
+        Raises:
+            ValueError: unexpected char.
+        """
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(
+                'Expecting one of {!r} at {}, found {!r}'.format(
+                    chars, self._pos, char))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """
+        Returns:
+            next json value, reading data until it's complete.
+        """
+        self._skip()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer, self._pos)
+            except ValueError:
+                if self._fill():
+                    continue
+                raise
+
+            # numbers could go on in the next chunk (`1` of `1.5`).
+            if ((end == len(self._buffer) or
+                    self._buffer[end] not in self._DELIMITERS) and
+                    self._fill()):
+                continue
+
+            self._pos = end
+            return value
+
+    def _next_key(self):
+        """
+        Returns:
+            (str) next key of the current object, None at its end.
+        """
+        char = self._expect('",}')
+
+        if char == '}':
+            return None
+        if char == ',':
+            self._expect('"')
+
+        self._pos -= 1
+        key = self._value()
+        self._expect(':')
+        return key
+
+    def _kern(self):
+        """
+        Yields the rows of a kern (list) or its (keypath, rows) (dict).
+        """
+        char = self._expect('[{')
+
+        if char == '[':
+            for row in self._rows():
+                yield row
+        else:
+            for item in self._dict_kern(self._next_key(), []):
+                yield item
+
+    def _rows(self):
+        """
+        Yields the items of the current array.
+        """
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _dict_kern(self, key, keypath):
+        """
+        Yields (keypath, rows) of the current object, from its key.
+        """
+        while key is not None:
+            path = keypath + [key]
+            char = self._peek()
+
+            if char == '{':
+                self._pos += 1
+                for item in self._dict_kern(self._next_key(), path):
+                    yield item
+
+            elif char == '[':
+                self._pos += 1
+                rows = []
+                for row in self._rows():
+                    rows.append(row)
+                    if len(rows) >= self.batch:
+                        yield '/'.join(path), rows
+                        rows = []
+                if rows:
+                    yield '/'.join(path), rows
+
+            else:
+                yield '/'.join(path), [self._value()]
+
+            key = self._next_key()
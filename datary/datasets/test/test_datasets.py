@@ -13,7 +13,7 @@ class DataryDatasetsTestCase(DataryTestCase):
     DataryDatasets Test case
     """
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_kern(self, mock_request):
         """
         Test Datary datasets get_kern
@@ -31,7 +31,7 @@ class DataryDatasetsTestCase(DataryTestCase):
         self.assertTrue(isinstance(kern2, dict))
         self.assertEqual(kern2, {})
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_metadata(self, mock_request):
         """
         Test Datary datasets get_metadata
@@ -48,7 +48,7 @@ class DataryDatasetsTestCase(DataryTestCase):
         self.assertTrue(isinstance(metadata2, dict))
         self.assertEqual(metadata2, {})
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_original(self, mock_request):
         """
         Test Datary datasets get_original
@@ -168,7 +168,7 @@ class DataryDatasetsTestCase(DataryTestCase):
         self.assertEqual(mock_get_wdir_filetree.call_count, 1)
         self.assertEqual(mock_get_wdir_changes.call_count, 1)
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_commited_dataset_uuid(self, mock_request):
         """
         Test Datary get_commited_dataset_uuid
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Datasets Stream test file
+"""
+import io
+import json
+import mock
+import requests
+
+from datary.datasets.stream import DataryKernStream
+from datary.test.test_datary import DataryTestCase
+
+
+def chunked(document, size):
+    """
+    Returns:
+        (list) bytes chunks of size of the json document.
+    """
+    data = json.dumps(document).encode('utf-8')
+    return [data[x:x + size] for x in range(0, len(data), size)]
+
+
+def make_stream_response(document, status_code=200):
+    """
+    Returns:
+        (requests.Response) not read response with the json document.
+    """
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(json.dumps(document).encode('utf-8'))
+    return response
+
+
+class DataryKernStreamTestCase(DataryTestCase):
+    """
+    DataryKernStream Test case
+    """
+
+    list_kern = [
+        [x, 'ñandú €', 1.5e3, -0.25, None, True, {'a': [1, 2]}]
+        for x in range(20)] + [12345, 'row', 1e-05]
+
+    dict_kern = {
+        'a': {'b': [[1, 2], [3, 4], [5, 6]], 'c': [[7]]},
+        'd': [],
+        'e': [[8]]}
+
+    def test_list_kern(self):
+        """
+        Test DataryKernStream list kerns, whatever the chunks size
+        """
+        original = {'__meta': {'bigdata': True}, '__kern': self.list_kern}
+
+        for size in [1, 2, 3, 7, 100, 100000]:
+            stream = DataryKernStream(chunked(original, size))
+            self.assertEqual(list(stream), self.list_kern)
+            self.assertEqual(stream.meta, {'bigdata': True})
+
+            # bare kern
+            self.assertEqual(
+                list(DataryKernStream(chunked(self.list_kern, size))),
+                self.list_kern)
+
+        self.assertEqual(list(DataryKernStream([b'[]'])), [])
+        self.assertEqual(list(DataryKernStream([b' [ 1 ,2 ] '])), [1, 2])
+
+    def test_dict_kern(self):
+        """
+        Test DataryKernStream dict kerns (keypath, rows) batches
+        """
+        expected = [
+            ('a/b', [[1, 2], [3, 4]]), ('a/b', [[5, 6]]), ('a/c', [[7]]),
+            ('e', [[8]])]
+
+        for size in [1, 5, 100000]:
+            self.assertEqual(list(DataryKernStream(
+                chunked({'__kern': self.dict_kern}, size), batch=2)),
+                expected)
+            self.assertEqual(list(DataryKernStream(
+                chunked(self.dict_kern, size), batch=2)), expected)
+
+        self.assertEqual(list(DataryKernStream([b'{}'])), [])
+
+    def test_invalid(self):
+        """
+        Test DataryKernStream invalid documents
+        """
+        for document in [b'[1, 2', b'[1 2]', b'{"__kern": [1}', b'']:
+            self.assertRaises(
+                ValueError, list, DataryKernStream([document]))
+
+    def test_iter_kern(self):
+        """
+        Test Datary datasets iter_kern
+        """
+        with mock.patch.object(self.datary, 'session') as mock_session:
+            mock_session.get.return_value = make_stream_response(
+                self.list_kern)
+
+            rows = list(self.datary.iter_kern(
+                self.dataset_uuid, self.repo_uuid, chunk_size=16))
+            self.assertEqual(rows, self.list_kern)
+            self.assertEqual(
+                mock_session.get.call_args[1]['stream'], True)
+
+            # empty in the wdir scope, looks in the repo scope
+            mock_session.get.reset_mock()
+            mock_session.get.side_effect = [
+                make_stream_response([]),
+                make_stream_response(self.list_kern)]
+
+            rows = list(self.datary.iter_kern(
+                self.dataset_uuid, self.repo_uuid, self.wdir_uuid))
+            self.assertEqual(rows, self.list_kern)
+            self.assertEqual(mock_session.get.call_count, 2)
+
+            # not found
+            mock_session.get.reset_mock()
+            mock_session.get.side_effect = None
+            mock_session.get.return_value = make_stream_response(
+                {}, status_code=404)
+            self.assertEqual(list(self.datary.iter_kern(
+                self.dataset_uuid, self.repo_uuid)), [])
+
+            self.assertEqual(
+                list(self.datary.iter_kern(self.dataset_uuid)), [])
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Lazy Imports File
+
+The sdk dependencies (requests, scrapbag, structlog) are imported on their
+first use, not when the sdk is imported, so short lived processes calling a
+single endpoint don't pay for what they don't use.
+"""
+import importlib
+
+
+class DataryLazyModule(object):
+    """
+    Module imported on the first access to one of its attributes:
+
+        >>> scrapbag = DataryLazyModule('scrapbag')
+        >>> scrapbag.flatten({'a': {'b': 1}})  # imports scrapbag
+
+    The import is done through the import system, so it's thread safe.
+    """
+
+    __slots__ = ('name', '_module')
+
+    def __init__(self, name):
+        """
+        DataryLazyModule Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        name              str             absolute name of the module
+        ================  =============   ====================================
+        """
+        self.name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self.name)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        return '<DataryLazyModule {}{}>'.format(
+            self.name, '' if self._module is None else ' (imported)')
+
+
+class DataryLazyLogger(object):
+    """
+    structlog logger of a module, importing structlog on its first use.
+    """
+
+    __slots__ = ('name', '_logger')
+
+    def __init__(self, name):
+        self.name = name
+        self._logger = None
+
+    def __getattr__(self, attribute):
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = importlib.import_module(
+                'structlog').getLogger(self.name)
+        return getattr(logger, attribute)
+
+
+def lazy_module(name):
+    """
+    Returns:
+        (DataryLazyModule) module imported on its first use.
+    """
+    return DataryLazyModule(name)
+
+
+def get_logger(name):
+    """
+    Returns:
+        (DataryLazyLogger) structlog logger, imported on its first use.
+    """
+    return DataryLazyLogger(name)
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test Module
+"""
+from .server import DataryStandInServer, DataryStandInState
+from .harness import DataryLoadTest, DataryLoadRecorder
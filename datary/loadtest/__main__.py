@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test entry point
+"""
+import sys
+
+from .harness import main
+
+sys.exit(main())
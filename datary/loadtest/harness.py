@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test Harness File
+
+Runs N concurrent Datary clients through the sdk workflows against the
+stand-in server (or a configured url base) and reports requests per second,
+latency percentiles per endpoint, retries and bytes sent and received:
+
+    $ python -m datary.loadtest --clients 8 --iterations 10 \\
+        --latency 0.02 --output loadtest.json
+
+It exits with status 1 when the workflows fail more than
+`--max-failure-rate`, to gate a CI job.
+"""
+import sys
+import json
+import math
+import time
+import uuid
+import hashlib
+import argparse
+import datetime
+import threading
+
+from collections import Counter, defaultdict
+
+from datary import Datary
+from datary.requests import DataryRequestObserver
+from datary.requests.compression import encodings
+from datary.lazy import get_logger
+from .server import DataryStandInServer
+
+logger = get_logger(__name__)
+
+
+def percentile(values, percent):
+    """
+    Nearest rank percentile.
+
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    values            list            sorted values
+    percent           float           percentile (0-100)
+    ================  =============   ====================================
+
+    Returns:
+        (float) percentile of the values, None if there are no values.
+    """
+    if not values:
+        return None
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+def summarize(values):
+    """
+    Returns:
+        (dict) count, mean, max and p50/p95/p99 of the values.
+    """
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'mean': sum(values) / len(values) if values else None,
+        'max': values[-1] if values else None,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+    }
+
+
+def failed_workflows(report, max_failure_rate=0.0):
+    """
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    report            dict            load test report
+    max_failure_rate  float           max failed runs ratio of a workflow
+    ================  =============   ====================================
+
+    Returns:
+        (list) workflows failing more than the max failure rate, or never
+        run.
+    """
+    failed = []
+    for name in report['config']['workflows']:
+        stats = report['workflows'].get(name)
+        if not stats or not stats['runs'] or (
+                stats['failures'] / stats['runs'] > max_failure_rate):
+            failed.append(name)
+    return failed
+
+
+class DataryLoadRecorder(DataryRequestObserver):
+    """
+    Request observer collecting requests, tries, latencies and bytes by
+    endpoint of the load test clients, and durations of the workflows.
+    """
+
+    def __init__(self):
+        super(DataryLoadRecorder, self).__init__()
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.attempts = Counter()
+        self.bytes_sent = Counter()
+        self.bytes_received = Counter()
+        self.content_bytes_sent = Counter()
+        self.content_bytes_received = Counter()
+        self.statuses = defaultdict(Counter)
+        self.latencies = defaultdict(list)
+        self.workflows = defaultdict(list)
+        self.workflow_failures = Counter()
+
+    def on_request_end(self, event):
+        endpoint = '{} {}'.format(event.http_method, event.endpoint)
+
+        with self.lock:
+            self.attempts[endpoint] += 1
+            self.latencies[endpoint].append(event.duration)
+
+            if not event.retry:
+                self.requests[endpoint] += 1
+
+            if event.status_code is None:
+                self.statuses[endpoint]['error'] += 1
+                return
+
+            self.statuses[endpoint][str(event.status_code)] += 1
+            self.bytes_sent[endpoint] += event.request_bytes
+            self.bytes_received[endpoint] += event.response_bytes
+            self.content_bytes_sent[endpoint] += event.request_content_bytes
+            self.content_bytes_received[endpoint] += (
+                event.response_content_bytes)
+
+    def record_workflow(self, name, duration, ok=True):
+        with self.lock:
+            self.workflows[name].append(duration)
+            if not ok:
+                self.workflow_failures[name] += 1
+
+    def report(self, duration):
+        """
+        Returns:
+            (dict) json serializable report of the recorded run.
+        """
+        with self.lock:
+            endpoints = {
+                endpoint: {
+                    'requests': self.requests[endpoint],
+                    'attempts': self.attempts[endpoint],
+                    'retries': max(
+                        self.attempts[endpoint] - self.requests[endpoint], 0),
+                    'statuses': dict(self.statuses[endpoint]),
+                    'bytes_sent': self.bytes_sent[endpoint],
+                    'bytes_received': self.bytes_received[endpoint],
+                    'content_bytes_sent': self.content_bytes_sent[endpoint],
+                    'content_bytes_received': self.content_bytes_received[
+                        endpoint],
+                    'latency': summarize(self.latencies[endpoint]),
+                }
+                for endpoint in sorted(self.requests)
+            }
+
+            workflows = {
+                name: {
+                    'runs': len(durations),
+                    'failures': self.workflow_failures[name],
+                    'latency': summarize(durations),
+                }
+                for name, durations in sorted(self.workflows.items())
+            }
+
+        requests = sum(x['requests'] for x in endpoints.values())
+
+        return {
+            'duration': duration,
+            'requests': requests,
+            'attempts': sum(x['attempts'] for x in endpoints.values()),
+            'retries': sum(x['retries'] for x in endpoints.values()),
+            'requests_per_second': requests / duration if duration else None,
+            'bytes_sent': sum(x['bytes_sent'] for x in endpoints.values()),
+            'bytes_received': sum(
+                x['bytes_received'] for x in endpoints.values()),
+            'content_bytes_sent': sum(
+                x['content_bytes_sent'] for x in endpoints.values()),
+            'content_bytes_received': sum(
+                x['content_bytes_received'] for x in endpoints.values()),
+            'endpoints': endpoints,
+            'workflows': workflows,
+        }
+
+
+class DataryLoadTest(object):
+    """
+    Load test of N concurrent Datary clients, each one working on its own
+    repo through the sdk workflows.
+    """
+
+    WORKFLOWS = (
+        'describe_repo',
+        'recollect_last_commit',
+        'operation_commit',
+        'update_append_file',
+        'clean_repo',
+    )
+
+    def __init__(self, url_base=None, **kwargs):
+        """
+        DataryLoadTest Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url_base          str             Datary api url base, a stand-in
+                                          server is started if None
+        username          str             Datary username
+        password          str             Datary password
+        clients           int             concurrent clients (default 4)
+        iterations        int             workflow rounds by client
+                                          (default 5)
+        duration          float           seconds to run instead of a fixed
+                                          number of iterations
+        files             int             files of every client repo
+                                          (default 10)
+        rows              int             kern rows of every file
+                                          (default 10)
+        workflows         list            workflows to run (default all)
+        standin           dict            stand-in server arguments
+                                          (latency, throttle_rate, ...)
+        client            dict            Datary client arguments
+        ================  =============   ====================================
+        """
+        super(DataryLoadTest, self).__init__()
+        self.url_base = url_base
+        self.username = kwargs.get('username', 'datary')
+        self.password = kwargs.get('password', 'datary')
+        self.clients = int(kwargs.get('clients', 4))
+        self.iterations = int(kwargs.get('iterations', 5))
+        self.duration = kwargs.get('duration')
+        self.files = int(kwargs.get('files', 10))
+        self.rows = int(kwargs.get('rows', 10))
+        self.workflows = list(kwargs.get('workflows') or self.WORKFLOWS)
+        self.standin = dict(kwargs.get('standin') or {})
+        self.client_kwargs = dict(kwargs.get('client') or {})
+        self.recorder = DataryLoadRecorder()
+
+        unknown = set(self.workflows) - set(self.WORKFLOWS)
+        if unknown:
+            raise ValueError('Unknown workflows {}'.format(sorted(unknown)))
+
+    def config(self):
+        """
+        Returns:
+            (dict) json serializable configuration of the load test.
+        """
+        return {
+            'url_base': self.url_base,
+            'clients': self.clients,
+            'iterations': None if self.duration else self.iterations,
+            'duration': self.duration,
+            'files': self.files,
+            'rows': self.rows,
+            'workflows': self.workflows,
+            'standin': self.standin if self.url_base is None else None,
+        }
+
+    def run(self):
+        """
+        Run the load test.
+
+        Returns:
+            (dict) json serializable report, see DataryLoadRecorder.report.
+        """
+        server = None
+        url_base = self.url_base
+
+        if url_base is None:
+            server = DataryStandInServer(
+                members={self.username: self.password},
+                **self.standin).start()
+            url_base = server.url_base
+
+        started = datetime.datetime.now(datetime.timezone.utc)
+        threads = [
+            threading.Thread(
+                target=self.run_client, args=(url_base, index),
+                name='datary-loadtest-{}'.format(index))
+            for index in range(self.clients)]
+
+        try:
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            duration = time.perf_counter() - start
+
+        finally:
+            if server is not None:
+                server.stop()
+
+        report = self.recorder.report(duration)
+        report['started'] = started.isoformat().replace('+00:00', 'Z')
+        report['config'] = self.config()
+        return report
+
+    def run_client(self, url_base, index):
+        """
+        Runs the workflows with a new client on a new repo.
+        """
+        client = Datary(
+            url_base=url_base, username=self.username,
+            password=self.password, **self.client_kwargs)
+        repo_uuid = None
+
+        try:
+            repo = client.create_repo(
+                'loadtest-{}-{}'.format(index, uuid.uuid4().hex[:8]),
+                'other')
+            repo_uuid = repo.get('uuid')
+
+            if not repo_uuid:
+                logger.error('Fail to create load test repo', client=index)
+                return
+
+            state = {
+                'repo_uuid': repo_uuid,
+                'wdir_uuid': repo['workdir']['uuid'],
+                'iteration': 0,
+            }
+
+            # first commit, not recorded
+            self.workflow_operation_commit(client, state)
+
+            client.add_observer(self.recorder)
+            deadline = (
+                time.perf_counter() + self.duration if self.duration
+                else None)
+
+            while (time.perf_counter() < deadline if deadline
+                   else state['iteration'] < self.iterations):
+                state['iteration'] += 1
+
+                for name in self.workflows:
+                    self.run_workflow(name, client, state)
+
+        except Exception as ex:
+            logger.error('Load test client failed - {}'.format(ex),
+                         client=index)
+
+        finally:
+            if repo_uuid:
+                client.delete_repo(repo_uuid)
+            client.close()
+
+    def run_workflow(self, name, client, state):
+        """
+        Runs and records a workflow.
+        """
+        start = time.perf_counter()
+        ok = False
+        try:
+            ok = getattr(self, 'workflow_{}'.format(name))(client, state)
+        except Exception as ex:
+            logger.error(
+                'Load test workflow failed - {}'.format(ex), workflow=name)
+        finally:
+            self.recorder.record_workflow(
+                name, time.perf_counter() - start, ok=ok)
+
+    def make_element(self, index, iteration, codec):
+        """
+        Returns:
+            (list) commit element [path, basename, data, sha1], only half of
+            the files change between iterations. The sha1 is the one of the
+            blob encoded with the client codec.
+        """
+        version = iteration if index % 2 else 0
+        data = {
+            'kern': [
+                [row, index, version] for row in range(self.rows)],
+            'meta': {'axisHeaders': {'*': ['row', 'file', 'version']}},
+        }
+        # sha1 of the uploaded blob, as the api does.
+        sha1 = hashlib.sha1(codec.dumpb({
+            '__kern': data['kern'], '__meta': data['meta']})).hexdigest()
+
+        return [
+            'loadtest/{}'.format(index % 3), 'file{}'.format(index), data,
+            sha1]
+
+    def workflow_describe_repo(self, client, state):
+        return bool(client.get_describerepo(state['repo_uuid']))
+
+    def workflow_recollect_last_commit(self, client, state):
+        return bool(client.recollect_last_commit({'uuid': state['repo_uuid']}))
+
+    def workflow_operation_commit(self, client, state):
+        repo = client.get_describerepo(state['repo_uuid'])
+        last_commit = client.recollect_last_commit(repo)
+        actual_commit = [
+            self.make_element(index, state['iteration'], client.codec)
+            for index in range(self.files)]
+
+        result = client.operation_commit(
+            state['wdir_uuid'], last_commit, actual_commit, strict=True)
+        client.commit(
+            state['repo_uuid'],
+            'load test iteration {}'.format(state['iteration']))
+
+        return not result['failed']
+
+    def workflow_update_append_file(self, client, state):
+        element = {
+            'path': 'loadtest/0',
+            'basename': 'file0',
+            'data': {
+                'kern': [[self.rows + state['iteration'], 0, 0]],
+                'meta': {'axisHeaders': {'*': ['row', 'file', 'version']}},
+            }
+        }
+        return client.update_append_file(
+            state['wdir_uuid'], element, state['repo_uuid'])
+
+    def workflow_clean_repo(self, client, state):
+        client.clean_repo(state['repo_uuid'])
+
+        # discard the cleaning, back to the last commit.
+        return client.clear_index(state['wdir_uuid'])
+
+
+def main(args=None):
+    """
+    Run the load test from the command line and write its json report.
+    """
+    parser = argparse.ArgumentParser(
+        description='Load test the Datary sdk workflows.')
+    parser.add_argument(
+        '--url-base', default=None,
+        help='Datary api url base (default: a local stand-in server)')
+    parser.add_argument('--username', default='datary')
+    parser.add_argument('--password', default='datary')
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--duration', type=float, default=None)
+    parser.add_argument('--files', type=int, default=10)
+    parser.add_argument('--rows', type=int, default=10)
+    parser.add_argument(
+        '--workflow', action='append', dest='workflows',
+        choices=DataryLoadTest.WORKFLOWS,
+        help='workflow to run, repeat it to run several (default all)')
+    parser.add_argument('--pool-maxsize', type=int, default=None)
+    parser.add_argument('--tries-limit', type=int, default=3)
+    parser.add_argument(
+        '--compression', default=None, choices=encodings(),
+        help='content encoding of the uploads (default not compressed)')
+    parser.add_argument(
+        '--accept-encoding', default=None,
+        help='Accept-Encoding of the responses (default the client one)')
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--latency-jitter', type=float, default=0)
+    parser.add_argument('--throttle-rate', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--output', default='-', help='json report file (default stdout)')
+    parser.add_argument(
+        '--max-failure-rate', type=float, default=0.0,
+        help='failed runs ratio of a workflow failing the load test, '
+             'exiting with status 1 (default 0, any failure)')
+    options = parser.parse_args(args)
+
+    client = {'tries_limit': options.tries_limit}
+    if options.pool_maxsize:
+        client['pool_maxsize'] = options.pool_maxsize
+    if options.compression:
+        client['compression'] = options.compression
+    if options.accept_encoding:
+        client['accept_encoding'] = options.accept_encoding
+
+    report = DataryLoadTest(
+        url_base=options.url_base,
+        username=options.username,
+        password=options.password,
+        clients=options.clients,
+        iterations=options.iterations,
+        duration=options.duration,
+        files=options.files,
+        rows=options.rows,
+        workflows=options.workflows,
+        standin={
+            'latency': options.latency,
+            'latency_jitter': options.latency_jitter,
+            'throttle_rate': options.throttle_rate,
+            'error_rate': options.error_rate,
+            'retry_after': options.retry_after,
+            'seed': options.seed,
+        },
+        client=client).run()
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if options.output == '-':
+        print(output)
+    else:
+        with open(options.output, 'w') as report_file:
+            report_file.write(output)
+
+    failed = failed_workflows(report, options.max_failure_rate)
+    if failed:
+        logger.error(
+            'Load test failed, workflows failing over {:.0%} of their '
+            'runs.'.format(options.max_failure_rate),
+            workflows=failed)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,813 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test Stand-in Server File
+
+Local http server implementing the Datary api endpoints used by the sdk,
+over an in-memory state model, with latency and fault injection knobs.
+Meant to load test the sdk without touching production:
+
+    $ python -m datary.loadtest.server --port 8080 --latency 0.02 \\
+        --throttle-rate 0.05 --error-rate 0.01
+"""
+import copy
+import json
+import time
+import uuid
+import random
+import hashlib
+import argparse
+import threading
+import zlib
+
+from collections import Counter
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from datary.lazy import get_logger
+from datary.requests import compression
+from datary.requests.endpoints import endpoint_template
+
+logger = get_logger(__name__)
+
+
+class DataryStandInError(Exception):
+    """
+    Stand-in api error, answered with its status code.
+    """
+
+    def __init__(self, status_code, msg=''):
+        super(DataryStandInError, self).__init__(msg)
+        self.status_code = status_code
+        self.msg = msg
+
+
+class DataryStandInState(object):
+    """
+    In-memory Datary state: members, sessions, repos, workdirs, datasets and
+    commits.
+    """
+
+    CHANGES_KEYS = {
+        'add': 'addedElements',
+        'modify': 'modifiedElements',
+        'remove': 'removedElements',
+        'rename': 'renamedElements',
+    }
+
+    def __init__(self, members=None):
+        """
+        DataryStandInState Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        members           dict            username -> password of the members
+        ================  =============   ====================================
+        """
+        super(DataryStandInState, self).__init__()
+        self.lock = threading.RLock()
+        self.members = {}
+        self.tokens = {}
+        self.repos = {}
+        self.workdirs = {}
+        self.datasets = {}
+        self.commits = {}
+
+        for username, password in (members or {}).items():
+            self.add_member(username, password)
+
+    def add_member(self, username, password):
+        """
+        Returns:
+            (dict) new member.
+        """
+        with self.lock:
+            member = {
+                'uuid': str(uuid.uuid4()),
+                'username': username,
+                'password': password}
+            self.members[username] = member
+            return member
+
+    def sign_in(self, username, password):
+        """
+        Returns:
+            (str) new session token of the member.
+        """
+        with self.lock:
+            member = self.members.get(username)
+            if not member or member['password'] != password:
+                raise DataryStandInError(401, 'Wrong username or password')
+
+            token = uuid.uuid4().hex
+            self.tokens[token] = member
+            return token
+
+    def sign_out(self, token):
+        """
+        Invalidates a session token.
+        """
+        with self.lock:
+            self.tokens.pop(token, None)
+
+    def member(self, token):
+        """
+        Returns:
+            (dict) member signed in with the token.
+        """
+        with self.lock:
+            member = self.tokens.get(token)
+            if member is None:
+                raise DataryStandInError(401, 'Invalid token')
+            return member
+
+    def create_repo(self, member, name, **kwargs):
+        """
+        Returns:
+            (dict) new repo description.
+        """
+        with self.lock:
+            repo_uuid = str(uuid.uuid4())
+            wdir_uuid = str(uuid.uuid4())
+            repo = {
+                'uuid': repo_uuid,
+                'name': name,
+                'owner': member['uuid'],
+                'creator': member['uuid'],
+                'description': kwargs.get('description', ''),
+                'category': kwargs.get('category', 'other'),
+                'visibility': kwargs.get('visibility', 'private'),
+                'license': {'name': kwargs.get('licenseName', '')},
+                'status': 'active',
+                'workdir': {'uuid': wdir_uuid},
+                'apex': {},
+            }
+            self.repos[repo_uuid] = repo
+            self.workdirs[wdir_uuid] = {
+                'repo': repo_uuid, 'tree': {}, 'changes': self.no_changes()}
+            return repo
+
+    def repo(self, repo_uuid):
+        """
+        Returns:
+            (dict) repo description.
+        """
+        with self.lock:
+            if repo_uuid not in self.repos:
+                raise DataryStandInError(404, 'Repo not found')
+            return self.repos[repo_uuid]
+
+    def member_repos(self, member_uuid):
+        """
+        Returns:
+            (list) repos owned by a member.
+        """
+        with self.lock:
+            return [
+                x for x in self.repos.values() if x['owner'] == member_uuid]
+
+    def delete_repo(self, repo_uuid):
+        """
+        Deletes a repo and its workdir.
+        """
+        with self.lock:
+            repo = self.repo(repo_uuid)
+            self.workdirs.pop(repo['workdir']['uuid'], None)
+            del self.repos[repo_uuid]
+
+    def workdir(self, wdir_uuid):
+        """
+        Returns:
+            (dict) workdir state.
+        """
+        with self.lock:
+            if wdir_uuid not in self.workdirs:
+                raise DataryStandInError(404, 'Workdir not found')
+            return self.workdirs[wdir_uuid]
+
+    @classmethod
+    def no_changes(cls):
+        """
+        Returns:
+            (dict) empty workdir changes.
+        """
+        return {key: [] for key in cls.CHANGES_KEYS.values()}
+
+    @staticmethod
+    def tree_node(tree, dirname, create=False):
+        """
+        Returns:
+            (dict) filetree node of a dirname or None if not exists.
+        """
+        node = tree
+        for name in [x for x in (dirname or '').split('/') if x]:
+            if not isinstance(node.get(name), dict):
+                if not create:
+                    return None
+                node[name] = {}
+            node = node[name]
+        return node
+
+    def apply_change(self, wdir_uuid, change, blob=None):
+        """
+        Applies a workdir change (add, modify, remove, rename).
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        wdir_uuid         str             workdir uuid
+        change            dict            change form fields
+        blob              bytes           dataset json {'__kern', '__meta'}
+        ================  =============   ====================================
+        """
+        action = change.get('action')
+        dirname = change.get('dirname') or ''
+        basename = change.get('basename') or ''
+
+        with self.lock:
+            workdir = self.workdir(wdir_uuid)
+            tree = workdir['tree']
+            changes = workdir['changes']
+
+            if action in ('add', 'modify'):
+                if blob is None:
+                    raise DataryStandInError(400, 'Blob not found')
+
+                inode = self.add_dataset(blob)
+                self.tree_node(tree, dirname, create=True)[basename] = inode
+
+            elif action == 'remove':
+                inode = change.get('inode')
+
+                if inode:
+                    dirname, basename = self.find_inode(tree, inode)
+                else:
+                    node = self.tree_node(tree, dirname) or {}
+                    inode = node.get(basename)
+
+                if inode is None:
+                    raise DataryStandInError(404, 'Element not found')
+
+                del self.tree_node(tree, dirname)[basename]
+
+            elif action == 'rename':
+                node = self.tree_node(tree, dirname) or {}
+                inode = node.pop(basename, None)
+
+                if inode is None:
+                    raise DataryStandInError(404, 'Element not found')
+
+                new_dirname, _, new_basename = change.get(
+                    'newPathname', '').rpartition('/')
+                self.tree_node(
+                    tree, new_dirname, create=True)[new_basename] = inode
+
+            else:
+                raise DataryStandInError(
+                    400, 'Unknown action {}'.format(action))
+
+            changes[self.CHANGES_KEYS[action]].append({
+                'dirname': dirname, 'basename': basename, 'inode': inode})
+
+    def find_inode(self, tree, inode, dirname=''):
+        """
+        Returns:
+            (tuple) dirname, basename of an inode in the filetree.
+        """
+        for name, value in tree.items():
+            if isinstance(value, dict):
+                found = self.find_inode(
+                    value, inode, '/'.join([x for x in [dirname, name] if x]))
+                if found[1] is not None:
+                    return found
+            elif value == inode:
+                return dirname, name
+        return None, None
+
+    def add_dataset(self, blob):
+        """
+        Returns:
+            (str) dataset uuid, the sha1 of its content.
+        """
+        try:
+            data = json.loads(blob.decode('utf-8'))
+        except ValueError:
+            raise DataryStandInError(400, 'Blob is not json')
+
+        sha1 = hashlib.sha1(blob).hexdigest()
+        meta = dict(data.get('__meta') or {})
+        meta.update({'sha1': sha1, 'size': len(blob)})
+
+        with self.lock:
+            self.datasets[sha1] = {
+                '__kern': data.get('__kern'), '__meta': meta}
+        return sha1
+
+    def dataset(self, dataset_uuid):
+        """
+        Returns:
+            (dict) dataset original {'__kern', '__meta'}.
+        """
+        with self.lock:
+            if dataset_uuid not in self.datasets:
+                raise DataryStandInError(404, 'Dataset not found')
+            return self.datasets[dataset_uuid]
+
+    def clear_changes(self, wdir_uuid):
+        """
+        Discards the workdir changes, back to the last commit.
+        """
+        with self.lock:
+            workdir = self.workdir(wdir_uuid)
+            commit_sha1 = self.repo(workdir['repo'])['apex'].get('commit')
+            workdir['tree'] = copy.deepcopy(
+                self.commits.get(commit_sha1, {}))
+            workdir['changes'] = self.no_changes()
+
+    def commit(self, repo_uuid, message):
+        """
+        Returns:
+            (str) sha1 of the new commit of the repo workdir.
+        """
+        with self.lock:
+            repo = self.repo(repo_uuid)
+            workdir = self.workdir(repo['workdir']['uuid'])
+            filetree = copy.deepcopy(workdir['tree'])
+            sha1 = hashlib.sha1(json.dumps(
+                [repo['apex'].get('commit'), message, filetree],
+                sort_keys=True).encode('utf-8')).hexdigest()
+
+            self.commits[sha1] = filetree
+            repo['apex'] = {'commit': sha1}
+            workdir['changes'] = self.no_changes()
+            return sha1
+
+    def commit_filetree(self, commit_sha1):
+        """
+        Returns:
+            (dict) filetree of a commit.
+        """
+        with self.lock:
+            if commit_sha1 not in self.commits:
+                raise DataryStandInError(404, 'Commit not found')
+            return self.commits[commit_sha1]
+
+
+class DataryStandInHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in server request handler.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'DataryStandIn/1.0'
+
+    # headers and body are written apart, avoid the delayed ack stalls.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_PUT(self):
+        self.dispatch('PUT')
+
+    def do_DELETE(self):
+        self.dispatch('DELETE')
+
+    @property
+    def standin(self):
+        return self.server.standin
+
+    def read_body(self):
+        """
+        Returns:
+            (bytes) request body.
+        """
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            return self.read_chunked_body()
+
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def read_chunked_body(self):
+        """
+        Returns:
+            (bytes) request body sent with chunked transfer encoding.
+        """
+        chunks = []
+
+        while True:
+            size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+            if not size:
+                # trailers until the empty line
+                while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def decode_body(self, body):
+        """
+        Returns:
+            (bytes) request body decompressed as its Content-Encoding says.
+
+        Raises:
+            DataryStandInError: 415 unsupported encoding.
+        """
+        encoding = self.headers.get('Content-Encoding', 'identity').strip()
+
+        if encoding == 'identity' or not body:
+            return body
+
+        try:
+            decompressor = compression.decompressor(encoding)
+            data = decompressor.decompress(body)
+        except (ValueError, ImportError, zlib.error) as ex:
+            raise DataryStandInError(
+                415, 'Unsupported content encoding {} - {}'.format(
+                    encoding, ex))
+
+        return data + (
+            decompressor.flush() if hasattr(decompressor, 'flush') else b'')
+
+    def response_encoding(self, body):
+        """
+        Returns:
+            (str) content encoding of a response body, None to send it as
+            it is (too small or not accepted by the client).
+        """
+        min_size = self.standin.compress_min_size
+        if min_size is None or len(body) < min_size:
+            return None
+
+        accepted = set()
+        for token in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = token.strip().partition(';')
+            if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00'):
+                accepted.add(name.strip())
+
+        for encoding in reversed(compression.encodings()):
+            if encoding in accepted:
+                return encoding
+        return None
+
+    def read_form(self, body):
+        """
+        Returns:
+            (tuple) form fields dict, blob bytes (if multipart).
+        """
+        content_type = self.headers.get('Content-Type', '')
+
+        if content_type.startswith('multipart/form-data'):
+            message = BytesParser(policy=HTTP).parsebytes(
+                b'Content-Type: ' + content_type.encode('latin-1') +
+                b'\r\n\r\n' + body)
+            fields, blob = {}, None
+
+            for part in message.iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                payload = part.get_payload(decode=True)
+                if name == 'blob':
+                    blob = payload
+                else:
+                    fields[name] = payload.decode('utf-8')
+
+            return fields, blob
+
+        return {
+            key: values[-1] for key, values in
+            parse_qs(body.decode('utf-8')).items()}, None
+
+    def send_json(self, status_code, value=None, headers=None):
+        """
+        Answers a json body, or 304 if the client has it already, and
+        records it.
+        """
+        body = json.dumps(value).encode('utf-8') if value is not None else b''
+        headers = dict(headers or {})
+
+        if self.command == 'GET' and 200 <= status_code < 300:
+            etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+            headers['ETag'] = etag
+
+            if self.headers.get('If-None-Match') == etag:
+                status_code, body = 304, b''
+
+        encoding = self.response_encoding(body)
+        if encoding is not None:
+            compressor = compression.compressor(encoding)
+            body = compressor.compress(body) + compressor.flush()
+            headers['Content-Encoding'] = encoding
+            headers['Vary'] = 'Accept-Encoding'
+
+        # recorded before it's answered, the client may check it then.
+        self.standin.record(self.command, self.path, status_code)
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        return status_code
+
+    def dispatch(self, http_method):
+        """
+        Handles a request, injecting the configured latency and faults.
+        """
+        standin = self.standin
+        url = urlparse(self.path)
+        segments = [x for x in url.path.split('/') if x]
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self.read_body()
+
+        try:
+            standin.inject_latency()
+            fault = standin.inject_fault()
+
+            if fault == 429:
+                self.send_json(
+                    429, {'message': 'Request limit exceeded'},
+                    headers={'Retry-After': str(standin.retry_after)})
+            elif fault:
+                self.send_json(
+                    fault, {'message': 'Injected server error'})
+            else:
+                status, value, headers = self.route(
+                    http_method, segments, params, self.decode_body(body))
+                self.send_json(status, value, headers)
+
+        except DataryStandInError as ex:
+            self.send_json(ex.status_code, {'message': ex.msg})
+
+        except Exception as ex:
+            logger.error('Stand-in server error - {}'.format(ex))
+            self.send_json(500, {'message': str(ex)})
+
+    def token_member(self):
+        """
+        Returns:
+            (dict) member of the request Authorization token.
+        """
+        authorization = self.headers.get('Authorization', '')
+        return self.standin.state.member(
+            authorization[len('Bearer '):]
+            if authorization.startswith('Bearer ') else '')
+
+    def route(self, http_method, segments, params, body):
+        """
+        Returns:
+            (tuple) status code, json value, headers of the answer.
+        """
+        state = self.standin.state
+        route = (http_method, endpoint_template('/'.join(segments)))
+
+        # sign-in / sign-out
+        if route == ('POST', 'members/{}/sessions'):
+            form, _ = self.read_form(body)
+            token = state.sign_in(form.get('username'), form.get('password'))
+            return 200, {}, {'x-set-token': token}
+
+        member = self.token_member()
+
+        if route == ('DELETE', 'members/{}/sessions'):
+            state.sign_out(
+                self.headers.get('Authorization', '')[len('Bearer '):])
+            return 200, {}, None
+
+        if route == ('GET', 'me/repos'):
+            return 200, state.member_repos(member['uuid']), None
+
+        if route == ('POST', 'me/repos'):
+            form, _ = self.read_form(body)
+            return 200, state.create_repo(member, **form), None
+
+        if route == ('GET', 'members/{}/repos'):
+            return 200, state.member_repos(segments[1]), None
+
+        if route == ('GET', 'repos/{}'):
+            return 200, state.repo(segments[1]), None
+
+        if route == ('DELETE', 'repos/{}'):
+            state.delete_repo(segments[1])
+            return 200, {}, None
+
+        if route == ('POST', 'repos/{}/commits'):
+            form, _ = self.read_form(body)
+            sha1 = state.commit(segments[1], form.get('message', ''))
+            return 200, {'commit': sha1}, None
+
+        if route == ('GET', 'workdirs/{}/filetree'):
+            return 200, state.workdir(segments[1])['tree'], None
+
+        if route == ('GET', 'workdirs/{}/changes'):
+            return 200, state.workdir(segments[1])['changes'], None
+
+        if route == ('POST', 'workdirs/{}/changes'):
+            form, blob = self.read_form(body)
+            state.apply_change(segments[1], form, blob)
+            return 200, {}, None
+
+        if route == ('DELETE', 'workdirs/{}/changes'):
+            state.clear_changes(segments[1])
+            return 200, {}, None
+
+        if route == ('GET', 'workdirs/{}/workdir'):
+            dirname, _, basename = params.get('pathname', '').rpartition('/')
+            node = state.tree_node(
+                state.workdir(segments[1])['tree'], dirname) or {}
+            return 200, node.get(basename) or {}, None
+
+        if route in [('GET', 'datasets/{}/original'),
+                     ('GET', 'datasets/{}/kern'),
+                     ('GET', 'datasets/{}/meta')]:
+            dataset = state.dataset(segments[1])
+            if segments[2] == 'original':
+                return 200, dataset, None
+            return 200, dataset['__{}'.format(segments[2])], None
+
+        if route == ('GET', 'commits/{}/filetree'):
+            return 200, state.commit_filetree(segments[1]), None
+
+        if route == ('GET', 'search/categories'):
+            return 200, [{'id': 'other', 'name': 'Other'}], None
+
+        raise DataryStandInError(
+            404, 'Unknown endpoint {} {}'.format(*route))
+
+
+class DataryStandInServer(object):
+    """
+    Local stand-in Datary api server, serving from a background thread.
+
+    Fault injection knobs:
+    - latency: seconds added to every request (plus up to latency_jitter).
+    - throttle_rate: probability of answering 429 with `Retry-After`.
+    - error_rate: probability of answering 503.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, **kwargs):
+        """
+        DataryStandInServer Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        host              str             listening host
+        port              int             listening port (0: any free one)
+        members           dict            username -> password
+                                          (default {'datary': 'datary'})
+        latency           float           seconds added to every request
+        latency_jitter    float           max random seconds added too
+        throttle_rate     float           probability of a 429 answer
+        error_rate        float           probability of a 503 answer
+        retry_after       int             Retry-After seconds of 429s
+        seed              int             random seed of the injected faults
+        compress_min_size int             min bytes of the compressed
+                                          responses, the ones accepted by
+                                          the client (default 1024, None
+                                          not to compress)
+        ================  =============   ====================================
+        """
+        super(DataryStandInServer, self).__init__()
+        self.state = DataryStandInState(
+            kwargs.get('members', {'datary': 'datary'}))
+        self.latency = float(kwargs.get('latency', 0))
+        self.latency_jitter = float(kwargs.get('latency_jitter', 0))
+        self.throttle_rate = float(kwargs.get('throttle_rate', 0))
+        self.error_rate = float(kwargs.get('error_rate', 0))
+        self.retry_after = kwargs.get('retry_after', 1)
+        self.compress_min_size = kwargs.get('compress_min_size', 1024)
+        self.requests = Counter()
+        self.statuses = Counter()
+
+        self._random = random.Random(kwargs.get('seed'))
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+        self.httpd = ThreadingHTTPServer((host, port), DataryStandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.standin = self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url_base(self):
+        """
+        Returns:
+            (str) url base of the server for Datary URL_BASE.
+        """
+        host, port = self.httpd.server_address[:2]
+        return 'http://{}:{}/'.format(host, port)
+
+    def start(self):
+        """
+        Start serving from a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name='datary-standin',
+            daemon=True)
+        self._thread.start()
+        logger.info('Datary stand-in server started', url=self.url_base)
+        return self
+
+    def stop(self):
+        """
+        Stop serving.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def inject_latency(self):
+        """
+        Sleeps the configured latency.
+        """
+        latency = self.latency
+        if self.latency_jitter:
+            with self._random_lock:
+                latency += self._random.uniform(0, self.latency_jitter)
+        if latency > 0:
+            time.sleep(latency)
+
+    def inject_fault(self):
+        """
+        Returns:
+            (int) status code of the injected fault or None.
+        """
+        with self._random_lock:
+            draw = self._random.random()
+
+        if draw < self.throttle_rate:
+            return 429
+        if draw < self.throttle_rate + self.error_rate:
+            return 503
+        return None
+
+    def record(self, http_method, path, status_code):
+        """
+        Counts the answered requests by endpoint and status.
+        """
+        with self._stats_lock:
+            self.requests[
+                '{} {}'.format(http_method, endpoint_template(path))] += 1
+            self.statuses[status_code] += 1
+
+
+def main(args=None):
+    """
+    Run the stand-in server from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description='Local stand-in Datary api server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--latency-jitter', type=float, default=0)
+    parser.add_argument('--throttle-rate', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--compress-min-size', type=int, default=1024,
+        help='min bytes of the compressed responses (0 not to compress)')
+    parser.add_argument(
+        '--member', action='append', default=[],
+        help='username:password of a member (default datary:datary)')
+    options = parser.parse_args(args)
+
+    members = dict(x.split(':', 1) for x in options.member) or None
+    server = DataryStandInServer(
+        host=options.host, port=options.port,
+        members=members or {'datary': 'datary'},
+        latency=options.latency, latency_jitter=options.latency_jitter,
+        throttle_rate=options.throttle_rate, error_rate=options.error_rate,
+        retry_after=options.retry_after, seed=options.seed,
+        compress_min_size=options.compress_min_size or None)
+
+    print('Datary stand-in server listening at {}'.format(server.url_base))
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test Harness Test File
+"""
+import os
+import json
+import tempfile
+import unittest
+
+from datary.loadtest import DataryLoadTest
+from datary.loadtest.harness import (
+    failed_workflows, main, percentile, summarize)
+
+
+class DataryLoadTestTestCase(unittest.TestCase):
+    """
+    DataryLoadTest Test Case
+    """
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([3], 99), 3)
+        self.assertIsNone(percentile([], 50))
+
+        summary = summarize([3, 1, 2])
+        self.assertEqual(summary['count'], 3)
+        self.assertEqual(summary['max'], 3)
+        self.assertEqual(summary['p50'], 2)
+
+    def test_run(self):
+        report = DataryLoadTest(
+            clients=2, iterations=2, files=4,
+            workflows=['describe_repo', 'operation_commit'],
+            standin={'throttle_rate': 0.05, 'retry_after': 0, 'seed': 2},
+        ).run()
+
+        # json serializable
+        report = json.loads(json.dumps(report))
+
+        self.assertEqual(report['config']['clients'], 2)
+        self.assertEqual(
+            sorted(report['workflows']),
+            ['describe_repo', 'operation_commit'])
+        self.assertEqual(report['workflows']['describe_repo']['runs'], 4)
+
+        endpoint = report['endpoints']['POST workdirs/{}/changes']
+        self.assertTrue(endpoint['requests'])
+        self.assertTrue(endpoint['bytes_sent'])
+        self.assertEqual(
+            endpoint['attempts'], endpoint['requests'] + endpoint['retries'])
+        self.assertEqual(
+            report['retries'],
+            sum(x['retries'] for x in report['endpoints'].values()))
+        self.assertTrue(report['requests_per_second'] > 0)
+        self.assertIsNotNone(
+            report['endpoints']['GET repos/{}']['latency']['p99'])
+
+    def test_failed_workflows(self):
+        report = {
+            'config': {'workflows': ['a', 'b', 'c']},
+            'workflows': {
+                'a': {'runs': 10, 'failures': 0},
+                'b': {'runs': 10, 'failures': 2},
+            },
+        }
+        self.assertEqual(failed_workflows(report), ['b', 'c'])
+        self.assertEqual(failed_workflows(report, 0.2), ['c'])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = os.path.join(tmp_dir, 'report.json')
+            args = [
+                '--clients', '1', '--iterations', '1', '--files', '2',
+                '--workflow', 'describe_repo', '--output', output]
+
+            self.assertEqual(main(args), 0)
+            with open(output) as report_file:
+                report = json.load(report_file)
+            self.assertEqual(report['workflows']['describe_repo']['runs'], 1)
+
+            # failing workflows fail the run
+            self.assertEqual(
+                main(args + ['--error-rate', '1', '--tries-limit', '1']), 1)
+
+    def test_unknown_workflow(self):
+        self.assertRaises(
+            ValueError, DataryLoadTest, workflows=['describe_repo', 'nope'])
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Load Test Stand-in Server Test File
+"""
+import threading
+import unittest
+import requests
+
+from datary import Datary
+from datary.loadtest import DataryStandInServer
+from datary.requests import DataryMetrics
+
+
+class DataryStandInServerTestCase(unittest.TestCase):
+    """
+    DataryStandInServer Test Case, driving a real client against it.
+    """
+
+    def setUp(self):
+        self.server = DataryStandInServer(
+            members={'pepe': 'pass'}, seed=1).start()
+        self.datary = Datary(
+            url_base=self.server.url_base,
+            username='pepe', password='pass', tries_limit=1)
+
+    def tearDown(self):
+        self.datary.close()
+        self.server.stop()
+
+    def test_sign_in(self):
+        # signed in on the first request, not when built.
+        self.assertFalse(self.datary.token)
+        self.assertEqual(sum(self.server.requests.values()), 0)
+
+        # concurrent first requests share a single sign-in.
+        threads = [
+            threading.Thread(
+                target=self.datary.get_describerepo,
+                kwargs={'repo_name': 'nope'})
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(self.datary.token)
+        self.assertEqual(
+            self.datary.headers['Authorization'],
+            'Bearer {}'.format(self.datary.token))
+        self.assertEqual(
+            self.server.requests['POST members/{}/sessions'], 1)
+        self.assertEqual(self.server.requests['GET me/repos'], 8)
+
+    def test_unauthorized(self):
+        response = requests.get(self.server.url_base + 'me/repos')
+        self.assertEqual(response.status_code, 401)
+
+    def test_workflow(self):
+        repo = self.datary.create_repo('test_repo', 'other')
+        self.assertEqual(repo.get('name'), 'test_repo')
+        wdir_uuid = repo['workdir']['uuid']
+
+        element = {
+            'path': 'a/b', 'basename': 'c',
+            'data': {'kern': [[1, 2], [3, 4]], 'meta': {'axisHeaders': {}}}}
+
+        self.assertTrue(self.datary.add_file(wdir_uuid, element))
+        self.assertEqual(
+            list(self.datary.get_wdir_filetree(wdir_uuid)['a']['b']), ['c'])
+
+        changes = self.datary.get_wdir_changes(wdir_uuid)
+        self.assertEqual(len(changes['addedElements']), 1)
+
+        self.datary.commit(repo['uuid'], 'first commit')
+        repo = self.datary.get_describerepo(repo['uuid'])
+        self.assertTrue(repo['apex']['commit'])
+
+        dataset_uuid = self.datary.get_commit_filetree(
+            repo['uuid'], repo['apex']['commit'])['a']['b']['c']
+        self.assertEqual(
+            self.datary.get_kern(dataset_uuid, repo['uuid']), [[1, 2], [3, 4]])
+
+        original = self.datary.get_original(
+            dataset_uuid, repo['uuid'])
+        self.assertEqual(original['__kern'], [[1, 2], [3, 4]])
+        self.assertEqual(original['__meta']['sha1'], dataset_uuid)
+
+        last_commit = self.datary.recollect_last_commit(repo)
+        self.assertEqual(last_commit, [('a/b', 'c', None, dataset_uuid)])
+
+        self.assertTrue(self.datary.delete_file(wdir_uuid, element))
+        self.assertEqual(self.datary.get_wdir_filetree(wdir_uuid), {'a': {
+            'b': {}}})
+
+        self.assertEqual(
+            self.server.requests['POST workdirs/{}/changes'], 2)
+
+    def test_not_modified(self):
+        self.datary.sign_in()
+        url = self.server.url_base + 'me/repos'
+        headers = {'Authorization': self.datary.headers['Authorization']}
+
+        response = requests.get(url, headers=headers)
+        self.assertEqual(response.status_code, 200)
+
+        response = requests.get(url, headers=dict(
+            headers, **{'If-None-Match': response.headers['ETag']}))
+        self.assertEqual(response.status_code, 304)
+
+    def test_fault_injection(self):
+        self.server.throttle_rate = 1
+        self.server.retry_after = 7
+
+        response = requests.get(self.server.url_base + 'me/repos')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '7')
+
+        self.server.throttle_rate = 0
+        self.server.error_rate = 1
+        response = requests.get(self.server.url_base + 'me/repos')
+        self.assertEqual(response.status_code, 503)
+
+        self.assertEqual(self.server.statuses[429], 1)
+        self.assertEqual(self.server.statuses[503], 1)
+
+    def test_compression(self):
+        metrics = DataryMetrics()
+        datary = Datary(
+            url_base=self.server.url_base, username='pepe', password='pass',
+            tries_limit=1, compression='gzip', observers=[metrics])
+        self.addCleanup(datary.close)
+
+        repo = datary.create_repo('test_repo', 'other')
+        element = {
+            'path': 'a', 'basename': 'b',
+            'data': {'kern': [['row', x] for x in range(1000)], 'meta': {}}}
+        self.assertTrue(datary.add_file(repo['workdir']['uuid'], element))
+
+        dataset_uuid = datary.get_wdir_filetree(
+            repo['workdir']['uuid'])['a']['b']
+        self.assertEqual(
+            datary.get_kern(dataset_uuid, repo['uuid']),
+            element['data']['kern'])
+
+        endpoints = metrics.dump()['endpoints']
+        upload = endpoints['POST workdirs/{}/changes']
+        self.assertLess(
+            upload['request_bytes'], upload['request_content_bytes'] / 5)
+        kern = endpoints['GET datasets/{}/kern']
+        self.assertLess(
+            kern['response_bytes'], kern['response_content_bytes'] / 5)
+
+        # not accepted encodings
+        response = requests.post(
+            self.server.url_base + 'me/repos', data=b'nope',
+            headers={'Content-Encoding': 'nope',
+                     'Authorization': datary.headers['Authorization']})
+        self.assertEqual(response.status_code, 415)
@@ -6,9 +6,9 @@ Datary sdk Members File
 from urllib.parse import urljoin
 from datary.auth import DataryAuth
 
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryMembers(DataryAuth):
@@ -43,9 +43,9 @@ class DataryMembers(DataryAuth):
             }
 
         response = self.request(
-            url, 'GET', **{'headers': self.headers, 'params': params})
+            url, 'GET', **{'params': params})
 
-        members_data = response.json() if response else {}
+        members_data = self.response_json(response) if response else {}
         member = {}
 
         if member_name or member_uuid:
@@ -92,6 +92,6 @@ class DataryMembers(DataryAuth):
             member_uuid = member.get('uuid')
 
         url = urljoin(self.URL_BASE, "members/{}/repos".format(member_uuid))
-        response = self.request(url, 'GET', **{'headers': self.headers})
+        response = self.request(url, 'GET')
 
-        return response.json() if response else None
+        return self.response_json(response) if response else None
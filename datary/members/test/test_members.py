@@ -13,7 +13,7 @@ class DataryMembersTestCase(DataryTestCase):
     Datary Members Test Case
     """
 
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_members(self, mock_request):
         """
         Test get_members
@@ -40,7 +40,7 @@ class DataryMembersTestCase(DataryTestCase):
         assert isinstance(members_limit, list)
 
     @mock.patch('datary.members.DataryMembers.get_members')
-    @mock.patch('datary.requests.requests.requests.get')
+    @mock.patch('datary.requests.requests.requests.Session.get')
     def test_get_member_repos(self, mock_request, mock_get_members):
         """
         Test get_members
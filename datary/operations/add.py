@@ -3,15 +3,14 @@
 Datary sdk Add Operations File
 """
 import os
-import json
 from urllib.parse import urljoin
-from requests_toolbelt import MultipartEncoder
 
 from datary.auth import DataryAuth
+from datary.requests.multipart import DataryMultipartStream
 from datary.operations.limits import DataryOperationLimits
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryAddOperation(DataryAuth, DataryOperationLimits):
@@ -45,7 +44,7 @@ class DataryAddOperation(DataryAuth, DataryOperationLimits):
                    "basename": dirname}
 
         response = self.request(
-            url, 'POST', **{'data': payload, 'headers': self.headers})
+            url, 'POST', **{'data': payload})
         if response:
             logger.info(
                 "Directory has been created in workdir.",
@@ -66,29 +65,22 @@ class DataryAddOperation(DataryAuth, DataryOperationLimits):
         element           list            [path, basename, data, sha1]
         dirname           str             directory name
         ================  =============   ====================================
+
+        Returns:
+            (bool) if the file has been added.
         """
         logger.info("Add new file to Datary.")
 
         url = urljoin(self.URL_BASE, "workdirs/{}/changes".format(wdir_uuid))
-        payload = MultipartEncoder({
-            "blob": (
-                element.get('basename'),
-                json.dumps({
-                    '__kern': element.get('data', {}).get('kern'),
-                    '__meta': element.get('data', {}).get('meta'),
-                    }),
-                'application/json'),
-
-            "action": "add",
-            "filemode": "100644",
-            "dirname": element.get('path'),
-            "basename": element.get('basename')
-        })
-
-        self.headers["Content-Type"] = payload.content_type
+        # the blob is encoded row by row while it's sent.
+        payload = DataryMultipartStream.for_change(
+            "add", element, codec=self.codec)
+
+        # per call headers, merged with the client ones when it's sent.
+        headers = {"Content-Type": payload.content_type}
 
         response = self.request(
-            url, 'POST', **{'data': payload, 'headers': self.headers})
+            url, 'POST', **{'data': payload, 'headers': headers})
 
         if response:
             logger.info(
@@ -98,6 +90,7 @@ class DataryAddOperation(DataryAuth, DataryOperationLimits):
                 basename=element.get('basename'),
                 # element=element
                 )
+            return True
 
         else:
             logger.error(
@@ -108,3 +101,5 @@ class DataryAddOperation(DataryAuth, DataryOperationLimits):
                 dirname=element.get('path'),
                 basename=element.get('basename')
             )
+
+        return False
@@ -4,15 +4,14 @@
 Datary sdk clean Operations File
 """
 
-from datary.repos import DataryRepos
 from datary.workdirs import DataryWorkdirs
 from datary.operations.remove import DataryRemoveOperation
 from datary.operations.limits import DataryOperationLimits
-from scrapbag import flatten
 
-import structlog
+from datary.lazy import get_logger, lazy_module
 
-logger = structlog.getLogger(__name__)
+scrapbag = lazy_module('scrapbag')
+logger = get_logger(__name__)
 
 
 class DataryCleanOperation(DataryRemoveOperation, DataryWorkdirs,
@@ -30,7 +29,7 @@ class DataryCleanOperation(DataryRemoveOperation, DataryWorkdirs,
         repo_uuid         str             repository uuid
         ================  =============   ====================================
         """
-        repo = DataryRepos.get_describerepo(repo_uuid=repo_uuid, **kwargs)
+        repo = self.get_describerepo(repo_uuid=repo_uuid, **kwargs)
 
         if repo:
             wdir_uuid = repo.get('workdir', {}).get('uuid')
@@ -42,7 +41,7 @@ class DataryCleanOperation(DataryRemoveOperation, DataryWorkdirs,
             workdir = self.get_wdir_filetree(wdir_uuid)
 
             # flatten workdir to list
-            flatten_filetree = flatten(workdir, sep='/')
+            flatten_filetree = scrapbag.flatten(workdir, sep='/')
 
             filetree_keys = [
                 x for x in flatten_filetree.keys() if '__self' not in x]
@@ -4,20 +4,17 @@ Datary sdk Modify Operations File
 """
 import os
 import re
-import json
 import sys
 
 from urllib.parse import urljoin
-from requests_toolbelt import MultipartEncoder
 
 from datary.datasets import DataryDatasets
+from datary.requests.multipart import DataryMultipartStream
 from datary.operations.limits import DataryOperationLimits
-from scrapbag import (add_element, force_list, get_element, get_dimension,
-                      remove_list_duplicates, flatten, dict2orderedlist,
-                      exclude_empty_values)
-import structlog
+from datary.lazy import get_logger, lazy_module
 
-logger = structlog.getLogger(__name__)
+scrapbag = lazy_module('scrapbag')
+logger = get_logger(__name__)
 
 
 class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
@@ -36,26 +33,19 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
         wdir_uuid      str       working directory uuid
         element        dict      element (dict) with Datary model data fields.
         ============   ======   ===============================================
+
+        Returns:
+            (bool) if the file has been modified.
         """
         url = urljoin(self.URL_BASE,
                       "workdirs/{}/changes".format(wdir_uuid))
 
-        headers = kwargs.get('headers', self.headers)
-
-        payload = MultipartEncoder({
-            "blob": (
-                element.get('basename'),
-                json.dumps({
-                    '__kern': element.get('data', {}).get('kern'),
-                    '__meta': element.get('data', {}).get('meta'),
-                    }),
-                'application/json'),
+        # per call headers, merged with the client ones when it's sent.
+        headers = dict(kwargs.get('headers') or {})
 
-            "action": "modify",
-            "filemode": "100644",
-            "dirname": element.get('path'),
-            "basename": element.get('basename')
-        })
+        # the blob is encoded row by row while it's sent.
+        payload = DataryMultipartStream.for_change(
+            "modify", element, codec=self.codec)
 
         headers["Content-Type"] = payload.content_type
 
@@ -72,6 +62,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                 basename=element.get('basename'),
                 # element=element
                 )
+            return True
 
         else:
 
@@ -85,6 +76,8 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                 # element=element
                 )
 
+        return False
+
     def modify_file(self, wdir_uuid, element, mod_style='override', **kwargs):
         """
         Modifies an existing file in Datary.
@@ -99,25 +92,31 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                                             'update-row' mod_style,
                                             <callable> function to use.
         ===============   ===============   ==================================
+
+        Returns:
+            (bool) if the file has been modified.
         """
         # Override method
         if mod_style == 'override':
-            self.override_file(wdir_uuid, element, **kwargs)
+            return self.override_file(wdir_uuid, element, **kwargs)
 
         # Update Append method
         elif mod_style == 'update-append':
-            self.update_append_file(wdir_uuid, element, **kwargs)
+            return self.update_append_file(wdir_uuid, element, **kwargs)
 
         # TODO: ADD update-row method
 
         # Inject own modify solution method
         elif callable(mod_style):
-            mod_style(wdir_uuid, element, callback_request=self.modify_request)
+            return mod_style(
+                wdir_uuid, element, callback_request=self.modify_request)
 
         # Default..
         else:
             logger.error('NOT VALID modify style passed.')
 
+        return False
+
     def override_file(self, wdir_uuid, element, **kwargs):
         """
         Override an existing file in Datary.
@@ -128,10 +127,13 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
         wdir_uuid         str             working directory uuid
         element           list            [path, basename, data, sha1]
         ================  =============   ====================================
+
+        Returns:
+            (bool) if the file has been modified.
         """
         logger.info("Override an existing file in Datary.")
 
-        self.modify_request(wdir_uuid, element, **kwargs)
+        return self.modify_request(wdir_uuid, element, **kwargs)
 
     def update_append_file(self, wdir_uuid, element, repo_uuid, **kwargs):
         """
@@ -144,6 +146,8 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
         element           list            [path, basename, data, sha1]
         ================  =============   ====================================
 
+        Returns:
+            (bool) if the file has been modified.
         """
         logger.info("Update an existing file in Datary.")
         try:
@@ -175,7 +179,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
             }
 
             # send modify request
-            self.modify_request(wdir_uuid, element={
+            return self.modify_request(wdir_uuid, element={
                 "path": element.get('path', ''),
                 "basename": element.get('basename', ''),
                 "data": element.get('data')}, **kwargs)
@@ -186,6 +190,8 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                 workdir=wdir_uuid,
                 repo=repo_uuid)
 
+        return False
+
     def update_elements(self, stored_element, update_element):
         """
         Update one element with other.
@@ -232,7 +238,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                 (isinstance(stored_element.get('__kern'), dict)) and
                 (isinstance(update_element.get('data', {}).get('kern'), dict))
         ):
-            flatten_element_keys = list(flatten(
+            flatten_element_keys = list(scrapbag.flatten(
                 update_element.get('data', {}).get('kern'), sep='/').keys())
 
             element_keys = set(
@@ -243,7 +249,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
 
                 stored_axisheader = stored_element.get('__meta', {}).get(
                     'axisHeaders', {}).get(element_keypath, [])
-                stored_first_row = get_element(stored_element.get(
+                stored_first_row = scrapbag.get_element(stored_element.get(
                     '__kern', {}), element_keypath+"/0") or []
 
                 is_rowzero_header = self.calculate_rowzeroheader_confidence(
@@ -253,9 +259,9 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
 
                 # update kern
                 updated_keypath_array = self.update_arrays_elements(
-                    original_array=get_element(stored_element.get(
+                    original_array=scrapbag.get_element(stored_element.get(
                         '__kern', {}), element_keypath) or [],
-                    update_array=get_element(update_element.get(
+                    update_array=scrapbag.get_element(update_element.get(
                         'data', {}).get('kern', {}), element_keypath),
                     is_rowzero_header=is_rowzero_header
                 )
@@ -268,16 +274,16 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                     is_rowzero_header=is_rowzero_header)
 
                 # add updated kern to keypath
-                add_element(stored_element.get('__kern', {}),
-                            element_keypath,
-                            updated_keypath_array,
-                            override=True)
+                scrapbag.add_element(stored_element.get('__kern', {}),
+                                     element_keypath,
+                                     updated_keypath_array,
+                                     override=True)
 
                 # add updated meta to stored element
-                add_element(stored_element,
-                            '__meta',
-                            updated_keypath_meta,
-                            override=True)
+                scrapbag.add_element(stored_element,
+                                     '__meta',
+                                     updated_keypath_meta,
+                                     override=True)
 
         else:
             msg = 'Not compatible type elements to update {} - {}'
@@ -306,8 +312,8 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
         updated_meta.update(original_meta)
 
         try:
-            rows = get_element(
-                kern, '/'.join(exclude_empty_values([path_key])))
+            rows = scrapbag.get_element(
+                kern, '/'.join(scrapbag.exclude_empty_values([path_key])))
 
             if rows:
                 row_zero = rows[0] if isinstance(row_zero, list) else rows
@@ -315,7 +321,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                 if is_rowzero_header:
                     # Update axisheaders
                     axisheaders = {
-                        path_key: [force_list(x)[0] for x in rows],
+                        path_key: [scrapbag.force_list(x)[0] for x in rows],
                         os.path.join(path_key, "*"): row_zero
                     }
                 else:
@@ -329,16 +335,16 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
                     header = ['Header{}'.format(x) for x in list_range]
 
                     axisheaders = {
-                        path_key: [force_list(x)[0] for x in rows],
+                        path_key: [scrapbag.force_list(x)[0] for x in rows],
                         os.path.join(path_key, "*"): header
                     }
 
-                add_element(updated_meta, "axisHeaders", axisheaders)
+                scrapbag.add_element(updated_meta, "axisHeaders", axisheaders)
 
                 # Update dimension
-                dimension = get_dimension(rows) if path_key else {
-                    "": get_dimension(kern)}
-                add_element(
+                dimension = scrapbag.get_dimension(rows) if path_key else {
+                    "": scrapbag.get_dimension(kern)}
+                scrapbag.add_element(
                     updated_meta, '/'.join(["dimension", path_key]), dimension)
 
                 # update size
@@ -395,7 +401,7 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
             (list) merged and ordered headers.
         """
 
-        return remove_list_duplicates(header1 + header2)
+        return scrapbag.remove_list_duplicates(header1 + header2)
 
     def update_arrays_elements(self, original_array, update_array,
                                is_rowzero_header):
@@ -412,14 +418,14 @@ class DataryModifyOperation(DataryDatasets, DataryOperationLimits):
 
             for data in original_array[1:]:
                 result.append(
-                    dict2orderedlist(
+                    scrapbag.dict2orderedlist(
                         dict(zip(original_array[0], data)),
                         merged_headers,
                         default=''))
 
             for data in update_array[1:]:
                 result.append(
-                    dict2orderedlist(
+                    scrapbag.dict2orderedlist(
                         dict(zip(update_array[0], data)),
                         merged_headers,
                         default=''))
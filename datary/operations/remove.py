@@ -8,9 +8,9 @@ from urllib.parse import urljoin
 from datary.auth import DataryAuth
 from datary.operations.limits import DataryOperationLimits
 
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
@@ -43,11 +43,11 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
 
         payload = {"action": "delete",
                    "filemode": 40000,
-                   "basename": path,
+                   "dirname": path,
                    "basename": basename}
 
         response = self.request(
-            url, 'GET', **{'data': payload, 'headers': self.headers})
+            url, 'GET', **{'data': payload})
 
         if response:
             logger.info(
@@ -77,6 +77,8 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
         element           Dic             element with path & basename
         ================  =============   ====================================
 
+        Returns:
+            (bool) if the file has been deleted.
         """
         logger.info(
             "Delete file in workdir.",
@@ -89,12 +91,12 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
         payload = {
             "action": "remove",
             "filemode": 100644,
-            "basename": element.get('path'),
+            "dirname": element.get('path'),
             "basename": element.get('basename')
         }
 
         response = self.request(
-            url, 'POST', **{'data': payload, 'headers': self.headers})
+            url, 'POST', **{'data': payload})
 
         if response:
             logger.info(
@@ -103,6 +105,7 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
                 workdir=wdir_uuid,
                 path=element.get('path'),
                 basename=element.get('basename'))
+            return True
 
         else:
             logger.error(
@@ -112,6 +115,8 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
                 path=element.get('path'),
                 basename=element.get('basename'))
 
+        return False
+
     def delete_inode(self, wdir_uuid, inode):
         """
         Delete using inode.
@@ -131,7 +136,7 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
         payload = {"action": "remove", "inode": inode}
 
         response = self.request(
-            url, 'POST', **{'data': payload, 'headers': self.headers})
+            url, 'POST', **{'data': payload})
 
         if response:
             logger.info("Element has been deleted using inode.")
@@ -157,7 +162,7 @@ class DataryRemoveOperation(DataryAuth, DataryOperationLimits):
         url = urljoin(self.URL_BASE,
                       "workdirs/{}/changes".format(wdir_uuid))
 
-        response = self.request(url, 'DELETE', **{'headers': self.headers})
+        response = self.request(url, 'DELETE')
         if response:
             logger.info("Repo index has been cleared.")
             return True
@@ -5,9 +5,9 @@ Datary sdk Add Operations File
 from urllib.parse import urljoin
 from datary.auth import DataryAuth
 from datary.operations.limits import DataryOperationLimits
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryRenameOperation(DataryAuth, DataryOperationLimits):
@@ -48,6 +48,6 @@ class DataryRenameOperation(DataryAuth, DataryOperationLimits):
         }
 
         response = self.request(
-            url, 'POST', **{'data': payload, 'headers': self.headers})
+            url, 'POST', **{'data': payload})
         if response:
             logger.info("File has been renamed.", new_path=new_pathname)
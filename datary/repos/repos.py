@@ -6,9 +6,9 @@ from urllib.parse import urljoin
 from datary.members.members import DataryMembers
 from datary.categories import DataryCategories
 
-import structlog
+from datary.lazy import get_logger
 
-logger = structlog.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class DataryRepos(DataryMembers):
@@ -75,7 +75,7 @@ class DataryRepos(DataryMembers):
 
             # Create repo request.
             _response = self.request(
-                url, 'POST', **{'data': payload, 'headers': self.headers})
+                url, 'POST', **{'data': payload})
 
         describe_response = self.get_describerepo(
             repo_name=repo_name, **kwargs)
@@ -110,8 +110,8 @@ class DataryRepos(DataryMembers):
                 self.URL_BASE,
                 "repos/{}".format(repo_uuid) if repo_uuid else "me/repos")
 
-            response = self.request(url, 'GET', **{'headers': self.headers})
-            repos_data = response.json() if response else {}
+            response = self.request(url, 'GET')
+            repos_data = self.response_json(response) if response else {}
 
         if isinstance(repos_data, list) and (repo_uuid or repo_name):
             for repo_data in repos_data:
@@ -148,6 +148,6 @@ class DataryRepos(DataryMembers):
             raise ValueError('Must pass the repo uuid to delete the repo.')
 
         url = urljoin(self.URL_BASE, "repos/{}".format(repo_uuid))
-        response = self.request(url, 'DELETE', **{'headers': self.headers})
+        response = self.request(url, 'DELETE')
 
         return response.text if response else None
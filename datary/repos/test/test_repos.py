@@ -13,7 +13,7 @@ class DataryReposTestCase(DataryTestCase):
     DataryRepos Test case
     """
 
-    @mock.patch('datary.requests.requests.requests')
+    @mock.patch.object(DataryTestCase.datary, 'session')
     @mock.patch('datary.repos.DataryRepos.get_describerepo')
     def test_create_repo(self, mock_describerepo, mock_request):
         """
@@ -40,7 +40,7 @@ class DataryReposTestCase(DataryTestCase):
         self.assertEqual(mock_describerepo.call_count, 3)
         self.assertEqual(repo4, {})
 
-    @mock.patch('datary.requests.requests.requests')
+    @mock.patch.object(DataryTestCase.datary, 'session')
     @mock.patch('datary.members.members.DataryMembers.get_member_repos')
     def test_describerepo(self, mock_get_member_repo, mock_request):
         """
@@ -89,7 +89,7 @@ class DataryReposTestCase(DataryTestCase):
         repo6 = self.datary.get_describerepo(repo_name='test_repo2')
         self.assertEqual(repo6, {})
 
-    @mock.patch('datary.requests.requests.requests')
+    @mock.patch.object(DataryTestCase.datary, 'session')
     def test_deleterepo(self, mock_request):
         """
         Test deleterepo
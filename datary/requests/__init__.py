@@ -1,5 +1,49 @@
 # -*- coding: utf-8 -*-
 """
 Datary Requests Module
+
+Its classes are imported on their first use, as the ones of the sdk.
 """
-from .requests import DataryRequests
+import importlib
+
+# classes by the module defining them, imported on first access.
+_LAZY_ATTRIBUTES = {
+    'DataryRequests': '.requests',
+    'DataryRetryPolicy': '.retry',
+    'DataryTokenBucket': '.limiter',
+    'DataryFileTokenBucket': '.limiter',
+    'DataryRateLimiter': '.limiter',
+    'DataryResponseCache': '.cache',
+    'DataryRequestEvent': '.hooks',
+    'DataryRequestObserver': '.hooks',
+    'DataryHistogram': '.metrics',
+    'DataryMetrics': '.metrics',
+    'DataryRequestBudget': '.budget',
+    'DataryRequestBudgetExceeded': '.budget',
+    'DataryJsonCodec': '.codec',
+    'DataryOrjsonCodec': '.codec',
+    'get_codec': '.codec',
+    'DataryResponse': '.response',
+    'DataryMultipartStream': '.multipart',
+    'DataryCompressedBody': '.compression',
+    'DataryRequestCoalescer': '.singleflight',
+    'DataryHedgingPolicy': '.hedging',
+    'DataryCircuitBreaker': '.breaker',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Circuit Breaker File
+"""
+import time
+import threading
+
+from datary.lazy import get_logger
+
+logger = get_logger(__name__)
+
+
+class DataryCircuit(object):
+    """
+    Circuit state of an endpoint.
+    """
+
+    __slots__ = ('state', 'failures', 'opened_at', 'trials')
+
+    def __init__(self):
+        self.state = DataryCircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trials = 0
+
+
+class DataryCircuitBreaker(object):
+    """
+    Circuit breaker by endpoint template (e.g. `workdirs/{}/changes`), so a
+    degraded api fails fast instead of every request waiting its timeouts:
+
+    - closed: requests are sent, consecutive failures (connection errors,
+      timeouts and 5xx responses) are counted.
+    - open: after `failure_threshold` consecutive failures requests fail
+      without being sent, for `recovery_timeout` seconds.
+    - half open: then `half_open_calls` trial requests are sent, the
+      circuit closes on a success and opens again on a failure.
+
+    A breaker can be shared between clients of the same api.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0,
+                 half_open_calls=1):
+        """
+        DataryCircuitBreaker Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        failure_threshold int             consecutive failures opening the
+                                          circuit of an endpoint (default 5)
+        recovery_timeout  float           seconds an open circuit fails fast
+                                          before trying again (default 30)
+        half_open_calls   int             trial requests of a half open
+                                          circuit (default 1)
+        ================  =============   ====================================
+        """
+        super(DataryCircuitBreaker, self).__init__()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def clock():
+        """
+        Returns:
+            (float) seconds of the breaker clock.
+        """
+        return time.monotonic()
+
+    @staticmethod
+    def is_failure(status_code=None, exception=None):
+        """
+        Returns:
+            (bool) if a request outcome is a failure of the api.
+        """
+        return exception is not None or (
+            status_code is not None and status_code >= 500)
+
+    def circuit(self, endpoint):
+        """
+        Returns:
+            (DataryCircuit) circuit of the endpoint (lock held).
+        """
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = DataryCircuit()
+        return circuit
+
+    def state(self, endpoint):
+        """
+        Returns:
+            (str) circuit state of the endpoint (closed, open, half_open).
+        """
+        with self._lock:
+            circuit = self.circuit(endpoint)
+            if (circuit.state == self.OPEN and
+                    self.clock() - circuit.opened_at >=
+                    self.recovery_timeout):
+                return self.HALF_OPEN
+            return circuit.state
+
+    def allow(self, endpoint):
+        """
+        Returns:
+            (bool) if a request of the endpoint can be sent, taking a trial
+            of a half open circuit.
+        """
+        with self._lock:
+            circuit = self.circuit(endpoint)
+
+            if circuit.state == self.OPEN:
+                if self.clock() - circuit.opened_at < self.recovery_timeout:
+                    return False
+
+                circuit.state = self.HALF_OPEN
+                circuit.trials = 0
+                logger.info(
+                    'Circuit breaker half open, trying requests again.',
+                    endpoint=endpoint)
+
+            if circuit.state == self.HALF_OPEN:
+                if circuit.trials >= self.half_open_calls:
+                    return False
+                circuit.trials += 1
+
+            return True
+
+    def release(self, endpoint):
+        """
+        Gives back the trial of a request of the endpoint ended without an
+        api outcome (e.g. a client error).
+        """
+        with self._lock:
+            circuit = self.circuit(endpoint)
+            if circuit.state == self.HALF_OPEN and circuit.trials:
+                circuit.trials -= 1
+
+    def record(self, endpoint, status_code=None, exception=None):
+        """
+        Records the outcome of a request of the endpoint, opening or closing
+        its circuit.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        endpoint          str             endpoint template
+        status_code       int             response status
+        exception         Exception       request exception
+        ================  =============   ====================================
+        """
+        failure = self.is_failure(status_code, exception)
+
+        with self._lock:
+            circuit = self.circuit(endpoint)
+
+            if not failure:
+                if circuit.state != self.CLOSED:
+                    logger.info(
+                        'Circuit breaker closed, requests succeed again.',
+                        endpoint=endpoint)
+                circuit.state = self.CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+
+            if (circuit.state == self.HALF_OPEN or
+                    circuit.state == self.CLOSED and
+                    circuit.failures >= self.failure_threshold):
+                circuit.state = self.OPEN
+                circuit.opened_at = self.clock()
+                logger.warning(
+                    'Circuit breaker open, requests fail fast for {} '
+                    'seconds.'.format(self.recovery_timeout),
+                    endpoint=endpoint,
+                    failures=circuit.failures,
+                    code=status_code,
+                    error=None if exception is None else str(exception))
+
+    def dump(self):
+        """
+        Returns:
+            (dict) json serializable state and consecutive failures by
+            endpoint.
+        """
+        return {
+            endpoint: {
+                'state': self.state(endpoint),
+                'failures': self._circuits[endpoint].failures}
+            for endpoint in sorted(list(self._circuits))}
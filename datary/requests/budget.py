@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Budget File
+"""
+import sys
+import threading
+
+from collections import Counter
+
+from .hooks import DataryRequestObserver
+
+
+class DataryRequestBudgetExceeded(AssertionError):
+    """
+    Datary exception for request budget exceeded.
+    """
+
+    def __init__(self, msg='', budget=None):
+        super(DataryRequestBudgetExceeded, self).__init__(msg)
+        self.msg = msg
+        self.budget = budget
+
+    def __str__(self):
+        return self.msg
+
+
+class DataryRequestBudget(DataryRequestObserver):
+    """
+    Records every request done by a client inside a block, by endpoint and
+    by the sdk method doing it, and checks an upper bound of requests when
+    the block ends:
+
+        >>> with DataryRequestBudget(datary, max_requests=110) as budget:
+        ...     datary.operation_commit(wdir_uuid, last_commit, commit)
+        >>> budget.by_caller.most_common(3)
+
+    Requests done from other threads of the client (concurrent operations)
+    are recorded too, and the hedges of the requests (see
+    DataryHedgingPolicy). Retries are not counted unless `count_retries`.
+
+    Every recorded call has two sdk methods, found inspecting the stack:
+    - caller: the nearest public sdk method, the one doing the request
+      (e.g. `get_wdir_filetree`).
+    - entry: the outermost public sdk method of the thread, the one called
+      by the user code (e.g. `get_dataset_uuid`), or the one run by a
+      worker thread (e.g. `apply_operation`).
+    """
+
+    # sdk modules whose frames are not sdk methods.
+    IGNORED_MODULES = ('datary.requests', 'datary.aio', 'datary.loadtest')
+
+    # sdk methods sending the requests of the others.
+    IGNORED_METHODS = ('request',)
+
+    def __init__(self, client, max_requests=None, count_retries=False):
+        """
+        DataryRequestBudget Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        client            DataryRequests  client to record
+        max_requests      int             max requests of the block, checked
+                                          when it ends (default None, no
+                                          bound)
+        count_retries     bool            count every try of the requests
+                                          (default False)
+        ================  =============   ====================================
+        """
+        super(DataryRequestBudget, self).__init__()
+        self.client = client
+        self.max_requests = max_requests
+        self.count_retries = count_retries
+        self.lock = threading.Lock()
+        self.calls = []
+        self.by_endpoint = Counter()
+        self.by_caller = Counter()
+        self.by_entry = Counter()
+        self._methods = {}
+
+    def __enter__(self):
+        self.client.add_observer(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.client.remove_observer(self)
+
+        if exc_type is None and self.max_requests is not None:
+            self.assert_at_most(self.max_requests)
+
+    @property
+    def count(self):
+        """
+        Returns:
+            (int) requests recorded.
+        """
+        return len(self.calls)
+
+    @classmethod
+    def sdk_methods(cls, frame):
+        """
+        Returns:
+            (list) public sdk methods names of the stack, innermost first.
+        """
+        methods = []
+
+        while frame is not None:
+            module = frame.f_globals.get('__name__', '')
+            name = frame.f_code.co_name
+
+            if (module.startswith('datary.') and
+                    not module.startswith(cls.IGNORED_MODULES) and
+                    '.test.' not in module and
+                    not name.startswith('_') and
+                    name not in cls.IGNORED_METHODS and
+                    # methods, not closures of them
+                    hasattr(type(frame.f_locals.get('self')), name)):
+                methods.append(name)
+
+            frame = frame.f_back
+
+        return methods
+
+    def on_request_start(self, event):
+        if event.retry and not self.count_retries:
+            return
+
+        if event.hedge_of is None:
+            methods = self.sdk_methods(sys._getframe(1))
+        else:
+            # hedges are sent from the policy threads, charged to the sdk
+            # methods of the request they hedge.
+            with self.lock:
+                methods = self._methods.pop(event.hedge_of, [])
+
+        caller = methods[0] if methods else None
+        entry = methods[-1] if methods else None
+        endpoint = '{} {}'.format(event.http_method, event.endpoint)
+
+        with self.lock:
+            if event.hedge_of is None:
+                self._methods[event] = methods
+            self.calls.append({
+                'endpoint': endpoint,
+                'attempt': event.attempt,
+                'caller': caller,
+                'entry': entry,
+                'hedge': event.hedge_of is not None,
+            })
+            self.by_endpoint[endpoint] += 1
+            self.by_caller[caller] += 1
+            self.by_entry[entry] += 1
+
+    def on_request_end(self, event):
+        # the methods of hedged requests are kept for their hedge.
+        if not event.hedged:
+            with self.lock:
+                self._methods.pop(event, None)
+
+    def summary(self):
+        """
+        Returns:
+            (str) recorded requests by endpoint and by sdk method.
+        """
+        lines = ['{} requests'.format(self.count)]
+        for title, counter in [('endpoint', self.by_endpoint),
+                               ('caller', self.by_caller)]:
+            for key, count in counter.most_common():
+                lines.append('  {:>5}  {} {}'.format(count, title, key))
+        return '\n'.join(lines)
+
+    def assert_at_most(self, max_requests, endpoint=None, caller=None):
+        """
+        Checks an upper bound of requests, of all of them or only the ones
+        of an endpoint (e.g. `GET workdirs/{}/filetree`) or of an sdk
+        method.
+
+        Raises:
+            DataryRequestBudgetExceeded: more requests than max_requests.
+        """
+        if endpoint is not None:
+            count = self.by_endpoint[endpoint]
+        elif caller is not None:
+            count = self.by_caller[caller]
+        else:
+            count = self.count
+
+        if count > max_requests:
+            msg = '{} requests{} exceeds the budget of {}\n{}'.format(
+                count,
+                ' of {}'.format(endpoint or caller)
+                if endpoint or caller else '',
+                max_requests,
+                self.summary())
+            raise DataryRequestBudgetExceeded(msg, budget=self)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Response Cache File
+"""
+import threading
+
+from collections import OrderedDict
+
+from .codec import get_codec
+from .response import DataryResponse
+
+
+class DataryCachedResponse(DataryResponse):
+    """
+    Response served from the response cache, decoding the cached body.
+    """
+
+    status_code = 200
+
+    def __init__(self, url, headers, content, codec):
+        """
+        DataryCachedResponse Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        headers           dict            headers of the cached response
+        content           bytes           cached body
+        codec             Codec           json codec of the body
+        ================  =============   ====================================
+        """
+        super(DataryCachedResponse, self).__init__(None, codec, content)
+        self.url = url
+        self.headers = headers
+
+    def __bool__(self):
+        return True
+
+    def copy(self):
+        return DataryCachedResponse(
+            self.url, self.headers, self.body(), self.codec)
+
+
+class DataryResponseCache(object):
+    """
+    Conditional GET response cache.
+
+    Stores the body of GET responses with validators (`ETag`,
+    `Last-Modified`) and revalidates them sending `If-None-Match` and
+    `If-Modified-Since`. A `304 Not Modified` serves the stored body
+    without downloading it again.
+
+    The body bytes are stored, every response served decodes its own
+    object from them, so it can be mutated by its caller.
+    """
+
+    _DEFAULT_MAX_ENTRIES = 128
+
+    def __init__(self, max_entries=_DEFAULT_MAX_ENTRIES):
+        """
+        DataryResponseCache Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        max_entries       int             max responses stored (LRU)
+        ================  =============   ====================================
+        """
+        super(DataryResponseCache, self).__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @classmethod
+    def key(cls, url, params=None, headers=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        params            dict            request query params
+        headers           dict            request headers
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) cache key of a request, different for each user.
+        """
+        return (
+            url,
+            tuple(sorted((params or {}).items())),
+            (headers or {}).get('Authorization'))
+
+    def get(self, key):
+        """
+        Returns:
+            (dict) cache entry of the key or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def clear(self):
+        """
+        Remove every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def prepare(self, url, kwargs):
+        """
+        Add the conditional headers of the cached entry to the request.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        kwargs            dict            request arguments
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) cache key, cache entry (or None), request arguments.
+        """
+        key = self.key(url, kwargs.get('params'), kwargs.get('headers'))
+        entry = self.get(key)
+
+        if entry is not None:
+            headers = dict(kwargs.get('headers') or {})
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs = dict(kwargs, headers=headers)
+
+        return key, entry, kwargs
+
+    def response(self, entry):
+        """
+        Returns:
+            (DataryCachedResponse) response with the entry cached body.
+        """
+        return DataryCachedResponse(
+            entry.get('url'), entry.get('headers'), entry.get('content'),
+            entry.get('codec'))
+
+    def store(self, key, response, codec=None):
+        """
+        Store the response if it has validators.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        key               tuple           cache key of the request
+        response          Response        response with a 2xx status
+        codec             Codec           json codec of the body (default
+                                          the response one or get_codec())
+        ================  =============   ====================================
+
+        Returns:
+            response to return to the caller.
+        """
+        headers = response.headers or {}
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if not (etag or last_modified):
+            return response
+
+        codec = codec or getattr(response, 'codec', None) or get_codec()
+
+        # body bytes, encoded again only if the response hasn't them.
+        content = response.content
+        if not isinstance(content, bytes):
+            content = codec.dumpb(codec.decode(response))
+
+        entry = {
+            'url': getattr(response, 'url', key[0]),
+            'headers': headers,
+            'etag': etag,
+            'last_modified': last_modified,
+            'content': content,
+            'codec': codec,
+        }
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return response
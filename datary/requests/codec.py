@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Json Codec File
+"""
+import itertools
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class DataryJsonCodec(object):
+    """
+    Json codec of the request bodies and responses, stdlib json backend.
+
+    Codecs decode straight from the response body bytes, without the text
+    decoding (and charset guessing) of `response.json()`.
+    """
+
+    name = 'json'
+
+    # separators of dumpb, iterdumpb chunks join into the same document.
+    item_separator = b', '
+    key_separator = b': '
+
+    # rows of the lists encoded at once by iterdumpb.
+    ITER_BATCH = 1000
+
+    def dumps(self, value):
+        """
+        Returns:
+            (str) json of the value.
+        """
+        return json.dumps(value)
+
+    def dumpb(self, value):
+        """
+        Returns:
+            (bytes) utf-8 json of the value.
+        """
+        return json.dumps(value).encode('utf-8')
+
+    def iterdumpb(self, value):
+        """
+        Incremental json encoding, objects are walked and the items of
+        lists (rows of a kern) are encoded by batches of ITER_BATCH rows,
+        so only a batch is in memory. Any other iterable (a generator of
+        rows) is encoded as a list. The chunks join into the
+        `dumpb(value)` bytes.
+
+        Yields:
+            (bytes) utf-8 json chunks of the value.
+        """
+        if isinstance(value, dict):
+            yield b'{'
+            for index, (key, item) in enumerate(value.items()):
+                if not isinstance(key, str):
+                    key = self.dumps(key).strip('"')
+                yield (self.item_separator if index else b'') + (
+                    self.dumpb(key) + self.key_separator)
+                for chunk in self.iterdumpb(item):
+                    yield chunk
+            yield b'}'
+
+        elif isinstance(value, (str, bytes)) or not hasattr(
+                value, '__iter__'):
+            yield self.dumpb(value)
+
+        else:
+            # rows are encoded by batches, without their brackets.
+            rows = iter(value)
+            batch = list(itertools.islice(rows, self.ITER_BATCH))
+            yield b'['
+            while batch:
+                yield self.dumpb(batch)[1:-1]
+                batch = list(itertools.islice(rows, self.ITER_BATCH))
+                if batch:
+                    yield self.item_separator
+            yield b']'
+
+    def loads(self, data):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        data              bytes or str    json document
+        ================  =============   ====================================
+
+        Returns:
+            decoded value.
+
+        Raises:
+            ValueError: data is not a json document.
+        """
+        return json.loads(data)
+
+    def decode(self, response):
+        """
+        Decode a response body, straight from its bytes when it has them
+        (already decoded responses use their `json()`).
+
+        Returns:
+            decoded response body.
+
+        Raises:
+            ValueError: body is not a json document.
+        """
+        content = getattr(response, 'content', None)
+
+        if not isinstance(content, bytes):
+            return response.json()
+
+        return self.loads(content)
+
+
+class DataryOrjsonCodec(DataryJsonCodec):
+    """
+    Json codec with the orjson backend, several times faster encoding and
+    decoding big kerns. Non str keys are encoded as str like stdlib does,
+    NaN and Infinity are encoded as null.
+    """
+
+    name = 'orjson'
+
+    item_separator = b','
+    key_separator = b':'
+
+    def __init__(self):
+        super(DataryOrjsonCodec, self).__init__()
+        if orjson is None:
+            raise ImportError('orjson codec requires the orjson package')
+        self.option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value):
+        return orjson.dumps(value, option=self.option).decode('utf-8')
+
+    def dumpb(self, value):
+        return orjson.dumps(value, option=self.option)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+# available codecs by name.
+CODECS = {
+    DataryJsonCodec.name: DataryJsonCodec,
+    DataryOrjsonCodec.name: DataryOrjsonCodec,
+}
+
+
+def get_codec(codec=None):
+    """
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    codec             str or codec    codec name ('json', 'orjson'), a
+                                      codec instance or None ('auto',
+                                      orjson when installed)
+    ================  =============   ====================================
+
+    Returns:
+        (DataryJsonCodec) json codec.
+    """
+    if codec is None or codec == 'auto':
+        codec = DataryOrjsonCodec.name if orjson is not None else (
+            DataryJsonCodec.name)
+
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError('Unknown json codec {}'.format(codec))
+        return CODECS[codec]()
+
+    return codec
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Compression File
+"""
+import zlib
+
+from datary.lazy import get_logger, lazy_module
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+urllib3_response = lazy_module('urllib3.response')
+logger = get_logger(__name__)
+
+
+def compressor(encoding, level=None):
+    """
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    encoding          str             content encoding ('gzip', 'zstd')
+    level             int             compression level (default the
+                                      encoding one)
+    ================  =============   ====================================
+
+    Returns:
+        incremental compressor, with `compress(data)` and `flush()`.
+
+    Raises:
+        ValueError: unknown encoding.
+        ImportError: zstd without the zstandard package.
+    """
+    if encoding == 'gzip':
+        return zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+            zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    if encoding == 'zstd':
+        if zstandard is None:
+            raise ImportError(
+                'zstd compression requires the zstandard package')
+        return zstandard.ZstdCompressor(
+            level=3 if level is None else level).compressobj()
+
+    raise ValueError('Unknown content encoding {}'.format(encoding))
+
+
+def decompressor(encoding):
+    """
+    Returns:
+        incremental decompressor of a content encoding ('gzip', 'deflate'
+        or 'zstd'), with `decompress(data)`.
+
+    Raises:
+        ValueError: unknown encoding.
+        ImportError: zstd without the zstandard package.
+    """
+    if encoding == 'gzip':
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    if encoding == 'deflate':
+        return zlib.decompressobj()
+
+    if encoding == 'zstd':
+        if zstandard is None:
+            raise ImportError(
+                'zstd compression requires the zstandard package')
+        return zstandard.ZstdDecompressor().decompressobj()
+
+    raise ValueError('Unknown content encoding {}'.format(encoding))
+
+
+def encodings():
+    """
+    Returns:
+        (list) request content encodings available.
+    """
+    return ['gzip'] + (['zstd'] if zstandard is not None else [])
+
+
+def response_encodings():
+    """
+    Returns:
+        (list) response content encodings urllib3 decodes while they're
+        read, the ones of its installed decoders.
+    """
+    available = ['gzip', 'deflate']
+    if getattr(urllib3_response, 'brotli', None) is not None:
+        available.append('br')
+    if getattr(urllib3_response, 'HAS_ZSTD', False):
+        available.append('zstd')
+    return available
+
+
+def accept_encoding(value=None):
+    """
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    value             str             wanted Accept-Encoding (e.g.
+                                      'gzip, zstd'), default every
+                                      response encoding
+    ================  =============   ====================================
+
+    Returns:
+        (str) Accept-Encoding advertising only the encodings of the value
+        that can be decoded, 'identity' if none.
+    """
+    available = response_encodings()
+    if value is None:
+        return ', '.join(available)
+
+    tokens, dropped = [], []
+    for token in value.split(','):
+        token = token.strip()
+        name = token.split(';')[0].strip().lower()
+        if not name:
+            continue
+        if name in available or name == 'identity':
+            tokens.append(token)
+        else:
+            dropped.append(name)
+
+    if dropped:
+        logger.warning(
+            'Response encodings not decoded, not accepted.',
+            encodings=dropped, available=available)
+
+    return ', '.join(tokens) or 'identity'
+
+
+class DataryCompressedBody(object):
+    """
+    Compressed streamed request body, compressing a file like body (as a
+    DataryMultipartStream) while requests reads it. Its compressed length
+    is unknown until it's read, so it's sent with chunked transfer
+    encoding; it's rewound as the body it wraps.
+    """
+
+    _DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, body, encoding='gzip', level=None,
+                 chunk_size=_DEFAULT_CHUNK_SIZE):
+        """
+        DataryCompressedBody Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        body              file like       body to compress, with read()
+        encoding          str             content encoding ('gzip', 'zstd')
+        level             int             compression level
+        chunk_size        int             bytes read from the body at once
+        ================  =============   ====================================
+        """
+        super(DataryCompressedBody, self).__init__()
+        self.body = body
+        self.encoding = encoding
+        self.level = level
+        self.chunk_size = chunk_size
+        self.rewind(body=False)
+
+    @property
+    def len(self):
+        """
+        Returns:
+            None, the compressed length is unknown.
+        """
+        return None
+
+    @property
+    def rewindable(self):
+        """
+        Returns:
+            (bool) if the body can be read again.
+        """
+        return getattr(self.body, 'rewindable', hasattr(self.body, 'rewind'))
+
+    def read(self, size=-1):
+        """
+        Returns:
+            (bytes) next size (or less) compressed bytes, b'' at the end.
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            data = self.body.read(self.chunk_size)
+            if data:
+                self.content_bytes += len(data)
+                self._buffer += self._compressor.compress(data)
+            else:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self.sent += len(data)
+        return data
+
+    def rewind(self, body=True):
+        """
+        Rewind the body to be sent again (retrying its request).
+
+        Raises:
+            ValueError: the body can be read only once.
+        """
+        if body:
+            if not self.rewindable:
+                raise ValueError('Request body can be read only once')
+            self.body.rewind()
+
+        self._compressor = compressor(self.encoding, self.level)
+        self._buffer = b''
+        self._eof = False
+        self.sent = 0
+        self.content_bytes = 0
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
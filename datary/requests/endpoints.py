@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Endpoints File
+"""
+from urllib.parse import urlparse
+
+# Datary api collections whose next path segment is an entity identifier.
+DATARY_COLLECTIONS = ('commits', 'datasets', 'members', 'repos', 'workdirs')
+
+
+def endpoint_template(url):
+    """
+    Turns a Datary api url into its endpoint template, replacing entity
+    identifiers with `{}` (e.g. `workdirs/{}/changes`).
+
+    ================  =============   ====================================
+    Parameter         Type            Description
+    ================  =============   ====================================
+    url               str             Datary api url
+    ================  =============   ====================================
+
+    Returns:
+        (str) endpoint template of the url.
+    """
+    segments = urlparse(url).path.strip('/').split('/')
+
+    for index in range(1, len(segments)):
+        if segments[index - 1] in DATARY_COLLECTIONS:
+            segments[index] = '{}'
+
+    return '/'.join(segments)
@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Hedging File
+"""
+import time
+import heapq
+import bisect
+import socket
+import itertools
+import threading
+
+from collections import deque
+
+from datary.lazy import lazy_module
+
+concurrent_futures = lazy_module('concurrent.futures')
+
+# hedged request whose primary is sent by the current thread.
+_primary = threading.local()
+
+
+class DataryHedgedRequest(object):
+    """
+    A hedged request: its primary, sent by the calling thread, and its hedge,
+    sent by the policy threads once the delay passes. The first usable
+    response wins, a winning hedge cancels the primary in flight closing its
+    connection.
+    """
+
+    __slots__ = (
+        'lock', 'done', 'hedge_done', 'primary_done', 'sent', 'winner',
+        'response', 'connection')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.hedge_done = threading.Event()
+        self.primary_done = False
+        self.sent = False
+        self.winner = None
+        self.response = None
+        self.connection = None
+
+    def track(self, connection):
+        """
+        Keeps the connection of the primary in flight (None once released).
+        """
+        with self.lock:
+            self.connection = connection
+
+    def cancel(self):
+        """
+        Cancels the primary in flight shutting down its socket, its thread
+        gets a connection error (lock held).
+        """
+        sock = getattr(self.connection, 'sock', None)
+        if self.primary_done or sock is None:
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except (OSError, ValueError):
+            pass
+
+
+def tracked_pool_class(pool_class):
+    """
+    Returns:
+        (type) urllib3 connection pool class keeping the connection of the
+        hedged primaries in flight, so a winning hedge can cancel them.
+    """
+    def _get_conn(self, *args, **kwargs):
+        connection = pool_class._get_conn(self, *args, **kwargs)
+        hedged = getattr(_primary, 'request', None)
+        if hedged is not None:
+            hedged.track(connection)
+        return connection
+
+    def _put_conn(self, connection):
+        hedged = getattr(_primary, 'request', None)
+        if hedged is not None:
+            hedged.track(None)
+        return pool_class._put_conn(self, connection)
+
+    return type(pool_class.__name__, (pool_class,), {
+        '_get_conn': _get_conn, '_put_conn': _put_conn})
+
+
+class DataryHedgingPolicy(object):
+    """
+    Hedged GET requests, cutting the latency tail of slow replicas: if a
+    GET has no response after a delay (a percentile of the recent latencies
+    of its endpoint), an identical request is sent and the first response
+    is used, the other one discarded.
+
+    Requests are sent by their calling thread, only the hedges by the
+    policy threads. A winning hedge cancels the request in flight closing
+    its connection, on sessions tracked by the policy (see `track`).
+
+    Hedges are bounded by a budget: every hedgeable request earns
+    `max_ratio` of a hedge, up to `burst` hedges, so they add at most
+    `max_ratio` extra requests. A policy can be shared between clients.
+
+    The policy threads are started on the first hedged request and stopped
+    by `close()` (closing a client closes its policy), they're started
+    again if it's used afterwards.
+    """
+
+    def __init__(self, percentile=95, delay=None, min_delay=0.005,
+                 max_ratio=0.05, burst=5, window=1000, min_samples=20,
+                 max_workers=16):
+        """
+        DataryHedgingPolicy Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        percentile        float           latency percentile of an endpoint
+                                          waited before hedging (default 95)
+        delay             float           fixed seconds waited before hedging
+                                          instead of the percentile
+        min_delay         float           min seconds waited before hedging
+        max_ratio         float           max extra requests of the hedges
+                                          (default 0.05, 5%)
+        burst             float           max hedges sent in a row
+        window            int             latencies kept by endpoint
+        min_samples       int             latencies of an endpoint needed to
+                                          hedge its requests
+        max_workers       int             threads sending the hedges
+        ================  =============   ====================================
+        """
+        super(DataryHedgingPolicy, self).__init__()
+        self.percentile = percentile
+        self.fixed_delay = delay
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._credit = 0.0
+        self._latencies = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._timers = []
+        self._timers_ready = threading.Condition()
+        self._timers_count = itertools.count()
+        self._timer = None
+
+    @staticmethod
+    def is_hedgeable(http_method, kwargs):
+        """
+        Returns:
+            (bool) if a request can be hedged: GETs without body, not
+            streamed.
+        """
+        return (
+            http_method == 'GET' and not kwargs.get('stream') and
+            kwargs.get('data') is None)
+
+    @property
+    def executor(self):
+        """
+        Returns:
+            (ThreadPoolExecutor) threads sending the hedges, made on the
+            first use.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent_futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='datary-hedge')
+            return self._executor
+
+    def delay(self, endpoint):
+        """
+        Returns:
+            (float) seconds to wait before hedging a request of the endpoint,
+            None if it's not hedged (not enough latencies yet).
+        """
+        if self.fixed_delay is not None:
+            return max(self.fixed_delay, self.min_delay)
+
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies[1]) < self.min_samples:
+                return None
+            latencies = latencies[1]
+            rank = int(round(
+                self.percentile / 100.0 * (len(latencies) - 1)))
+            return max(latencies[rank], self.min_delay)
+
+    def observe(self, endpoint, duration):
+        """
+        Adds a request latency of the endpoint.
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = (deque(), [])
+
+            # window in arrival order, and sorted for the percentiles.
+            window, ordered = latencies
+            window.append(duration)
+            bisect.insort(ordered, duration)
+            if len(window) > self.window:
+                del ordered[bisect.bisect_left(ordered, window.popleft())]
+
+    def acquire(self):
+        """
+        Returns:
+            (bool) if the budget allows a hedge, taking it.
+        """
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            self.hedges += 1
+            return True
+
+    @staticmethod
+    def succeeded(response):
+        """
+        Returns:
+            (bool) if a request got a response worth using.
+        """
+        if response is None:
+            return False
+        status_code = getattr(response, 'status_code', 200)
+        return status_code < 500 and status_code != 429
+
+    @staticmethod
+    def discard(response):
+        """
+        Release the connection of a response not used.
+        """
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+
+    @staticmethod
+    def track(session):
+        """
+        Tracks the connections of the session pools, so a winning hedge can
+        cancel its request in flight. Requests of untracked sessions end
+        before their hedge response is used.
+        """
+        for adapter in session.adapters.values():
+            poolmanager = getattr(adapter, 'poolmanager', None)
+            if poolmanager is None:
+                continue
+            poolmanager.pool_classes_by_scheme = {
+                scheme: tracked_pool_class(pool_class)
+                for scheme, pool_class in
+                poolmanager.pool_classes_by_scheme.items()}
+
+    def schedule(self, deadline, hedged, hedge):
+        """
+        Sends the hedge of a request at the deadline, unless the request
+        has ended.
+        """
+        with self._timers_ready:
+            heapq.heappush(
+                self._timers,
+                (deadline, next(self._timers_count), hedged, hedge))
+            if self._timer is None:
+                self._timer = threading.Thread(
+                    target=self._run_timers, name='datary-hedge-timer',
+                    daemon=True)
+                self._timer.start()
+            self._timers_ready.notify()
+
+    def _run_timers(self):
+        # a single thread waits for the deadlines of every request, until
+        # the policy is closed.
+        timer = threading.current_thread()
+        while True:
+            with self._timers_ready:
+                while not self._timers and self._timer is timer:
+                    self._timers_ready.wait()
+                if self._timer is not timer:
+                    return
+
+                deadline, _, hedged, hedge = self._timers[0]
+                wait = deadline - time.perf_counter()
+                if not hedged.done.is_set() and wait > 0:
+                    self._timers_ready.wait(wait)
+                    continue
+                heapq.heappop(self._timers)
+
+            with hedged.lock:
+                if hedged.primary_done or not self.acquire():
+                    continue
+                hedged.sent = True
+
+            try:
+                self.executor.submit(self._send_hedge, hedged, hedge)
+            except RuntimeError:
+                # executor shut down, the request goes on unhedged.
+                with hedged.lock:
+                    hedged.sent = False
+                hedged.hedge_done.set()
+
+    def _send_hedge(self, hedged, hedge):
+        # policy thread: sends the hedge, cancelling the request if it wins.
+        try:
+            response = hedge()
+        except Exception:
+            response = None
+
+        with hedged.lock:
+            won = hedged.winner is None and self.succeeded(response)
+            if won:
+                hedged.winner = 'hedge'
+                hedged.response = response
+                hedged.cancel()
+        hedged.hedge_done.set()
+
+        if not won and response is not None:
+            self.discard(response)
+
+    def close(self):
+        """
+        Stops the policy threads, waiting for the hedges in flight. Hedges
+        not sent yet aren't sent, their requests go on unhedged.
+        """
+        with self._timers_ready:
+            timer, self._timer = self._timer, None
+            self._timers = []
+            self._timers_ready.notify_all()
+
+        if timer is not None:
+            timer.join()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def call(self, endpoint, function, hedge=None):
+        """
+        Sends a request calling the function from the current thread,
+        hedging it after the delay of its endpoint.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        endpoint          str             endpoint template of the request
+        function          callable        call sending the request
+        hedge             callable        call sending its hedge from a
+                                          policy thread (default function)
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) response, if the request was hedged and if the hedge
+            response was the one used.
+        """
+        with self._lock:
+            self.requests += 1
+            self._credit = min(self._credit + self.max_ratio, self.burst)
+
+        delay = self.delay(endpoint)
+        start = time.perf_counter()
+
+        if delay is None:
+            response = function()
+            self.observe(endpoint, time.perf_counter() - start)
+            return response, False, False
+
+        hedged = DataryHedgedRequest()
+        self.schedule(start + delay, hedged, hedge or function)
+
+        response = exception = None
+        _primary.request = hedged
+        try:
+            response = function()
+        except Exception as ex:
+            exception = ex
+        finally:
+            _primary.request = None
+
+        with hedged.lock:
+            hedged.primary_done = True
+            hedged.connection = None
+            if hedged.winner is None and self.succeeded(response):
+                hedged.winner = 'primary'
+        hedged.done.set()
+
+        # a failed request waits for its hedge in flight.
+        if hedged.sent and hedged.winner is None:
+            hedged.hedge_done.wait()
+
+        self.observe(endpoint, time.perf_counter() - start)
+
+        if hedged.winner == 'hedge':
+            if response is not None:
+                self.discard(response)
+            with self._lock:
+                self.hedge_wins += 1
+            return hedged.response, True, True
+
+        # both failed, the request outcome is the one returned.
+        if exception is not None:
+            raise exception
+        return response, hedged.sent, False
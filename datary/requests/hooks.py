@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Hooks File
+"""
+import time
+
+from .endpoints import endpoint_template
+
+
+def body_size(body):
+    """
+    Returns:
+        (int) bytes of a prepared request body.
+    """
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, bytes):
+        return len(body)
+    # streamed bodies, the sent bytes when their length is unknown.
+    return getattr(body, 'len', None) or getattr(body, 'sent', 0)
+
+
+def body_content_size(body):
+    """
+    Returns:
+        (int) bytes of a prepared request body before its compression.
+    """
+    content_bytes = getattr(body, 'content_bytes', None)
+    return body_size(body) if content_bytes is None else content_bytes
+
+
+def response_size(response):
+    """
+    Returns:
+        (int) bytes of a response body on the wire: its Content-Length if
+        it's compressed or streamed and not read yet.
+    """
+    headers = getattr(response, 'headers', None) or {}
+
+    # requests keeps `_content` False until a streamed body is read.
+    if (getattr(response, '_content', None) is False or
+            headers.get('Content-Encoding') and
+            headers.get('Content-Length')):
+        return int(headers.get('Content-Length') or 0)
+    return response_content_size(response)
+
+
+def response_content_size(response):
+    """
+    Returns:
+        (int) bytes of a response body once decompressed, None if it's
+        streamed and not read yet.
+    """
+    if getattr(response, '_content', None) is False:
+        return None
+    return len(getattr(response, 'content', b'') or b'')
+
+
+class DataryRequestEvent(object):
+    """
+    A single try of a request, as the observers see it.
+
+    ======================  =========   ==================================
+    Attribute               Type        Description
+    ======================  =========   ==================================
+    url                     str         request url
+    http_method             str         http method
+    endpoint                str         endpoint template
+                                        (e.g. `workdirs/{}/changes`)
+    attempt                 int         try of the request, 1 the first one
+    start                   float       perf_counter at the start
+    duration                float       seconds of the try (on end)
+    status_code             int         response status (on end, None if
+                                        it failed without response)
+    request_bytes           int         request body bytes on the wire
+                                        (on end)
+    response_bytes          int         response body bytes on the wire
+                                        (on end)
+    request_content_bytes   int         request body bytes before its
+                                        compression (on end)
+    response_content_bytes  int         response body bytes decompressed
+                                        (on end, the wire ones if unread)
+    request_encoding        str         request Content-Encoding (on end)
+    response_encoding       str         response Content-Encoding (on end)
+    hedged                  bool        a hedge of the try was sent (on end)
+    hedge_won               bool        the hedge response was used (on end)
+    hedge_of                Event       event of the try hedged, if the try
+                                        is a hedge
+    exception               Exception   request exception (on end)
+    ======================  =========   ==================================
+    """
+
+    __slots__ = (
+        'url', 'http_method', 'endpoint', 'attempt', 'start', 'duration',
+        'status_code', 'request_bytes', 'response_bytes',
+        'request_content_bytes', 'response_content_bytes',
+        'request_encoding', 'response_encoding', 'hedged', 'hedge_won',
+        'hedge_of', 'exception')
+
+    def __init__(self, url, http_method, attempt=1, hedge_of=None):
+        self.url = url
+        self.http_method = http_method
+        self.endpoint = endpoint_template(url)
+        self.attempt = attempt
+        self.start = time.perf_counter()
+        self.duration = None
+        self.status_code = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_content_bytes = 0
+        self.response_content_bytes = 0
+        self.request_encoding = None
+        self.response_encoding = None
+        self.hedged = False
+        self.hedge_won = False
+        self.hedge_of = hedge_of
+        self.exception = None
+
+    @property
+    def retry(self):
+        """
+        Returns:
+            (bool) if the try is a retry.
+        """
+        return self.attempt > 1
+
+    def end(self, response=None, exception=None):
+        """
+        Completes the event with the try response or exception.
+        """
+        self.duration = time.perf_counter() - self.start
+        self.exception = exception
+
+        if response is not None:
+            request = getattr(response, 'request', None)
+            body = getattr(request, 'body', None)
+            self.status_code = response.status_code
+            self.request_bytes = body_size(body)
+            self.request_content_bytes = body_content_size(body)
+            self.request_encoding = (
+                getattr(request, 'headers', None) or {}).get(
+                    'Content-Encoding')
+            self.response_bytes = response_size(response)
+            content_bytes = response_content_size(response)
+            self.response_content_bytes = (
+                self.response_bytes if content_bytes is None
+                else content_bytes)
+            self.response_encoding = (
+                getattr(response, 'headers', None) or {}).get(
+                    'Content-Encoding')
+
+        return self
+
+
+class DataryRequestObserver(object):
+    """
+    Request observer interface, DataryRequests calls it on the start and on
+    the end of every try of a request. Observers are called from the
+    requesting thread and must be thread safe.
+    """
+
+    def on_request_start(self, event):
+        """
+        Called before sending a try of a request.
+        """
+        pass
+
+    def on_request_end(self, event):
+        """
+        Called after a try of a request, with its response or exception.
+        """
+        pass
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Rate Limiter File
+"""
+import os
+import time
+import threading
+
+from .endpoints import endpoint_template
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class DataryTokenBucket(object):
+    """
+    Thread safe token bucket.
+
+    Refills `rate` tokens per second up to `burst` tokens. Every acquire
+    takes its tokens, waiting for them if the bucket has not enough.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        DataryTokenBucket Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        rate              float           tokens (requests) per second
+        burst             float           bucket capacity (default: rate)
+        ================  =============   ====================================
+        """
+        super(DataryTokenBucket, self).__init__()
+
+        if rate <= 0:
+            raise ValueError('Rate limiter rate must be greater than 0.')
+
+        self.rate = float(rate)
+        self.burst = float(burst or max(self.rate, 1))
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last = self.clock()
+
+    @staticmethod
+    def clock():
+        """
+        Returns:
+            (float) seconds of the bucket clock.
+        """
+        return time.monotonic()
+
+    def take(self, tokens, available, last, now):
+        """
+        Refill the bucket since last take and take tokens from it.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        tokens            float           tokens to take
+        available         float           tokens in the bucket at last
+        last              float           clock of the last take
+        now               float           clock now
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) seconds to wait for the tokens, tokens left in the bucket.
+            Tokens left are negative when reserved for waiting takes.
+        """
+        available = min(
+            self.burst, available + max(now - last, 0) * self.rate)
+        available -= tokens
+        wait = -available / self.rate if available < 0 else 0.0
+        return wait, available
+
+    def reserve(self, tokens=1):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        tokens            float           tokens to take
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds to wait until the reserved tokens are available.
+        """
+        with self._lock:
+            now = self.clock()
+            wait, self._tokens = self.take(
+                tokens, self._tokens, self._last, now)
+            self._last = now
+
+        return wait
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens from the bucket, waiting for them if needed.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        tokens            float           tokens to take
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class DataryFileTokenBucket(DataryTokenBucket):
+    """
+    Token bucket stored in a locked file, sharing its budget between every
+    process on the host using the same path.
+    """
+
+    def __init__(self, path, rate, burst=None):
+        """
+        DataryFileTokenBucket Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        path              str             bucket state file path
+        rate              float           tokens (requests) per second
+        burst             float           bucket capacity (default: rate)
+        ================  =============   ====================================
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                'DataryFileTokenBucket needs fcntl file locks (POSIX).')
+
+        super(DataryFileTokenBucket, self).__init__(rate, burst)
+        self.path = path
+
+        dirname = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname, exist_ok=True)
+
+    @staticmethod
+    def clock():
+        """
+        Returns:
+            (float) seconds of the bucket clock, shared between processes.
+        """
+        return time.time()
+
+    def reserve(self, tokens=1):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        tokens            float           tokens to take
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds to wait until the reserved tokens are available.
+        """
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = self.clock()
+
+                try:
+                    available, last = [
+                        float(x) for x in os.read(fd, 64).split()]
+                except ValueError:
+                    available, last = self.burst, now
+
+                wait, available = self.take(tokens, available, last, now)
+
+                state = '{!r} {!r}'.format(available, now).encode()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, state)
+            finally:
+                os.close(fd)
+
+        return wait
+
+
+class DataryRateLimiter(object):
+    """
+    Client side rate limiter with a token bucket per endpoint class:
+    - `write`: requests changing a workdir (`workdirs/{}/changes`).
+    - `read`: the rest of requests.
+    Endpoint classes without bucket are not limited.
+    """
+
+    READ = 'read'
+    WRITE = 'write'
+
+    def __init__(self, buckets=None):
+        """
+        DataryRateLimiter Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        buckets           dict            endpoint class -> token bucket
+        ================  =============   ====================================
+        """
+        super(DataryRateLimiter, self).__init__()
+        self.buckets = dict(buckets or {})
+
+    @classmethod
+    def from_rates(cls, read=None, write=None, path=None):
+        """
+        Build a rate limiter from (requests per second, burst) tuples.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        read              tuple/float     (rate, burst) or rate of reads
+        write             tuple/float     (rate, burst) or rate of writes
+        path              str             directory of the bucket files to
+                                          share the budget between processes
+                                          (default: in-memory buckets)
+        ================  =============   ====================================
+
+        Returns:
+            (DataryRateLimiter) rate limiter.
+        """
+        buckets = {}
+
+        for endpoint_class, rates in [(cls.READ, read), (cls.WRITE, write)]:
+            if not rates:
+                continue
+
+            if not isinstance(rates, (tuple, list)):
+                rates = (rates, )
+            rate, burst = (list(rates) + [None])[:2]
+
+            if path:
+                buckets[endpoint_class] = DataryFileTokenBucket(
+                    os.path.join(path, '{}.bucket'.format(endpoint_class)),
+                    rate, burst)
+            else:
+                buckets[endpoint_class] = DataryTokenBucket(rate, burst)
+
+        return cls(buckets)
+
+    def endpoint_class(self, url, http_method):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        http_method       str             request http method
+        ================  =============   ====================================
+
+        Returns:
+            (str) endpoint class of the request.
+        """
+        template = endpoint_template(url)
+
+        if http_method != 'GET' and template.endswith('workdirs/{}/changes'):
+            return self.WRITE
+
+        return self.READ
+
+    def acquire(self, url, http_method):
+        """
+        Wait until the request fits in its endpoint class budget.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        http_method       str             request http method
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds waited.
+        """
+        bucket = self.buckets.get(self.endpoint_class(url, http_method))
+        return bucket.acquire() if bucket else 0.0
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Metrics File
+"""
+import bisect
+import threading
+
+from collections import Counter
+
+from .hooks import DataryRequestObserver
+
+
+class DataryHistogram(object):
+    """
+    Cumulative buckets histogram, as Prometheus histograms.
+    """
+
+    # request duration buckets in seconds
+    DEFAULT_BUCKETS = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        DataryHistogram Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        buckets           tuple           sorted buckets upper bounds, an
+                                          infinite one is always added
+        ================  =============   ====================================
+        """
+        super(DataryHistogram, self).__init__()
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Adds a value to the histogram (not thread safe).
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimates a quantile interpolating linearly inside its bucket.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        q                 float           quantile (0-1)
+        ================  =============   ====================================
+
+        Returns:
+            (float) estimated quantile, None if the histogram is empty.
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                # values over the last bucket, the best guess is its bound.
+                if index == len(self.buckets):
+                    return self.buckets[-1] if self.buckets else None
+
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+
+        return self.buckets[-1] if self.buckets else None
+
+    def dump(self):
+        """
+        Returns:
+            (dict) count, sum, cumulative buckets and p50/p95/p99.
+        """
+        cumulative, buckets = 0, {}
+        for bound, count in zip(
+                list(self.buckets) + ['+Inf'], self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': buckets,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class DataryMetrics(DataryRequestObserver):
+    """
+    In-process request metrics collector, by http method and endpoint
+    template: tries, retries, errors and bytes counters, status codes,
+    in flight requests and a duration histogram. Bytes are counted on the
+    wire and decompressed (content bytes), their ratio being the
+    compression one. Hedged tries and the ones answered by their hedge are
+    counted too (see DataryHedgingPolicy), the hedges being tries of their
+    own.
+
+    Register it as an observer of one or several clients, then `dump()` it
+    or `render()` it in the Prometheus text format to be scraped.
+    """
+
+    def __init__(self, buckets=DataryHistogram.DEFAULT_BUCKETS):
+        """
+        DataryMetrics Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        buckets           tuple           duration histogram buckets
+        ================  =============   ====================================
+        """
+        super(DataryMetrics, self).__init__()
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all the metrics.
+        """
+        with self.lock:
+            self.in_flight = 0
+            self.endpoints = {}
+
+    def stats(self, event):
+        """
+        Returns:
+            (dict) stats of the event method and endpoint (lock held).
+        """
+        key = (event.http_method, event.endpoint)
+        stats = self.endpoints.get(key)
+
+        if stats is None:
+            stats = self.endpoints[key] = {
+                'tries': 0,
+                'retries': 0,
+                'errors': 0,
+                'statuses': Counter(),
+                'request_bytes': 0,
+                'response_bytes': 0,
+                'request_content_bytes': 0,
+                'response_content_bytes': 0,
+                'hedges': 0,
+                'hedge_wins': 0,
+                'duration': DataryHistogram(self.buckets),
+            }
+        return stats
+
+    def on_request_start(self, event):
+        with self.lock:
+            self.in_flight += 1
+
+    def on_request_end(self, event):
+        with self.lock:
+            self.in_flight -= 1
+            stats = self.stats(event)
+            stats['tries'] += 1
+            stats['retries'] += event.retry
+            stats['request_bytes'] += event.request_bytes
+            stats['response_bytes'] += event.response_bytes
+            stats['request_content_bytes'] += event.request_content_bytes
+            stats['response_content_bytes'] += event.response_content_bytes
+            stats['hedges'] += event.hedged
+            stats['hedge_wins'] += event.hedge_won
+            stats['duration'].observe(event.duration)
+
+            if event.status_code is None:
+                stats['errors'] += 1
+            else:
+                stats['statuses'][event.status_code] += 1
+
+    def dump(self):
+        """
+        Returns:
+            (dict) json serializable metrics by `<method> <endpoint>`.
+        """
+        with self.lock:
+            return {
+                'in_flight': self.in_flight,
+                'endpoints': {
+                    '{} {}'.format(*key): {
+                        'tries': stats['tries'],
+                        'retries': stats['retries'],
+                        'errors': stats['errors'],
+                        'statuses': {
+                            str(k): v for k, v in stats['statuses'].items()},
+                        'request_bytes': stats['request_bytes'],
+                        'response_bytes': stats['response_bytes'],
+                        'request_content_bytes': stats[
+                            'request_content_bytes'],
+                        'response_content_bytes': stats[
+                            'response_content_bytes'],
+                        'hedges': stats['hedges'],
+                        'hedge_wins': stats['hedge_wins'],
+                        'duration': stats['duration'].dump(),
+                    }
+                    for key, stats in sorted(self.endpoints.items())
+                }
+            }
+
+    def render(self, prefix='datary'):
+        """
+        Returns:
+            (str) metrics in the Prometheus text exposition format.
+        """
+        def labels(key, **extra):
+            values = dict(method=key[0], endpoint=key[1], **extra)
+            return '{' + ','.join(
+                '{}="{}"'.format(k, v) for k, v in sorted(values.items())
+            ) + '}'
+
+        with self.lock:
+            endpoints = sorted(self.endpoints.items())
+            lines = [
+                '# TYPE {}_requests_in_flight gauge'.format(prefix),
+                '{}_requests_in_flight {}'.format(prefix, self.in_flight),
+            ]
+
+            for name, kind in [('requests_total', 'counter'),
+                               ('request_retries_total', 'counter'),
+                               ('request_errors_total', 'counter'),
+                               ('request_bytes_total', 'counter'),
+                               ('response_bytes_total', 'counter'),
+                               ('request_content_bytes_total', 'counter'),
+                               ('response_content_bytes_total', 'counter'),
+                               ('request_hedges_total', 'counter'),
+                               ('request_hedge_wins_total', 'counter')]:
+                lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+
+                for key, stats in endpoints:
+                    if name == 'requests_total':
+                        for status, value in sorted(stats['statuses'].items()):
+                            lines.append('{}_{}{} {}'.format(
+                                prefix, name, labels(key, status=status),
+                                value))
+                        continue
+
+                    value = stats[{
+                        'request_retries_total': 'retries',
+                        'request_errors_total': 'errors',
+                        'request_bytes_total': 'request_bytes',
+                        'response_bytes_total': 'response_bytes',
+                        'request_content_bytes_total':
+                            'request_content_bytes',
+                        'response_content_bytes_total':
+                            'response_content_bytes',
+                        'request_hedges_total': 'hedges',
+                        'request_hedge_wins_total': 'hedge_wins',
+                    }[name]]
+                    lines.append('{}_{}{} {}'.format(
+                        prefix, name, labels(key), value))
+
+            name = '{}_request_duration_seconds'.format(prefix)
+            lines.append('# TYPE {} histogram'.format(name))
+
+            for key, stats in endpoints:
+                histogram = stats['duration']
+                for bound, value in histogram.dump()['buckets'].items():
+                    lines.append('{}_bucket{} {}'.format(
+                        name, labels(key, le=bound), value))
+                lines.append('{}_sum{} {}'.format(
+                    name, labels(key), histogram.sum))
+                lines.append('{}_count{} {}'.format(
+                    name, labels(key), histogram.count))
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Multipart File
+
+Streamed multipart/form-data bodies, their parts are encoded while they're
+sent, so uploading a dataset doesn't keep its json document in memory.
+"""
+import binascii
+import os
+
+from .codec import get_codec
+
+
+class DataryMultipartStream(object):
+    """
+    Streamed multipart/form-data request body, a file like object read by
+    requests while sending the request.
+
+    Parts are str values or `(filename, chunks, content_type)` files, the
+    file chunks being an iterable of bytes or a callable returning it:
+
+    - callables are replayable: the body can be rewound to retry the
+      request.
+    - other iterables (e.g. a generator of a file) are read only once:
+      the body can't be rewound.
+
+    The body length is unknown until it's read (it's sent with chunked
+    transfer encoding), then it's kept: a retried body has a
+    Content-Length.
+
+    Only a read chunk and the part being encoded are kept in memory.
+    """
+
+    _DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, fields, boundary=None,
+                 chunk_size=_DEFAULT_CHUNK_SIZE):
+        """
+        DataryMultipartStream Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        fields            list or dict    (name, value) parts of the body
+        boundary          str             parts boundary (default random)
+        chunk_size        int             bytes of the iterated chunks
+        ================  =============   ====================================
+        """
+        super(DataryMultipartStream, self).__init__()
+        self.fields = list(
+            fields.items() if isinstance(fields, dict) else fields)
+        self.boundary = boundary or binascii.hexlify(
+            os.urandom(16)).decode('ascii')
+        self.chunk_size = chunk_size
+        self.sent = 0
+        self._len = None
+        self._chunks = None
+        self._buffer = b''
+        self._read = False
+
+    @classmethod
+    def for_change(cls, action, element, codec=None, **kwargs):
+        """
+        Body of a file change of a workdir (`workdirs/{}/changes`), its
+        blob being the element original `{"__kern": .., "__meta": ..}`
+        encoded row by row.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        action            str             change action (add, modify)
+        element           dict            element with path, basename and
+                                          data (kern, meta)
+        codec             Codec           json codec of the blob
+        ================  =============   ====================================
+
+        Returns:
+            (DataryMultipartStream) change body.
+        """
+        codec = get_codec(codec)
+        data = element.get('data', {})
+        original = {'__kern': data.get('kern'), '__meta': data.get('meta')}
+        kern = original['__kern']
+
+        # kerns read once (generators) make a blob read once too.
+        if isinstance(kern, (list, dict)) or not hasattr(kern, '__iter__'):
+            blob = lambda: codec.iterdumpb(original)  # noqa: E731
+        else:
+            blob = codec.iterdumpb(original)
+
+        return cls([
+            ("blob", (element.get('basename'), blob, 'application/json')),
+            ("action", action),
+            ("filemode", "100644"),
+            ("dirname", element.get('path')),
+            ("basename", element.get('basename')),
+        ], **kwargs)
+
+    @property
+    def content_type(self):
+        """
+        Returns:
+            (str) Content-Type header of the body.
+        """
+        return 'multipart/form-data; boundary={}'.format(self.boundary)
+
+    @property
+    def rewindable(self):
+        """
+        Returns:
+            (bool) if the body can be read again.
+        """
+        return all(
+            callable(value[1]) for _, value in self.fields
+            if isinstance(value, tuple))
+
+    @property
+    def len(self):
+        """
+        Returns:
+            (int) bytes of the body, None until it has been read to its end.
+        """
+        return self._len
+
+    def iter_parts(self):
+        """
+        Yields:
+            (bytes) chunks of the body, as they're encoded.
+        """
+        boundary = '--{}'.format(self.boundary).encode('ascii')
+
+        for name, value in self.fields:
+            if isinstance(value, tuple):
+                filename, chunks, content_type = value
+                yield boundary + (
+                    '\r\nContent-Disposition: form-data; name="{}"; '
+                    'filename="{}"\r\nContent-Type: {}\r\n\r\n'.format(
+                        name, filename, content_type)).encode('utf-8')
+                for chunk in (chunks() if callable(chunks) else chunks):
+                    yield chunk
+                yield b'\r\n'
+
+            else:
+                yield boundary + (
+                    '\r\nContent-Disposition: form-data; name="{}"'
+                    '\r\n\r\n{}\r\n'.format(
+                        name, '' if value is None else value)).encode('utf-8')
+
+        yield boundary + b'--\r\n'
+
+    def read(self, size=-1):
+        """
+        Returns:
+            (bytes) next size bytes of the body (all the rest if size < 0),
+            b'' at its end.
+        """
+        if self._chunks is None:
+            if self._read and not self.rewindable:
+                raise ValueError('Multipart body can be read only once')
+            self._chunks = self.iter_parts()
+            self._read = True
+
+        chunks = [self._buffer]
+        buffered = len(self._buffer)
+
+        while size < 0 or buffered < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                # read to its end, the length is known.
+                self._len = self.sent + buffered
+                break
+            chunks.append(chunk)
+            buffered += len(chunk)
+
+        data = b''.join(chunks)
+        if size < 0:
+            size = len(data)
+        self._buffer = data[size:]
+        self.sent += min(size, len(data))
+        return data[:size]
+
+    def rewind(self):
+        """
+        Rewind the body to be sent again (retrying its request).
+
+        Raises:
+            ValueError: the body can be read only once.
+        """
+        if not self.rewindable:
+            raise ValueError('Multipart body can be read only once')
+        self._chunks = None
+        self._buffer = b''
+        self.sent = 0
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
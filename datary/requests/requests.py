@@ -3,126 +3,608 @@
 Datary sdk Requests File
 """
 import time
-import requests
-import structlog
-from requests import RequestException
+import threading
 
+from types import MappingProxyType
 
-logger = structlog.getLogger(__name__)
+from datary.lazy import get_logger, lazy_module
+
+from .retry import DataryRetryPolicy
+from .endpoints import endpoint_template
+from .hooks import DataryRequestEvent
+from .budget import DataryRequestBudget
+from .codec import get_codec
+from .response import DataryResponse
+from .compression import DataryCompressedBody, accept_encoding, compressor
+
+
+requests = lazy_module('requests')
+logger = get_logger(__name__)
 
 
 class DataryRequests(object):
     """
     Datary Requests module class
+
+    A client is thread safe, a single one (and its pooled session) can be
+    shared by a thread pool: its base headers are immutable and replaced as
+    a whole, the headers of a call are merged with them when it's sent.
     """
 
     URL_BASE = "http://api.datary.io/"
     tries_limit = 3
-    headers = {}
+
+    _DEFAULT_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+    # Connection pool defaults of the keep-alive session.
+    _DEFAULT_POOL_CONNECTIONS = 10
+    _DEFAULT_POOL_MAXSIZE = 10
 
     def __init__(self, **kwargs):
         """
         DataryRequests Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url_base          str             api url base (default URL_BASE)
+        headers           dict            extra headers sent in every request
+        tries_limit       int             max tries of a request (default 3)
+        pool_connections  int             number of host pools kept alive
+        pool_maxsize      int             max connections kept per host
+        pool_block        bool            block when a host pool is exhausted
+                                          instead of opening extra
+                                          connections (default False)
+        retry_policy      RetryPolicy     policy of the retried requests
+                                          (default DataryRetryPolicy())
+        rate_limiter      RateLimiter     client side rate limiter, it can
+                                          be shared between clients
+                                          (default None, not limited)
+        response_cache    ResponseCache   conditional GET response cache
+                                          (default None, not cached)
+        content_cache     ContentCache    sha1 addressed contents cache
+                                          (default None, not cached)
+        request_coalescer Coalescer       concurrent identical GETs sent
+                                          once (default None, not coalesced,
+                                          see DataryRequestCoalescer)
+        hedging_policy    HedgingPolicy   slow GETs sent twice, the first
+                                          response used (default None, not
+                                          hedged, see DataryHedgingPolicy)
+        circuit_breaker   CircuitBreaker  requests of failing endpoints fail
+                                          fast (default None, always sent,
+                                          see DataryCircuitBreaker)
+        observers         list            request observers, called on the
+                                          start and end of every try
+        codec             str or Codec    json codec of bodies & responses
+                                          ('json', 'orjson' or an instance,
+                                          default orjson when installed)
+        compression       str             content encoding of the streamed
+                                          upload bodies ('gzip', 'zstd'),
+                                          when the server accepts them
+                                          (default None, not compressed)
+        accept_encoding   str             Accept-Encoding of the responses,
+                                          only its encodings the client
+                                          decodes (default all of them,
+                                          'identity' to disable)
+        ================  =============   ====================================
         """
         super(DataryRequests, self).__init__()
-        self.headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        self.headers.update(kwargs.get('headers', {}))
+        self.URL_BASE = kwargs.get('url_base', self.URL_BASE)
+        self.headers = dict(self._DEFAULT_HEADERS, **kwargs.get('headers', {}))
         self.tries_limit = kwargs.get('tries_limit', 3)
+        self.retry_policy = kwargs.get('retry_policy') or DataryRetryPolicy()
+        self.rate_limiter = kwargs.get('rate_limiter')
+        self.response_cache = kwargs.get('response_cache')
+        self.content_cache = kwargs.get('content_cache')
+        self.request_coalescer = kwargs.get('request_coalescer')
+        self.hedging_policy = kwargs.get('hedging_policy')
+        self.circuit_breaker = kwargs.get('circuit_breaker')
+        self.observers = list(kwargs.get('observers', []))
+        self.codec = get_codec(kwargs.get('codec'))
+        self.compression = kwargs.get('compression')
+        if self.compression is not None:
+            # fails early on unknown or not installed encodings.
+            compressor(self.compression)
+        self.accept_encoding = kwargs.get('accept_encoding')
+
+        # the session (and requests) is made on the first request.
+        self._session_kwargs = {
+            'pool_connections': kwargs.get(
+                'pool_connections', self._DEFAULT_POOL_CONNECTIONS),
+            'pool_maxsize': kwargs.get(
+                'pool_maxsize', self._DEFAULT_POOL_MAXSIZE),
+            'pool_block': kwargs.get('pool_block', False),
+        }
+        self._session_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # only called while the session hasn't been made.
+        if name != 'session' or '_session_lock' not in self.__dict__:
+            raise AttributeError(
+                '{!r} object has no attribute {!r}'.format(
+                    type(self).__name__, name))
+
+        with self.__dict__['_session_lock']:
+            session = self.__dict__.get('session')
+            if session is None:
+                session = self.make_session(**self._session_kwargs)
+                session.headers['Accept-Encoding'] = accept_encoding(
+                    self.accept_encoding)
+                if self.hedging_policy is not None:
+                    self.hedging_policy.track(session)
+                self.session = session
+        return session
+
+    @property
+    def headers(self):
+        """
+        Returns:
+            (mapping) read only base headers of every request.
+        """
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers):
+        """
+        Replace the base headers, with a read only copy.
+        """
+        self._headers = MappingProxyType(dict(headers))
+
+    def request_headers(self, headers=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        headers           dict            headers of a call
+        ================  =============   ====================================
+
+        Returns:
+            (dict) new headers of a request, the base headers updated with
+            the ones of the call.
+        """
+        request_headers = dict(self._headers)
+        request_headers.update(headers or {})
+        return request_headers
+
+    @classmethod
+    def make_session(cls, pool_connections=_DEFAULT_POOL_CONNECTIONS,
+                     pool_maxsize=_DEFAULT_POOL_MAXSIZE, pool_block=False):
+        """
+        Build a keep-alive requests session, reusing connections (and TLS
+        handshakes) between calls to the same host.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        pool_connections  int             number of host pools kept alive
+        pool_maxsize      int             max connections kept per host
+        pool_block        bool            block when a host pool is exhausted
+        ================  =============   ====================================
+
+        Returns:
+            (requests.Session) pooled session.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self):
+        """
+        Close the pooled session and its kept-alive connections, and stop
+        the hedging policy threads.
+        """
+        session = self.__dict__.get('session')
+        if session is not None:
+            session.close()
+
+        if self.hedging_policy is not None:
+            self.hedging_policy.close()
 
     def request(self, url, http_method, tries=0, **kwargs):
         """
-        Sends request to Datary passing config through arguments.
+        Sends request to Datary passing config through arguments, retrying
+        it as the client retry policy says.
 
-        ===========   =============   =======================================
-        Parameter     Type            Description
-        ===========   =============   =======================================
-        url           str             destination url
-        http_method   str             http methods of request
-                                        [GET, POST, POST, DELETE]
-        ===========   =============   =======================================
+        ==============   =============   ====================================
+        Parameter        Type            Description
+        ==============   =============   ====================================
+        url              str             destination url
+        http_method      str             http methods of request
+                                         [GET, POST, POST, DELETE]
+        tries            int             tries already done of this request
+        headers          dict            headers of the call, merged with the
+                                         client base headers
+        reauthenticate   bool            refresh the credentials once on a
+                                         401 response and send it again
+                                         (default True)
+        ==============   =============   ====================================
 
         Returns:
-            content(): if HTTP response between the 200 range
+            (DataryResponse) if HTTP response between the 200 range,
+            decoding its json body once.
 
         Raises:
             - Unknown HTTP method
             - Fail request to datary
 
         """
-        try:
-            #  HTTP GET Method
-            if http_method == 'GET':
-                content = requests.get(url, **kwargs)
+        reauthenticate = kwargs.pop('reauthenticate', True)
+        kwargs['headers'] = self.request_headers(kwargs.get('headers'))
 
-            # HTTP POST Method
-            elif http_method == 'POST':
-                content = requests.post(url, **kwargs)
+        # Concurrent identical GETs share a single request in flight.
+        if (self.request_coalescer is not None and http_method == 'GET' and
+                not kwargs.get('stream') and kwargs.get('data') is None):
+            key = self.request_coalescer.key(
+                url, kwargs.get('params'), kwargs['headers'])
+            return self.request_coalescer.call(
+                key, self._request, url, http_method, tries, reauthenticate,
+                kwargs)
 
-            # HTTP PUT Method
-            elif http_method == 'PUT':
-                content = requests.put(url, **kwargs)
+        return self._request(url, http_method, tries, reauthenticate, kwargs)
 
-            # HTTP DELETE Method
-            elif http_method == 'DELETE':
-                content = requests.delete(url, **kwargs)
+    def _request(self, url, http_method, tries, reauthenticate, kwargs):
+        # request() retry loop, the request headers already merged.
+        cache_key = cache_entry = None
 
-            # Unkwown HTTP Method
-            else:
+        # Revalidate cached GET responses with conditional headers.
+        if (self.response_cache is not None and http_method == 'GET' and
+                not kwargs.get('stream') and kwargs.get('data') is None):
+            cache_key, cache_entry, kwargs = self.response_cache.prepare(
+                url, kwargs)
+
+        # streamed bodies are rewound to retry, unless read only once.
+        body = kwargs.get('data')
+
+        if self.compression is not None and hasattr(body, 'read'):
+            body = DataryCompressedBody(body, self.compression)
+            headers = dict(kwargs.get('headers') or {})
+            headers['Content-Encoding'] = body.encoding
+            kwargs = dict(kwargs, data=body, headers=headers)
+
+        replayable = getattr(body, 'rewindable', True)
+        breaker = self.circuit_breaker
+        endpoint = endpoint_template(url) if breaker is not None else None
+
+        # the replay with refreshed credentials is the same try again.
+        replay = False
+
+        while True:
+            content = None
+            if not replay:
+                tries += 1
+
+            # Fail fast while the endpoint circuit is open.
+            if breaker is not None and not breaker.allow(endpoint):
                 logger.error(
-                    'Do not know {} as HTTP method'.format(http_method))
-                raise Exception(
-                    'Do not know {} as HTTP method'.format(http_method))
+                    "Fail request to datary, circuit breaker open.",
+                    url=url, http_method=http_method, endpoint=endpoint,
+                    tries=tries)
+                return None
 
-            # Check for correct request status code.
-            if 199 < content.status_code < 300:
-                tries = 0
-                return content
+            if (tries > 1 or replay) and hasattr(body, 'rewind'):
+                body.rewind()
+            replay = False
 
-            # Check if must wait x seconds returning 429 http code.
-            elif content.status_code == 429:
+            # Wait for the request budget before every try.
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url, http_method)
 
-                # TODO: RETRIEVE TIMESLEEP FROM RETURNED ERR MSG
-                time_sleep = 2
+            event = self.notify_request_start(url, http_method, tries)
 
-                msg = "Fail Request to datary ({}) - Need to wait {} seconds"
-                logger.warning(
-                    msg.format(content.status_code, time_sleep),
-                    url=url, http_method=http_method,
-                    code=content.status_code,
-                    text=content.text,
-                    # kwargs=kwargs,
+            try:
+                if (self.hedging_policy is not None and
+                        self.hedging_policy.is_hedgeable(
+                            http_method, kwargs)):
+                    content = self.send_hedged(
+                        url, http_method, event, tries, **kwargs)
+                else:
+                    content = self.send(url, http_method, **kwargs)
+
+            # Request Exception
+            except requests.RequestException as ex:
+                self.notify_request_end(event, exception=ex)
+                if breaker is not None:
+                    breaker.record(endpoint, exception=ex)
+                retry = self.retry_policy.is_retryable(
+                    http_method, exception=ex)
+                logger.error(
+                    "Fail request to Datary - {}".format(ex),
+                    url=url,
+                    http_method=http_method,
+                    # requests_args=kwargs,
                 )
-                time.sleep(time_sleep)
-                tries += 1
 
-                if tries >= self.tries_limit:
+            except Exception as ex:
+                self.notify_request_end(event, exception=ex)
+                if breaker is not None:
+                    breaker.release(endpoint)
+                raise
+
+            else:
+                self.notify_request_end(event, response=content)
+                if breaker is not None:
+                    breaker.record(endpoint, status_code=content.status_code)
+
+                # Check for correct request status code.
+                if 199 < content.status_code < 300:
+                    response = DataryResponse(content, self.codec)
+                    if cache_key is not None:
+                        self.response_cache.store(
+                            cache_key, response, codec=self.codec)
+                    return response
+
+                # Not modified since cached.
+                if content.status_code == 304 and cache_entry is not None:
+                    return self.response_cache.response(cache_entry)
+
+                # Expired credentials, refreshed once and sent again.
+                if content.status_code == 401 and reauthenticate:
+                    reauthenticate = False
+                    refreshed_kwargs = self.reauthenticate(
+                        url, http_method, kwargs)
+
+                    if refreshed_kwargs is not None and replayable:
+                        logger.warning(
+                            "Unauthorized request to datary, sent again "
+                            "with refreshed credentials.",
+                            url=url, http_method=http_method)
+                        # release its connection, unread if streamed.
+                        content.close()
+                        kwargs = refreshed_kwargs
+                        replay = True
+                        continue
+
+                retry = self.retry_policy.is_retryable(
+                    http_method, status_code=content.status_code)
+
+                if not retry:
+                    msg = "Fail Request to datary done with code {}"
                     logger.error(
-                        "Request Tries Limit Exceeded!!",
-                        url=url,
-                        http_method=http_method,
-                        # requests_args=kwargs,
+                        msg.format(content.status_code),
+                        url=url, http_method=http_method,
+                        code=content.status_code,
+                        text=content.text,
+                        # kwargs=kwargs,
                     )
 
-                else:
-                    return self.request(url, http_method, tries, **kwargs)
+            if retry and not replayable:
+                logger.error(
+                    "Request body can't be sent again, not retried.",
+                    url=url, http_method=http_method)
+                retry = False
 
-            else:
-                msg = "Fail Request to datary done with code {}"
-                tries = 0
+            if not retry:
+                return None
+
+            if tries >= self.tries_limit:
                 logger.error(
-                    msg.format(content.status_code),
+                    "Request Tries Limit Exceeded!!",
+                    url=url,
+                    http_method=http_method,
+                    tries=tries,
+                    # requests_args=kwargs,
+                )
+                return None
+
+            # The failures opened the circuit, not retried.
+            if breaker is not None and breaker.state(endpoint) == breaker.OPEN:
+                logger.error(
+                    "Fail request to datary, circuit breaker open.",
+                    url=url, http_method=http_method, endpoint=endpoint,
+                    tries=tries)
+                return None
+
+            # Wait what the server asks or a jittered backoff.
+            time_sleep = self.retry_policy.delay(tries, content)
+
+            if time_sleep is None:
+                logger.error(
+                    "Fail request to datary, the server asks to wait over {} "
+                    "seconds.".format(self.retry_policy.max_retry_after),
                     url=url, http_method=http_method,
                     code=content.status_code,
-                    text=content.text,
-                    # kwargs=kwargs,
-                )
+                    retry_after=self.retry_policy.retry_after(content),
+                    tries=tries)
+                return None
 
-        # Request Exception
-        except RequestException as ex:
-            tries = 0
-            logger.error(
-                "Fail request to Datary - {}".format(ex),
-                url=url,
-                http_method=http_method,
-                # requests_args=kwargs,
+            msg = "Fail Request to datary ({}) - Need to wait {} seconds"
+            logger.warning(
+                msg.format(
+                    content.status_code if content is not None else 'error',
+                    round(time_sleep, 3)),
+                url=url, http_method=http_method,
+                code=content.status_code if content is not None else None,
+                text=content.text if content is not None else None,
+                tries=tries,
+                # kwargs=kwargs,
             )
+            time.sleep(time_sleep)
+
+    def reauthenticate(self, url, http_method, kwargs):
+        """
+        Called once when a request is unauthorized (401), to refresh the
+        client credentials. The base client has none to refresh.
+
+        ===========   =============   =======================================
+        Parameter     Type            Description
+        ===========   =============   =======================================
+        url           str             destination url
+        http_method   str             http methods of request
+        kwargs        dict            request arguments
+        ===========   =============   =======================================
+
+        Returns:
+            (dict) request arguments with the refreshed credentials, None
+            if they can't be refreshed.
+        """
+        return None
+
+    def response_json(self, response):
+        """
+        Decode a response body with the client json codec, only once for
+        the responses returned by request().
+
+        Returns:
+            decoded response body.
+        """
+        if isinstance(response, DataryResponse):
+            return response.json()
+        return self.codec.decode(response)
+
+    def request_budget(self, max_requests=None, count_retries=False):
+        """
+        Context manager recording the requests done inside a block, see
+        DataryRequestBudget.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        max_requests      int             max requests of the block
+        count_retries     bool            count every try of the requests
+        ================  =============   ====================================
+
+        Returns:
+            (DataryRequestBudget) request budget of the client.
+        """
+        return DataryRequestBudget(
+            self, max_requests=max_requests, count_retries=count_retries)
+
+    def add_observer(self, observer):
+        """
+        Register a request observer (see DataryRequestObserver).
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """
+        Unregister a request observer.
+        """
+        self.observers.remove(observer)
+
+    def notify_request_start(self, url, http_method, attempt, hedge_of=None):
+        """
+        Calls the observers on_request_start of a try of a request, or of
+        the hedge of a try.
+
+        Returns:
+            (DataryRequestEvent) event of the try, None without observers.
+        """
+        if not self.observers:
+            return None
+
+        event = DataryRequestEvent(url, http_method, attempt, hedge_of)
+        self._notify('on_request_start', event)
+        return event
+
+    def notify_request_end(self, event, response=None, exception=None):
+        """
+        Calls the observers on_request_end of a try of a request.
+        """
+        if event is not None:
+            self._notify(
+                'on_request_end',
+                event.end(response=response, exception=exception))
+
+    def _notify(self, hook, event):
+        # a failing observer must not fail the request.
+        for observer in list(self.observers):
+            try:
+                getattr(observer, hook)(event)
+            except Exception as ex:
+                logger.error(
+                    'Request observer failed - {}'.format(ex),
+                    observer=observer, hook=hook)
+
+    def send_hedged(self, url, http_method, event=None, attempt=1,
+                    **kwargs):
+        """
+        Sends a single request to Datary as the client hedging policy says,
+        sending it twice if it's slow (see DataryHedgingPolicy). The hedge
+        waits for the rate limiter and is seen by the observers as one more
+        try, hedging the event one.
+
+        ===========   =============   =======================================
+        Parameter     Type            Description
+        ===========   =============   =======================================
+        url           str             destination url
+        http_method   str             http methods of request
+        event         RequestEvent    event of the try, marked as hedged
+        attempt       int             try of the request
+        ===========   =============   =======================================
+
+        Returns:
+            (requests.Response) first response of the request.
+        """
+        def hedge():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url, http_method)
+
+            hedge_event = self.notify_request_start(
+                url, http_method, attempt, hedge_of=event)
+            try:
+                content = self.send(url, http_method, **kwargs)
+            except Exception as ex:
+                self.notify_request_end(hedge_event, exception=ex)
+                raise
+            self.notify_request_end(hedge_event, response=content)
+            return content
+
+        content, hedged, hedge_won = self.hedging_policy.call(
+            endpoint_template(url),
+            lambda: self.send(url, http_method, **kwargs),
+            hedge)
+
+        if event is not None:
+            event.hedged = hedged
+            event.hedge_won = hedge_won
+
+        return content
+
+    def send(self, url, http_method, **kwargs):
+        """
+        Sends a single request to Datary through the pooled session.
+
+        ===========   =============   =======================================
+        Parameter     Type            Description
+        ===========   =============   =======================================
+        url           str             destination url
+        http_method   str             http methods of request
+                                        [GET, POST, POST, DELETE]
+        ===========   =============   =======================================
+
+        Returns:
+            (requests.Response) response of the request whatever its status.
+
+        Raises:
+            - Unknown HTTP method
+            - RequestException
+        """
+        #  HTTP GET Method
+        if http_method == 'GET':
+            content = self.session.get(url, **kwargs)
+
+        # HTTP POST Method
+        elif http_method == 'POST':
+            content = self.session.post(url, **kwargs)
+
+        # HTTP PUT Method
+        elif http_method == 'PUT':
+            content = self.session.put(url, **kwargs)
+
+        # HTTP DELETE Method
+        elif http_method == 'DELETE':
+            content = self.session.delete(url, **kwargs)
+
+        # Unkwown HTTP Method
+        else:
+            logger.error(
+                'Do not know {} as HTTP method'.format(http_method))
+            raise Exception(
+                'Do not know {} as HTTP method'.format(http_method))
+
+        return content
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Response File
+"""
+import threading
+
+
+class DataryResponse(object):
+    """
+    Successful response of a Datary request, decoding its json body lazily
+    and only once: every `json()` call returns the same decoded object.
+
+    Once decoded, the body bytes are released, so a big dataset is not kept
+    twice in memory (`content` and `text` are None from then on). The
+    decoded object is shared between callers and must not be mutated by
+    them unless they own the response.
+
+    A response can decode its own copy of a shared body (`content`), the
+    bytes are never mutated, so every response decoding them owns its
+    object.
+
+    Any other attribute is the one of the wrapped response (status_code,
+    headers, url..).
+    """
+
+    _UNDECODED = object()
+
+    def __init__(self, response, codec, content=None):
+        """
+        DataryResponse Init method
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        response          Response        successful requests response
+        codec             Codec           json codec of the body
+        content           bytes           body decoded instead of the
+                                          response one (default None)
+        ================  =============   ====================================
+        """
+        super(DataryResponse, self).__init__()
+        self.response = response
+        self.codec = codec
+        self._content = content
+        self._value = self._UNDECODED
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.__dict__['response'], name)
+
+    def __bool__(self):
+        return bool(self.response)
+
+    @property
+    def decoded(self):
+        """
+        Returns:
+            (bool) if the body has been decoded already.
+        """
+        return self._value is not self._UNDECODED
+
+    @property
+    def content(self):
+        """
+        Returns:
+            (bytes) body of the response, None once decoded.
+        """
+        if self.decoded:
+            return None
+        if self._content is not None:
+            return self._content
+        return self.response.content
+
+    @property
+    def text(self):
+        """
+        Returns:
+            (str) body text of the response, None once decoded.
+        """
+        if self.decoded:
+            return None
+        if self._content is not None:
+            return self._content.decode('utf-8')
+        return self.response.text
+
+    def json(self):
+        """
+        Returns:
+            decoded response body, decoded on the first call.
+
+        Raises:
+            ValueError: body is not a json document.
+        """
+        if self._value is self._UNDECODED:
+            with self._lock:
+                if self._value is self._UNDECODED:
+                    if self._content is not None:
+                        self._value = self.codec.loads(self._content)
+                    else:
+                        self._value = self.codec.decode(self.response)
+                    self.release()
+
+        return self._value
+
+    def body(self):
+        """
+        Returns:
+            (bytes) body of the response, encoded again once decoded.
+        """
+        content = self.content
+        if not isinstance(content, bytes):
+            content = self.codec.dumpb(self.json())
+        return content
+
+    def copy(self):
+        """
+        Returns:
+            (DataryResponse) response sharing the body bytes of this one,
+            decoding its own object from them.
+        """
+        return DataryResponse(self.response, self.codec, self.body())
+
+    def release(self):
+        """
+        Release the body bytes of the wrapped response, already decoded.
+        """
+        # a body of its own may be shared, only its reference is dropped.
+        if self._content is not None:
+            self._content = None
+            return
+
+        # requests keeps the read body in `_content`.
+        if getattr(self.response, '_content', None) is not None:
+            try:
+                self.response._content = None
+            except AttributeError:
+                pass
+
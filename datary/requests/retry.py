@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Retry File
+"""
+import re
+import random
+
+from datetime import datetime, timezone
+
+from datary.lazy import lazy_module
+
+requests = lazy_module('requests')
+email_utils = lazy_module('email.utils')
+
+
+class DataryRetryPolicy(object):
+    """
+    Datary requests retry policy.
+
+    Decides which failed requests are retried and how long to wait before
+    the next try:
+    - 429 responses are always retried, waiting what the server asks for in
+      its `Retry-After` header (or error message) when it says so. Waits
+      longer than `max_retry_after` are not waited, the request fails.
+    - 502, 503, 504 responses and connection errors are retried only for
+      idempotent http methods.
+    - Otherwise waits an exponential backoff with full jitter, so clients
+      failing at the same time do not retry at the same time.
+    """
+
+    THROTTLE_STATUS_CODE = 429
+    RETRY_STATUS_CODES = (502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE')
+
+    _RETRY_AFTER_MSG_REGEX = re.compile(
+        r'(\d+(?:\.\d+)?)\s*(?:s\b|secs?\b|seconds?\b)', re.IGNORECASE)
+
+    def __init__(self, backoff_base=0.5, backoff_max=30.0,
+                 max_retry_after=60.0, **kwargs):
+        """
+        DataryRetryPolicy Init method
+
+        ==================  =============   ==================================
+        Parameter           Type            Description
+        ==================  =============   ==================================
+        backoff_base        float           seconds of the first backoff
+        backoff_max         float           max seconds of a backoff
+        max_retry_after     float           max seconds waited when the
+                                            server asks for it (default 60)
+        retry_status_codes  tuple           status retried if idempotent
+        idempotent_methods  tuple           http methods safe to replay
+        ==================  =============   ==================================
+        """
+        super(DataryRetryPolicy, self).__init__()
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+        self.max_retry_after = float(max_retry_after)
+        self.retry_status_codes = tuple(
+            kwargs.get('retry_status_codes', self.RETRY_STATUS_CODES))
+        self.idempotent_methods = tuple(
+            kwargs.get('idempotent_methods', self.IDEMPOTENT_METHODS))
+
+    def is_retryable(self, http_method, status_code=None, exception=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        http_method       str             http method of the request
+        status_code       int             response status code
+        exception         Exception       exception raised by the request
+        ================  =============   ====================================
+
+        Returns:
+            (bool) if the request must be retried.
+        """
+        if status_code == self.THROTTLE_STATUS_CODE:
+            return True
+
+        if http_method not in self.idempotent_methods:
+            return False
+
+        if exception is not None:
+            return isinstance(
+                exception, requests.exceptions.ConnectionError)
+
+        return status_code in self.retry_status_codes
+
+    def backoff(self, attempt):
+        """
+        Exponential backoff with full jitter.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        attempt           int             number of tries already done
+        ================  =============   ====================================
+
+        Returns:
+            (float) random seconds between 0 and the attempt backoff.
+        """
+        ceil = min(
+            self.backoff_max, self.backoff_base * (2 ** max(attempt - 1, 0)))
+        return random.uniform(0, ceil)
+
+    def delay(self, attempt, response=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        attempt           int             number of tries already done
+        response          Response        failed response (if any)
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds to wait before the next try, None if the server
+            asks to wait longer than max_retry_after (not retried).
+        """
+        retry_after = self.retry_after(response)
+
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+
+        return self.backoff(attempt)
+
+    @classmethod
+    def retry_after(cls, response):
+        """
+        Seconds the server asks to wait, read from the `Retry-After` header
+        (delta-seconds or http-date) or from the 429 error message.
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        response          Response        failed response (if any)
+        ================  =============   ====================================
+
+        Returns:
+            (float) seconds to wait or None if the server doesn't say it.
+        """
+        if response is None:
+            return None
+
+        value = (response.headers or {}).get('Retry-After')
+
+        if value:
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                pass
+
+            try:
+                retry_date = email_utils.parsedate_to_datetime(value)
+                if retry_date.tzinfo is None:
+                    retry_date = retry_date.replace(tzinfo=timezone.utc)
+                return max(
+                    (retry_date - datetime.now(timezone.utc)).total_seconds(),
+                    0.0)
+            except (TypeError, ValueError, IndexError):
+                pass
+
+        if response.status_code == cls.THROTTLE_STATUS_CODE:
+            match = cls._RETRY_AFTER_MSG_REGEX.search(response.text or '')
+            if match:
+                return float(match.group(1))
+
+        return None
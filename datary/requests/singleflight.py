@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Datary sdk Requests Singleflight File
+"""
+import threading
+
+from .response import DataryResponse
+
+
+class DataryInflightCall(object):
+    """
+    A request in flight, waited by the callers coalesced with it.
+    """
+
+    __slots__ = ('done', 'result', 'exception', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+        self.waiters = 0
+
+
+class DataryRequestCoalescer(object):
+    """
+    Singleflight of idempotent requests: concurrent identical GETs (same
+    url, params and auth) share a single request in flight and its
+    response body (see DataryResponse). Requests done after it ends are
+    sent again, nothing is cached.
+
+    Every coalesced caller gets its own response over the shared body
+    bytes, decoding its own object from them, so it can be mutated by its
+    caller. A coalescer can be shared between clients, their auth is in the
+    key.
+    """
+
+    def __init__(self):
+        super(DataryRequestCoalescer, self).__init__()
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._inflight)
+
+    @classmethod
+    def key(cls, url, params=None, headers=None):
+        """
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        url               str             request url
+        params            dict            request query params
+        headers           dict            request headers
+        ================  =============   ====================================
+
+        Returns:
+            (tuple) key of the identical requests, different for each user.
+        """
+        headers = headers or {}
+        return (
+            url,
+            tuple(sorted((params or {}).items())),
+            headers.get('Authorization'),
+            headers.get('Accept-Encoding'))
+
+    def call(self, key, function, *args, **kwargs):
+        """
+        Call the function, unless an identical call is in flight: then wait
+        for it and share its result (or exception).
+
+        ================  =============   ====================================
+        Parameter         Type            Description
+        ================  =============   ====================================
+        key               tuple           key of the identical calls
+        function          callable        call sending the request
+        ================  =============   ====================================
+
+        Returns:
+            result of the function, shared by the coalesced calls (a copy
+            of it for each caller if it's a DataryResponse).
+        """
+        with self._lock:
+            inflight = self._inflight.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight[key] = DataryInflightCall()
+                self.calls += 1
+            else:
+                inflight.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            inflight.done.wait()
+            if inflight.exception is not None:
+                raise inflight.exception
+            return self.share(inflight.result)
+
+        try:
+            inflight.result = function(*args, **kwargs)
+        except Exception as ex:
+            inflight.exception = ex
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                waiters = inflight.waiters
+            inflight.done.set()
+
+        # no caller joined, the leader owns the response.
+        if not waiters:
+            return inflight.result
+        return self.share(inflight.result)
+
+    def share(self, result):
+        """
+        Returns:
+            result of a coalesced call for one of its callers.
+        """
+        if isinstance(result, DataryResponse):
+            return result.copy()
+        return result
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Circuit Breaker test file
+"""
+import unittest
+
+import mock
+import requests
+
+from datary import Datary
+from datary.requests import DataryCircuitBreaker
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryCircuitBreakerTestCase(unittest.TestCase):
+    """
+    DataryCircuitBreaker Test case
+    """
+
+    url = 'http://api.datary.io/workdirs/4456/changes'
+    endpoint = 'workdirs/{}/changes'
+
+    @mock.patch.object(DataryCircuitBreaker, 'clock', return_value=0)
+    def test_states(self, mock_clock):
+        """
+        Test circuit closed, open and half open states
+        """
+        breaker = DataryCircuitBreaker(
+            failure_threshold=3, recovery_timeout=10)
+        self.assertEqual(breaker.state(self.endpoint), breaker.CLOSED)
+
+        # consecutive failures open it
+        breaker.record(self.endpoint, status_code=503)
+        breaker.record(self.endpoint, status_code=404)
+        breaker.record(self.endpoint, exception=ValueError('err'))
+        breaker.record(self.endpoint, status_code=500)
+        self.assertEqual(breaker.state(self.endpoint), breaker.CLOSED)
+        breaker.record(self.endpoint, status_code=502)
+        self.assertEqual(breaker.state(self.endpoint), breaker.OPEN)
+        self.assertFalse(breaker.allow(self.endpoint))
+
+        # other endpoints are not affected
+        self.assertTrue(breaker.allow('repos/{}'))
+
+        # half open after the recovery timeout, a single trial
+        mock_clock.return_value = 10
+        self.assertEqual(breaker.state(self.endpoint), breaker.HALF_OPEN)
+        self.assertTrue(breaker.allow(self.endpoint))
+        self.assertFalse(breaker.allow(self.endpoint))
+
+        # a failed trial opens it again
+        breaker.record(self.endpoint, status_code=500)
+        self.assertFalse(breaker.allow(self.endpoint))
+
+        # a released trial can be taken again
+        mock_clock.return_value = 20
+        self.assertTrue(breaker.allow(self.endpoint))
+        breaker.release(self.endpoint)
+        self.assertTrue(breaker.allow(self.endpoint))
+
+        # a successful trial closes it
+        breaker.record(self.endpoint, status_code=200)
+        self.assertEqual(
+            breaker.dump(),
+            {self.endpoint: {'state': 'closed', 'failures': 0},
+             'repos/{}': {'state': 'closed', 'failures': 0}})
+        self.assertTrue(breaker.allow(self.endpoint))
+
+    @mock.patch('time.sleep')
+    @mock.patch('datary.requests.requests.requests.Session.post')
+    def test_request(self, mock_post, mock_sleep):
+        """
+        Test requests of an open circuit fail without being sent
+        """
+        breaker = DataryCircuitBreaker(
+            failure_threshold=2, recovery_timeout=10)
+        datary = Datary(
+            token='123', circuit_breaker=breaker, tries_limit=5)
+        mock_post.side_effect = requests.ConnectionError('down')
+
+        with mock.patch.object(DataryCircuitBreaker, 'clock', return_value=0):
+            self.assertIsNone(datary.request(self.url, 'POST'))
+            self.assertIsNone(datary.request(self.url, 'POST'))
+            self.assertEqual(breaker.state(self.endpoint), breaker.OPEN)
+            self.assertEqual(mock_post.call_count, 2)
+
+            self.assertIsNone(datary.request(self.url, 'POST'))
+            self.assertEqual(mock_post.call_count, 2)
+
+        # recovered after the timeout
+        mock_post.side_effect = None
+        mock_post.return_value = MockRequestResponse("")
+
+        with mock.patch.object(
+                DataryCircuitBreaker, 'clock', return_value=10):
+            self.assertTrue(datary.request(self.url, 'POST'))
+            self.assertEqual(breaker.state(self.endpoint), breaker.CLOSED)
+
+    @mock.patch('time.sleep')
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_retries(self, mock_get, mock_sleep):
+        """
+        Test retries stop once the circuit opens
+        """
+        breaker = DataryCircuitBreaker(failure_threshold=2)
+        datary = Datary(
+            token='123', circuit_breaker=breaker, tries_limit=5)
+        mock_get.return_value = MockRequestResponse("", status_code=503)
+
+        self.assertIsNone(datary.request(self.url, 'GET'))
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_sleep.call_count, 1)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Budget test file
+"""
+import mock
+
+from datary.requests import DataryRequestBudgetExceeded
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryRequestBudgetTestCase(DataryTestCase):
+    """
+    DataryRequestBudget Test case
+    """
+
+    @mock.patch.object(DataryTestCase.datary, 'session')
+    def test_request_budget(self, mock_session):
+        """
+        Test request budget by endpoint & sdk method
+        """
+        mock_session.get.side_effect = [
+            MockRequestResponse("", json=self.json_repo),
+            MockRequestResponse("", json=self.changes)]
+
+        with self.datary.request_budget(max_requests=2) as budget:
+            self.datary.get_wdir_changes(repo_uuid=self.repo_uuid)
+
+        self.assertEqual(budget.count, 2)
+        self.assertEqual(budget.by_endpoint['GET repos/{}'], 1)
+        self.assertEqual(budget.by_endpoint['GET workdirs/{}/changes'], 1)
+        self.assertEqual(budget.by_caller['get_describerepo'], 1)
+        self.assertEqual(budget.by_caller['get_wdir_changes'], 1)
+        self.assertEqual(budget.by_entry['get_wdir_changes'], 2)
+        self.assertNotIn(budget, self.datary.observers)
+
+        # finished requests aren't kept
+        self.assertEqual(budget._methods, {})
+
+        budget.assert_at_most(1, endpoint='GET repos/{}')
+        self.assertRaises(
+            DataryRequestBudgetExceeded,
+            budget.assert_at_most, 0, caller='get_describerepo')
+
+        # exceeded when the block ends
+        mock_session.get.side_effect = None
+        mock_session.get.return_value = MockRequestResponse(
+            "", json=self.json_repo)
+
+        with self.assertRaises(DataryRequestBudgetExceeded) as context:
+            with self.datary.request_budget(max_requests=1):
+                self.datary.get_describerepo(self.repo_uuid)
+                self.datary.get_describerepo(self.repo_uuid)
+
+        self.assertIn(
+            '2 requests exceeds the budget of 1', str(context.exception))
+
+    @mock.patch.object(DataryTestCase.datary, 'session')
+    def test_operation_commit_budget(self, mock_session):
+        """
+        Test operation_commit of 100 elements makes at most 110 requests.
+        """
+        mock_session.post.return_value = MockRequestResponse("")
+        actual_commit = [
+            ['a', 'file{}'.format(x), {'kern': [], 'meta': {}}, str(x)]
+            for x in range(100)]
+
+        with self.datary.request_budget(max_requests=110) as budget:
+            self.datary.operation_commit(self.wdir_uuid, [], actual_commit)
+
+        self.assertEqual(budget.by_caller['add_file'], 100)
+        # operations are applied from worker threads
+        self.assertEqual(budget.by_entry['apply_operation'], 100)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Response Cache test file
+"""
+import mock
+
+from datary import Datary
+from datary.requests import DataryResponseCache
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryResponseCacheTestCase(DataryTestCase):
+    """
+    DataryResponseCache Test case
+    """
+
+    def test_key(self):
+        """
+        Test DataryResponseCache key
+        """
+        key1 = DataryResponseCache.key(
+            self.url, {'a': 1, 'b': 2}, {'Authorization': 'Bearer 1'})
+        key2 = DataryResponseCache.key(
+            self.url, {'b': 2, 'a': 1}, {'Authorization': 'Bearer 1'})
+        key3 = DataryResponseCache.key(
+            self.url, {'b': 2, 'a': 1}, {'Authorization': 'Bearer 2'})
+
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+    def test_store(self):
+        """
+        Test DataryResponseCache store & lru eviction
+        """
+        cache = DataryResponseCache(max_entries=2)
+
+        # without validators responses aren't stored
+        response = MockRequestResponse("", json=self.workdir, headers={})
+        self.assertIs(cache.store(('a',), response), response)
+        self.assertEqual(len(cache), 0)
+
+        for key in ['a', 'b', 'c']:
+            response = MockRequestResponse(
+                "", json=self.workdir, headers={'ETag': key})
+            result = cache.store((key,), response)
+            self.assertTrue(result)
+            self.assertEqual(result.status_code, 200)
+            self.assertEqual(result.json(), self.workdir)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(('a',)), None)
+        self.assertEqual(cache.get(('c',)).get('etag'), 'c')
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_response(self):
+        """
+        Test DataryResponseCache serves responses owning their body
+        """
+        cache = DataryResponseCache()
+        cache.store(('a',), MockRequestResponse(
+            "", json={'a': [1]}, headers={'ETag': '1'}))
+        entry = cache.get(('a',))
+        self.assertEqual(entry['content'], b'{"a": [1]}')
+
+        cached = cache.response(entry)
+        self.assertTrue(cached)
+        self.assertEqual(cached.text, '{"a": [1]}')
+        cached.json()['a'].append(2)
+        self.assertEqual(cached.content, None)
+
+        cached2 = cache.response(entry)
+        cached_copy = cached2.copy()
+        self.assertEqual(cached2.json(), {'a': [1]})
+        self.assertEqual(cached_copy.json(), {'a': [1]})
+        self.assertIsNot(cached_copy.json(), cached2.json())
+        self.assertEqual(cached_copy.headers, {'ETag': '1'})
+        self.assertEqual(entry['content'], b'{"a": [1]}')
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_mutated_response(self, mock_request):
+        """
+        Test callers editing a served body don't change the cached one
+        """
+        datary = Datary(
+            token=self.test_token, response_cache=DataryResponseCache())
+        original = [['a', 'b'], [1, 2]]
+        url = 'http://api.datary.io/datasets/9132/original'
+
+        mock_request.return_value = MockRequestResponse(
+            "", json=original, headers={'ETag': '"v1"'})
+        kern = datary.response_json(datary.request(url, 'GET'))
+        kern.append([3, 4])
+
+        # not modified: the served body is still the original one
+        mock_request.return_value = MockRequestResponse(
+            "", status_code=304, headers={})
+        for row in ([5, 6], [7, 8]):
+            kern = datary.response_json(datary.request(url, 'GET'))
+            self.assertEqual(kern, original)
+            kern.append(row)
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_request(self, mock_request):
+        """
+        Test DataryRequests conditional GET requests
+        """
+        datary = Datary(
+            token=self.test_token, response_cache=DataryResponseCache())
+        headers = {
+            'Authorization': 'Bearer {}'.format(self.test_token)}
+
+        mock_json = mock.Mock(return_value=self.workdir)
+        mock_response = MockRequestResponse("", headers={
+            'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        mock_response.json = mock_json
+
+        mock_request.return_value = mock_response
+        result = datary.request(self.url, 'GET', headers=headers)
+        self.assertEqual(result.json(), self.workdir)
+        self.assertEqual(
+            mock_request.call_args[1]['headers'].get('If-None-Match'), None)
+
+        # not modified serves the cached object
+        mock_request.return_value = MockRequestResponse(
+            "", status_code=304, headers={})
+        result2 = datary.request(self.url, 'GET', headers=headers)
+        self.assertEqual(result2.json(), self.workdir)
+        self.assertIsNot(result2.json(), result.json())
+
+        request_headers = mock_request.call_args[1]['headers']
+        self.assertEqual(request_headers.get('If-None-Match'), '"v1"')
+        self.assertEqual(
+            request_headers.get('If-Modified-Since'),
+            'Wed, 21 Oct 2015 07:28:00 GMT')
+
+        # caller headers untouched
+        self.assertNotIn('If-None-Match', headers)
+
+        # body decoded only once
+        self.assertEqual(mock_json.call_count, 1)
+
+        # modified response replaces the cached one
+        mock_request.return_value = MockRequestResponse(
+            "", json=self.wdir_json, headers={'ETag': '"v2"'})
+        result3 = datary.request(self.url, 'GET', headers=headers)
+        self.assertEqual(result3.json(), self.wdir_json)
+
+        # other users don't share the cache
+        mock_request.return_value = MockRequestResponse(
+            "", status_code=304, headers={})
+        result4 = datary.request(self.url, 'GET', headers={
+            'Authorization': 'Bearer other'})
+        self.assertEqual(result4, None)
+
+        # GET requests with a body aren't cached
+        mock_request.return_value = MockRequestResponse(
+            "", json={}, headers={'ETag': '"v3"'})
+        datary.request(self.url, 'GET', headers=headers, data={'a': 1})
+        self.assertNotIn(
+            'If-None-Match', mock_request.call_args[1]['headers'])
+
+        # not GET requests aren't cached
+        with mock.patch('datary.requests.requests.requests.Session.post') \
+                as mock_post:
+            mock_post.return_value = MockRequestResponse(
+                "", json={}, headers={'ETag': '"v3"'})
+            datary.request(self.url, 'POST', headers=headers)
+            self.assertNotIn(
+                'If-None-Match', mock_post.call_args[1]['headers'])
+        self.assertEqual(len(datary.response_cache), 1)
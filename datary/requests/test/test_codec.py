@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Json Codec test file
+"""
+import unittest
+import mock
+
+from datary import Datary
+from datary.requests import codec as codec_module
+from datary.requests import (
+    DataryJsonCodec, DataryOrjsonCodec, get_codec)
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryJsonCodecTestCase(DataryTestCase):
+    """
+    DataryJsonCodec Test case
+    """
+
+    value = {'__kern': [[1, 'a', None], [2.5, 'ñ', True]], '__meta': {}}
+
+    def test_get_codec(self):
+        """
+        Test get_codec by name, instance & auto
+        """
+        self.assertIsInstance(get_codec('json'), DataryJsonCodec)
+
+        codec = DataryJsonCodec()
+        self.assertIs(get_codec(codec), codec)
+
+        self.assertRaises(ValueError, get_codec, 'nope')
+
+        with mock.patch.object(codec_module, 'orjson', None):
+            self.assertEqual(get_codec().name, 'json')
+            self.assertRaises(ImportError, get_codec, 'orjson')
+
+        if codec_module.orjson is not None:
+            self.assertEqual(get_codec().name, 'orjson')
+            self.assertEqual(get_codec('auto').name, 'orjson')
+
+    def test_json_codec(self):
+        """
+        Test stdlib codec encode & decode
+        """
+        self.check_codec(DataryJsonCodec())
+
+    @unittest.skipIf(codec_module.orjson is None, 'orjson not installed')
+    def test_orjson_codec(self):
+        """
+        Test orjson codec encode & decode
+        """
+        codec = DataryOrjsonCodec()
+        self.check_codec(codec)
+
+        # non str keys as stdlib
+        self.assertEqual(codec.loads(codec.dumpb({1: 2})), {'1': 2})
+
+    def check_codec(self, codec):
+        data = codec.dumpb(self.value)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(codec.loads(data), self.value)
+        self.assertEqual(codec.loads(codec.dumps(self.value)), self.value)
+        self.assertRaises(ValueError, codec.loads, b'{nope')
+
+        # incremental encoding, the same document row by row
+        value = {'a': {1: self.value['__kern'], 'b': []}, 'c': {}}
+        self.assertEqual(b''.join(codec.iterdumpb(value)), codec.dumpb(value))
+        self.assertEqual(
+            b''.join(codec.iterdumpb(iter(self.value['__kern']))),
+            codec.dumpb(self.value['__kern']))
+
+        # decoded from the body bytes, not from response.json()
+        response = mock.Mock(content=data)
+        self.assertEqual(codec.decode(response), self.value)
+        self.assertEqual(response.json.call_count, 0)
+
+        # already decoded responses
+        response = mock.Mock(content=None)
+        response.json.return_value = self.value
+        self.assertEqual(codec.decode(response), self.value)
+
+    def test_client_codec(self):
+        """
+        Test client codec decoding responses & encoding blobs
+        """
+        codec = mock.Mock(wraps=DataryJsonCodec())
+        datary = Datary(codec=codec)
+
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.get.return_value = MockRequestResponse(
+                "", json=self.workdir)
+            self.assertEqual(
+                datary.get_wdir_filetree(self.wdir_uuid), self.workdir)
+            self.assertEqual(codec.decode.call_count, 1)
+
+            mock_session.post.return_value = MockRequestResponse("")
+            datary.add_file(self.wdir_uuid, {
+                'path': 'a', 'basename': 'b',
+                'data': {'kern': [[1]], 'meta': {}}})
+
+            # the blob is encoded while the body is read.
+            body = mock_session.post.call_args[1]['data'].read()
+            codec.iterdumpb.assert_called_once_with(
+                {'__kern': [[1]], '__meta': {}})
+            self.assertIn(b'{"__kern": [[1]], "__meta": {}}', body)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Compression test file
+"""
+import gzip
+import unittest
+import mock
+
+from datary import Datary
+from datary.requests import compression
+from datary.requests import (
+    DataryCompressedBody, DataryMultipartStream, DataryRequestEvent)
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryCompressionTestCase(DataryTestCase):
+    """
+    Request & response compression Test case
+    """
+
+    element = {
+        'path': 'a', 'basename': 'b',
+        'data': {'kern': [['row', x] for x in range(1000)], 'meta': {}}}
+
+    def test_compressor(self):
+        """
+        Test compressors & decompressors by encoding
+        """
+        data = b'datary' * 1000
+        compressor = compression.compressor('gzip')
+        compressed = compressor.compress(data) + compressor.flush()
+        self.assertEqual(gzip.decompress(compressed), data)
+        self.assertEqual(
+            compression.decompressor('gzip').decompress(compressed), data)
+
+        self.assertRaises(ValueError, compression.compressor, 'nope')
+        self.assertRaises(ValueError, compression.decompressor, 'nope')
+
+        with mock.patch.object(compression, 'zstandard', None):
+            self.assertEqual(compression.encodings(), ['gzip'])
+            self.assertRaises(ImportError, compression.compressor, 'zstd')
+            self.assertRaises(ImportError, Datary, compression='zstd')
+
+    def test_accept_encoding(self):
+        """
+        Test only the decoded response encodings are accepted
+        """
+        urllib3_response = mock.Mock(brotli=None, HAS_ZSTD=False)
+        with mock.patch.object(
+                compression, 'urllib3_response', urllib3_response):
+            self.assertEqual(compression.accept_encoding(), 'gzip, deflate')
+            self.assertEqual(
+                compression.accept_encoding('zstd, gzip;q=0.5'), 'gzip;q=0.5')
+            self.assertEqual(compression.accept_encoding('zstd'), 'identity')
+            self.assertEqual(
+                compression.accept_encoding('identity'), 'identity')
+
+            datary = Datary(accept_encoding='zstd, gzip')
+            self.assertEqual(
+                datary.session.headers['Accept-Encoding'], 'gzip')
+
+        urllib3_response.HAS_ZSTD = True
+        with mock.patch.object(
+                compression, 'urllib3_response', urllib3_response):
+            self.assertEqual(
+                compression.accept_encoding('zstd, gzip'), 'zstd, gzip')
+
+    @unittest.skipIf(compression.zstandard is None, 'zstandard not installed')
+    def test_zstd_compressor(self):
+        """
+        Test zstd compressor & decompressor
+        """
+        data = b'datary' * 1000
+        compressor = compression.compressor('zstd')
+        compressed = compressor.compress(data) + compressor.flush()
+        self.assertEqual(
+            compression.decompressor('zstd').decompress(compressed), data)
+
+    def test_compressed_body(self):
+        """
+        Test compressed streamed body, read & rewound
+        """
+        stream = DataryMultipartStream.for_change('add', self.element)
+        data = stream.read()
+        stream.rewind()
+
+        body = DataryCompressedBody(stream, 'gzip', chunk_size=1024)
+        self.assertIsNone(body.len)
+        self.assertTrue(body.rewindable)
+
+        compressed = b''.join(body)
+        self.assertEqual(gzip.decompress(compressed), data)
+        self.assertEqual(body.sent, len(compressed))
+        self.assertEqual(body.content_bytes, len(data))
+        self.assertLess(len(compressed), len(data) / 5)
+
+        body.rewind()
+        self.assertEqual(body.read(), compressed)
+
+    def test_request_compression(self):
+        """
+        Test client compressing the uploads & advertising Accept-Encoding
+        """
+        datary = Datary(compression='gzip', accept_encoding='gzip')
+        self.assertEqual(datary.session.headers['Accept-Encoding'], 'gzip')
+        self.assertIn('gzip', Datary().session.headers['Accept-Encoding'])
+
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.post.return_value = MockRequestResponse("")
+            self.assertTrue(datary.add_file(self.wdir_uuid, self.element))
+
+            kwargs = mock_session.post.call_args[1]
+            self.assertEqual(kwargs['headers']['Content-Encoding'], 'gzip')
+            self.assertIsInstance(kwargs['data'], DataryCompressedBody)
+            self.assertIn(
+                b'"__kern"', gzip.decompress(kwargs['data'].read()))
+
+            # forms are not compressed
+            mock_session.post.reset_mock()
+            datary.add_dir(self.wdir_uuid, 'a', 'b')
+            self.assertNotIn(
+                'Content-Encoding', mock_session.post.call_args[1]['headers'])
+
+    def test_event_bytes(self):
+        """
+        Test request event wire & content bytes
+        """
+        response = MockRequestResponse("", json=[['row', 1]] * 100, headers={
+            'Content-Encoding': 'gzip', 'Content-Length': '30'})
+        response.request = mock.Mock(
+            body=DataryCompressedBody(
+                DataryMultipartStream.for_change('add', self.element)),
+            headers={'Content-Encoding': 'gzip'})
+        response.request.body.read()
+
+        event = DataryRequestEvent('http://datary.io/me/repos', 'POST').end(
+            response=response)
+        self.assertEqual(event.request_bytes, response.request.body.sent)
+        self.assertEqual(
+            event.request_content_bytes, response.request.body.content_bytes)
+        self.assertEqual(event.request_encoding, 'gzip')
+        self.assertEqual(event.response_bytes, 30)
+        self.assertEqual(event.response_content_bytes, len(response.content))
+        self.assertEqual(event.response_encoding, 'gzip')
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Hedging test file
+"""
+import json
+import time
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mock
+
+from datary import Datary
+from datary.requests import DataryHedgingPolicy, DataryMetrics
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryHedgingPolicyTestCase(unittest.TestCase):
+    """
+    DataryHedgingPolicy Test case
+    """
+
+    url = 'http://api.datary.io/datasets/9132/original'
+
+    def test_delay(self):
+        """
+        Test hedging delay of an endpoint latencies percentile
+        """
+        policy = DataryHedgingPolicy(
+            percentile=90, min_samples=10, min_delay=0.001)
+        self.assertIsNone(policy.delay('a'))
+
+        for latency in range(1, 11):
+            policy.observe('a', latency / 100.0)
+        self.assertAlmostEqual(policy.delay('a'), 0.09)
+        self.assertIsNone(policy.delay('b'))
+
+        # only the last window latencies are kept
+        policy = DataryHedgingPolicy(
+            percentile=50, window=4, min_samples=4, min_delay=0)
+        for latency in [9, 1, 8, 2, 3, 4, 5]:
+            policy.observe('a', latency)
+        self.assertEqual(policy.delay('a'), 4)
+
+        # fixed delay, never under the min one
+        self.assertEqual(DataryHedgingPolicy(delay=0.2).delay('b'), 0.2)
+        self.assertEqual(
+            DataryHedgingPolicy(delay=0, min_delay=0.01).delay('b'), 0.01)
+
+        self.assertTrue(DataryHedgingPolicy.is_hedgeable('GET', {}))
+        self.assertFalse(
+            DataryHedgingPolicy.is_hedgeable('GET', {'stream': True}))
+        self.assertFalse(
+            DataryHedgingPolicy.is_hedgeable('GET', {'data': {'a': 1}}))
+        self.assertFalse(DataryHedgingPolicy.is_hedgeable('POST', {}))
+
+    def test_budget(self):
+        """
+        Test hedges bounded by their ratio of the requests
+        """
+        policy = DataryHedgingPolicy(delay=0, min_delay=0, max_ratio=0.25)
+        slow = threading.Event()
+        function = mock.Mock(side_effect=lambda: slow.wait(0.05) or 'r')
+        hedge = mock.Mock(return_value='h')
+
+        results = [policy.call('a', function, hedge) for _ in range(8)]
+
+        self.assertEqual(policy.requests, 8)
+        self.assertEqual(policy.hedges, 2)
+        self.assertEqual(sum(hedged for _, hedged, _ in results), 2)
+        self.assertEqual(function.call_count, 8)
+        self.assertEqual(hedge.call_count, 2)
+
+    def test_call(self):
+        """
+        Test the first response of a hedged request is used
+        """
+        policy = DataryHedgingPolicy(delay=0.01, max_ratio=1, burst=1)
+        release = threading.Event()
+        slow = MockRequestResponse("slow")
+        slow.close = mock.Mock()
+        fast = MockRequestResponse("fast")
+        responses = [slow, fast]
+        threads = []
+
+        def function():
+            threads.append(threading.current_thread())
+            response = responses.pop(0)
+            if response is slow:
+                release.wait(5)
+            return response
+
+        threading.Timer(0.05, release.set).start()
+        response, hedged, hedge_won = policy.call('a', function)
+        self.assertIs(response, fast)
+        self.assertTrue(hedged)
+        self.assertTrue(hedge_won)
+        self.assertEqual(policy.hedge_wins, 1)
+
+        # the request is sent by the calling thread, only its hedge isn't
+        self.assertIs(threads[0], threading.current_thread())
+        self.assertIsNot(threads[1], threading.current_thread())
+
+        # the slow response is discarded
+        self.assertEqual(slow.close.call_count, 1)
+
+        # fast requests are not hedged
+        policy = DataryHedgingPolicy(delay=1, max_ratio=1, burst=1)
+        self.assertEqual(
+            policy.call('a', lambda: fast), (fast, False, False))
+        self.assertEqual(policy.hedges, 0)
+
+        # a failed hedge doesn't win over the slow response
+        policy = DataryHedgingPolicy(delay=0.01, max_ratio=1, burst=1)
+        release.clear()
+        error = MockRequestResponse("", status_code=503)
+        responses = [slow, error]
+        threading.Timer(0.05, release.set).start()
+        self.assertEqual(
+            policy.call('a', function), (slow, True, False))
+
+        # a failed request waits for its hedge
+        policy = DataryHedgingPolicy(delay=0.01, max_ratio=1, burst=1)
+        release.clear()
+        responses = [error, fast]
+
+        def failing():
+            release.wait(0.05)
+            return responses.pop(0)
+
+        self.assertEqual(policy.call('a', failing), (fast, True, True))
+
+    def test_close(self):
+        """
+        Test closing the policy stops its threads
+        """
+        policy = DataryHedgingPolicy(delay=0.01, max_ratio=1, burst=1)
+        slow = lambda: time.sleep(0.05) or 'slow'  # noqa: E731
+        self.assertEqual(policy.call('a', slow), ('slow', True, False))
+
+        timer = policy._timer
+        policy.close()
+        self.assertFalse(timer.is_alive())
+        self.assertIsNone(policy._executor)
+
+        # used again, its threads are started again
+        self.assertEqual(policy.call('a', slow), ('slow', True, False))
+        self.assertTrue(policy._timer.is_alive())
+
+        datary = Datary(token='123', hedging_policy=policy)
+        datary.close()
+        self.assertIsNone(policy._timer)
+        self.assertIsNone(policy._executor)
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_concurrency(self, mock_get):
+        """
+        Test concurrent requests don't wait for the policy threads
+        """
+        policy = DataryHedgingPolicy(delay=0.5, max_ratio=1, max_workers=1)
+        datary = Datary(token='123', hedging_policy=policy)
+        mock_get.side_effect = lambda url, **kwargs: (
+            time.sleep(0.1) or MockRequestResponse("", json={}))
+
+        threads = [
+            threading.Thread(target=datary.request, args=(self.url, 'GET'))
+            for _ in range(16)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(mock_get.call_count, 16)
+        self.assertEqual(policy.hedges, 0)
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_request(self, mock_get):
+        """
+        Test hedged GETs of a client, their metrics and their budget
+        """
+        metrics = DataryMetrics()
+        policy = DataryHedgingPolicy(delay=0.01, max_ratio=1, burst=1)
+        datary = Datary(
+            token='123', hedging_policy=policy, observers=[metrics])
+        release = threading.Event()
+        calls = []
+
+        def get(url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(5)
+            return MockRequestResponse("", json={'call': len(calls)})
+
+        mock_get.side_effect = get
+        threading.Timer(0.1, release.set).start()
+        with datary.request_budget() as budget:
+            response = datary.request(self.url, 'GET')
+
+        self.assertEqual(response.json(), {'call': 2})
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(budget.count, 2)
+        self.assertEqual(
+            [call['hedge'] for call in budget.calls], [False, True])
+
+        stats = metrics.dump()['endpoints']['GET datasets/{}/original']
+        self.assertEqual(stats['tries'], 2)
+        self.assertEqual(stats['retries'], 0)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(stats['hedges'], 1)
+        self.assertEqual(stats['hedge_wins'], 1)
+        self.assertIn(
+            'datary_request_hedges_total{endpoint="datasets/{}/original",'
+            'method="GET"} 1', metrics.render())
+
+        # hedges wait for the rate limiter
+        rate_limiter = mock.Mock()
+        datary.rate_limiter = rate_limiter
+        calls.clear()
+        release.clear()
+        threading.Timer(0.1, release.set).start()
+        datary.request(self.url, 'GET')
+        self.assertEqual(rate_limiter.acquire.call_count, 2)
+
+        # not GET requests are not hedged
+        with mock.patch('datary.requests.requests.requests.Session.post',
+                        return_value=MockRequestResponse("")):
+            datary.request(self.url, 'POST')
+        self.assertEqual(policy.requests, 2)
+
+    def test_cancel(self):
+        """
+        Test a winning hedge cancels the slow request in flight
+        """
+        release = threading.Event()
+        calls = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                calls.append(self.path)
+                if len(calls) == 2:
+                    release.wait(5)
+                body = json.dumps({'call': len(calls)}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(release.set)
+
+        policy = DataryHedgingPolicy(delay=0.05, max_ratio=1, burst=1)
+        datary = Datary(token='123', hedging_policy=policy)
+        url = 'http://127.0.0.1:{}/datasets/9132/original'.format(
+            server.server_address[1])
+
+        # session made and connected, the slow request is the next one
+        self.assertIsNotNone(datary.session)
+        self.assertEqual(datary.request(url, 'GET').json(), {'call': 1})
+
+        start = time.perf_counter()
+        response = datary.request(url, 'GET')
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(response.json(), {'call': 3})
+        self.assertEqual(policy.hedge_wins, 1)
+
+        # the pooled connections are still usable
+        self.assertEqual(datary.request(url, 'GET').json(), {'call': 4})
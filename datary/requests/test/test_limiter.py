@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Rate Limiter test file
+"""
+import os
+import tempfile
+import threading
+import unittest
+
+import mock
+
+from datary import Datary
+from datary.requests import (
+    DataryTokenBucket, DataryFileTokenBucket, DataryRateLimiter)
+from datary.requests.endpoints import endpoint_template
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryEndpointsTestCase(unittest.TestCase):
+    """
+    Datary endpoints Test case
+    """
+
+    def test_endpoint_template(self):
+        """
+        Test endpoint_template
+        """
+        base = 'http://api.datary.io/'
+        expected = {
+            'members/me/sessions': 'members/{}/sessions',
+            'me/repos': 'me/repos',
+            'repos/1234': 'repos/{}',
+            'repos/1234/commits': 'repos/{}/commits',
+            'workdirs/4456/filetree': 'workdirs/{}/filetree',
+            'workdirs/4456/changes': 'workdirs/{}/changes',
+            'datasets/9132/meta': 'datasets/{}/meta',
+            'commits/3256/filetree': 'commits/{}/filetree',
+            'search/members': 'search/members',
+        }
+
+        for path, template in expected.items():
+            self.assertEqual(endpoint_template(base + path), template)
+            self.assertEqual(
+                endpoint_template(base + path + '?namespace=1'), template)
+
+
+class DataryTokenBucketTestCase(unittest.TestCase):
+    """
+    DataryTokenBucket Test case
+    """
+
+    def test_reserve(self):
+        """
+        Test DataryTokenBucket reserve
+        """
+        with self.assertRaises(ValueError):
+            DataryTokenBucket(0)
+
+        with mock.patch.object(DataryTokenBucket, 'clock', return_value=0):
+            bucket = DataryTokenBucket(rate=2, burst=3)
+
+            # burst requests don't wait
+            self.assertEqual([bucket.reserve() for _ in range(3)], [0] * 3)
+
+            # next requests wait for its reserved tokens
+            self.assertEqual(bucket.reserve(), 0.5)
+            self.assertEqual(bucket.reserve(), 1)
+
+        # refill after 2 seconds
+        with mock.patch.object(DataryTokenBucket, 'clock', return_value=2):
+            self.assertEqual(bucket.reserve(), 0)
+
+        # never refills more than burst
+        with mock.patch.object(DataryTokenBucket, 'clock', return_value=100):
+            self.assertEqual([bucket.reserve() for _ in range(3)], [0] * 3)
+            self.assertEqual(bucket.reserve(), 0.5)
+
+    @mock.patch('datary.requests.limiter.time.sleep')
+    def test_acquire(self, mock_sleep):
+        """
+        Test DataryTokenBucket acquire
+        """
+        bucket = DataryTokenBucket(rate=1, burst=1)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertGreater(bucket.acquire(), 0.9)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    def test_threads(self):
+        """
+        Test DataryTokenBucket shared between threads
+        """
+        with mock.patch.object(DataryTokenBucket, 'clock', return_value=0):
+            bucket = DataryTokenBucket(rate=10, burst=10)
+            waits = []
+
+            def reserve():
+                for _ in range(10):
+                    waits.append(bucket.reserve())
+
+            threads = [threading.Thread(target=reserve) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # each request reserves its own slot
+        self.assertEqual(
+            sorted(waits), [max(x - 9, 0) / 10.0 for x in range(50)])
+
+    def test_file_bucket(self):
+        """
+        Test DataryFileTokenBucket shares state through its file
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'buckets', 'read.bucket')
+
+            with mock.patch.object(
+                    DataryFileTokenBucket, 'clock', return_value=0):
+                bucket1 = DataryFileTokenBucket(path, rate=1, burst=2)
+                bucket2 = DataryFileTokenBucket(path, rate=1, burst=2)
+
+                self.assertEqual(bucket1.reserve(), 0)
+                self.assertEqual(bucket2.reserve(), 0)
+                self.assertEqual(bucket1.reserve(), 1)
+                self.assertEqual(bucket2.reserve(), 2)
+
+            self.assertTrue(os.path.exists(path))
+
+
+class DataryRateLimiterTestCase(DataryTestCase):
+    """
+    DataryRateLimiter Test case
+    """
+
+    def test_from_rates(self):
+        """
+        Test DataryRateLimiter from_rates
+        """
+        limiter = DataryRateLimiter.from_rates(read=(10, 20), write=2)
+        self.assertEqual(limiter.buckets['read'].rate, 10)
+        self.assertEqual(limiter.buckets['read'].burst, 20)
+        self.assertEqual(limiter.buckets['write'].rate, 2)
+        self.assertEqual(limiter.buckets['write'].burst, 2)
+
+        limiter2 = DataryRateLimiter.from_rates(write=(2, 5))
+        self.assertEqual(list(limiter2.buckets.keys()), ['write'])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            limiter3 = DataryRateLimiter.from_rates(read=5, path=tmp_dir)
+            self.assertTrue(isinstance(
+                limiter3.buckets['read'], DataryFileTokenBucket))
+
+    def test_endpoint_class(self):
+        """
+        Test DataryRateLimiter endpoint_class
+        """
+        limiter = DataryRateLimiter()
+        changes_url = 'http://api.datary.io/workdirs/{}/changes'.format(
+            self.wdir_uuid)
+
+        self.assertEqual(limiter.endpoint_class(changes_url, 'POST'), 'write')
+        self.assertEqual(
+            limiter.endpoint_class(changes_url, 'DELETE'), 'write')
+        self.assertEqual(limiter.endpoint_class(changes_url, 'GET'), 'read')
+        self.assertEqual(limiter.endpoint_class(self.url, 'POST'), 'read')
+
+        # not limited endpoint class
+        self.assertEqual(limiter.acquire(changes_url, 'POST'), 0)
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_request(self, mock_request):
+        """
+        Test DataryRequests request waits for the rate limiter
+        """
+        mock_limiter = mock.Mock()
+        datary = Datary(token=self.test_token, rate_limiter=mock_limiter)
+
+        mock_request.return_value = MockRequestResponse("ok")
+        datary.request(self.url, 'GET')
+        mock_limiter.acquire.assert_called_once_with(self.url, 'GET')
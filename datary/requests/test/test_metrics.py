@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Hooks & Metrics test file
+"""
+import mock
+import requests
+
+from datary import Datary
+from datary.requests import (
+    DataryHistogram, DataryMetrics, DataryRequestObserver)
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryMetricsTestCase(DataryTestCase):
+    """
+    DataryMetrics Test case
+    """
+
+    def test_histogram(self):
+        """
+        Test DataryHistogram observe & quantile
+        """
+        histogram = DataryHistogram(buckets=(1, 2, 4))
+        self.assertIsNone(histogram.quantile(0.5))
+
+        for value in [0.5, 1.5, 1.5, 3, 10]:
+            histogram.observe(value)
+
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.sum, 16.5)
+        self.assertEqual(histogram.counts, [1, 2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 1.75)
+        self.assertEqual(histogram.quantile(0.99), 4)
+
+        dump = histogram.dump()
+        self.assertEqual(
+            dump['buckets'], {'1': 1, '2': 3, '4': 4, '+Inf': 5})
+        self.assertEqual(dump['p50'], 1.75)
+
+    @mock.patch('datary.requests.requests.time')
+    def test_observers(self, mock_time):
+        """
+        Test request observers & metrics
+        """
+        metrics = DataryMetrics()
+        events = []
+
+        class Observer(DataryRequestObserver):
+            def on_request_start(self, event):
+                events.append(('start', event.endpoint, event.attempt))
+
+            def on_request_end(self, event):
+                events.append(('end', event.status_code, event.attempt))
+
+        class FailingObserver(DataryRequestObserver):
+            def on_request_end(self, event):
+                raise ValueError('observer failure')
+
+        datary = Datary(
+            observers=[metrics, Observer(), FailingObserver()],
+            tries_limit=3)
+
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.get.side_effect = [
+                MockRequestResponse("", status_code=503),
+                requests.ConnectionError('down'),
+                MockRequestResponse("ok", json={})]
+
+            url = datary.URL_BASE + 'workdirs/12/changes'
+            self.assertTrue(datary.request(url, 'GET'))
+
+        self.assertEqual(events, [
+            ('start', 'workdirs/{}/changes', 1), ('end', 503, 1),
+            ('start', 'workdirs/{}/changes', 2), ('end', None, 2),
+            ('start', 'workdirs/{}/changes', 3), ('end', 200, 3)])
+
+        dump = metrics.dump()
+        self.assertEqual(dump['in_flight'], 0)
+        stats = dump['endpoints']['GET workdirs/{}/changes']
+        self.assertEqual(stats['tries'], 3)
+        self.assertEqual(stats['retries'], 2)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['statuses'], {'503': 1, '200': 1})
+        self.assertEqual(stats['duration']['count'], 3)
+
+        text = metrics.render()
+        self.assertIn(
+            'datary_requests_total{endpoint="workdirs/{}/changes",'
+            'method="GET",status="503"} 1', text)
+        self.assertIn(
+            'datary_request_retries_total{endpoint="workdirs/{}/changes",'
+            'method="GET"} 2', text)
+        self.assertIn(
+            'datary_request_duration_seconds_count{'
+            'endpoint="workdirs/{}/changes",method="GET"} 3', text)
+
+        # observers can be removed
+        datary.remove_observer(metrics)
+        metrics.reset()
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.get.return_value = MockRequestResponse("ok")
+            datary.request(url, 'GET')
+        self.assertEqual(metrics.dump()['endpoints'], {})
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Multipart test file
+"""
+import mock
+import requests
+
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from datary.requests import DataryJsonCodec, DataryMultipartStream
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryMultipartStreamTestCase(DataryTestCase):
+    """
+    DataryMultipartStream Test case
+    """
+
+    codec = DataryJsonCodec()
+    element = {
+        'path': 'a/b', 'basename': 'c',
+        'data': {'kern': [[1, 'ñ'], [2, None]], 'meta': {'x': 1}}}
+
+    def parse(self, body, content_type):
+        message = BytesParser(policy=HTTP).parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') +
+            b'\r\n\r\n' + body)
+        return {
+            part.get_param('name', header='content-disposition'):
+            part.get_payload(decode=True) for part in message.iter_parts()}
+
+    def test_for_change(self):
+        """
+        Test change body parts & length
+        """
+        body = DataryMultipartStream.for_change(
+            'add', self.element, codec=self.codec)
+        self.assertTrue(body.rewindable)
+        self.assertIsNone(body.len)
+
+        # sent with chunked transfer encoding, encoded only while read
+        with mock.patch.object(
+                body, 'iter_parts', wraps=body.iter_parts) as iter_parts:
+            request = requests.Request(
+                'POST', 'http://datary.io/', data=body).prepare()
+            self.assertEqual(request.headers['Transfer-Encoding'], 'chunked')
+            self.assertEqual(iter_parts.call_count, 0)
+
+            data = body.read()
+            self.assertEqual(iter_parts.call_count, 1)
+        self.assertEqual(body.len, len(data))
+        self.assertEqual(body.read(), b'')
+
+        parts = self.parse(data, body.content_type)
+        self.assertEqual(parts['blob'], self.codec.dumpb({
+            '__kern': self.element['data']['kern'], '__meta': {'x': 1}}))
+        self.assertEqual(parts['action'], b'add')
+        self.assertEqual(parts['filemode'], b'100644')
+        self.assertEqual(parts['dirname'], b'a/b')
+        self.assertEqual(parts['basename'], b'c')
+
+        # read by chunks or again
+        body.rewind()
+        chunks = [body.read(7) for _ in range(len(data) // 7 + 2)]
+        self.assertEqual(b''.join(chunks), data)
+        self.assertEqual(body.sent, len(data))
+
+        body.rewind()
+        self.assertEqual(b''.join(body), data)
+
+        # sent again with Content-Length
+        body.rewind()
+        request = requests.Request(
+            'POST', 'http://datary.io/', data=body).prepare()
+        self.assertEqual(
+            request.headers['Content-Length'], str(len(data)))
+
+    def test_read_once(self):
+        """
+        Test change body of a generator kern
+        """
+        element = dict(self.element, data={
+            'kern': (row for row in self.element['data']['kern']),
+            'meta': {'x': 1}})
+        body = DataryMultipartStream.for_change(
+            'modify', element, codec=self.codec)
+
+        self.assertFalse(body.rewindable)
+        self.assertIsNone(body.len)
+
+        # sent with chunked transfer encoding
+        request = requests.Request(
+            'POST', 'http://datary.io/', data=body).prepare()
+        self.assertEqual(request.headers['Transfer-Encoding'], 'chunked')
+
+        parts = self.parse(body.read(), body.content_type)
+        self.assertEqual(
+            self.codec.loads(parts['blob'])['__kern'],
+            self.element['data']['kern'])
+
+        self.assertRaises(ValueError, body.rewind)
+
+    def test_request_retry(self):
+        """
+        Test streamed bodies rewound to retry the request
+        """
+        bodies = []
+
+        def post(url, data=None, **kwargs):
+            bodies.append(data.read())
+            return responses.pop(0)
+
+        with mock.patch.object(self.datary, 'session') as mock_session, \
+                mock.patch('time.sleep'):
+            mock_session.post.side_effect = post
+
+            responses = [
+                MockRequestResponse("", status_code=429),
+                MockRequestResponse("")]
+            self.assertTrue(self.datary.add_file('wdir', self.element))
+            self.assertEqual(len(bodies), 2)
+            self.assertEqual(bodies[0], bodies[1])
+
+            # generator kerns are not retried
+            responses = [MockRequestResponse("", status_code=429)]
+            element = dict(self.element, data={
+                'kern': iter(self.element['data']['kern']), 'meta': {}})
+            self.assertFalse(self.datary.add_file('wdir', element))
+            self.assertEqual(len(bodies), 3)
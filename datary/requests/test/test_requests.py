@@ -2,9 +2,12 @@
 """
 Datary python sdk Requests test file
 """
+import threading
+
 import mock
 import requests
 
+from datary import Datary
 from datary.test.test_datary import DataryTestCase
 from datary.test.mock_requests import MockRequestResponse
 
@@ -14,7 +17,7 @@ class DataryRequestsTestCase(DataryTestCase):
     DataryRequests Test case
     """
 
-    @mock.patch('datary.requests.requests.requests')
+    @mock.patch.object(DataryTestCase.datary, 'session')
     @mock.patch('datary.requests.requests.time')
     def test_request(self, mock_time, mock_requests):
         """
@@ -22,8 +25,7 @@ class DataryRequestsTestCase(DataryTestCase):
         =============   =============   =======================================
         Parameter       Type            Description
         =============   =============   =======================================
-        mock_request    mock            Mock datary.requests.requests.request
-                                        function
+        mock_requests   mock            Mock datary pooled session
         =============   =============   =======================================
         """
 
@@ -90,7 +92,7 @@ class DataryRequestsTestCase(DataryTestCase):
         result8 = self.datary.request(self.url, 'GET')
         self.assertEqual(result8.text, 'Everything OK')
 
-        self.assertEqual(mock_time.sleep.call_count, 3+3)
+        self.assertEqual(mock_time.sleep.call_count, 2+3)
 
         mock_requests.get.side_effect = requests.RequestException('err')
         result6 = self.datary.request(self.url, 'GET')
@@ -100,3 +102,85 @@ class DataryRequestsTestCase(DataryTestCase):
         self.assertEqual(mock_requests.post.call_count, 1)
         self.assertEqual(mock_requests.put.call_count, 1)
         self.assertEqual(mock_requests.delete.call_count, 1)
+
+    def test_make_session(self):
+        """
+        Test DataryRequests keep-alive pooled session
+        """
+        datary = Datary(**{
+            'token': self.test_token,
+            'pool_connections': 3,
+            'pool_maxsize': 7,
+            'pool_block': True})
+
+        for prefix in ('http://', 'https://'):
+            adapter = datary.session.get_adapter(prefix + 'api.datary.io')
+            self.assertEqual(adapter._pool_connections, 3)
+            self.assertEqual(adapter._pool_maxsize, 7)
+            self.assertTrue(adapter._pool_block)
+
+        # every datary instance owns its own session
+        self.assertIsNot(datary.session, self.datary.session)
+
+        with mock.patch.object(datary.session, 'close') as mock_close:
+            datary.close()
+            self.assertEqual(mock_close.call_count, 1)
+
+    def test_headers(self):
+        """
+        Test read only base headers merged with the call ones
+        """
+        datary = Datary(token=self.test_token, headers={'X-Client': 'sdk'})
+
+        with self.assertRaises(TypeError):
+            datary.headers['Content-Type'] = 'text/plain'
+        self.assertEqual(datary.headers['X-Client'], 'sdk')
+        self.assertEqual(
+            datary.headers['Authorization'],
+            'Bearer {}'.format(self.test_token))
+
+        headers = datary.request_headers({'Content-Type': 'text/plain'})
+        self.assertEqual(headers['Content-Type'], 'text/plain')
+        self.assertEqual(headers['X-Client'], 'sdk')
+        self.assertEqual(
+            datary.headers['Content-Type'],
+            'application/x-www-form-urlencoded')
+
+        # signed out clients don't send the token
+        datary.token = None
+        self.assertNotIn('Authorization', datary.headers)
+
+    def test_threads(self):
+        """
+        Test a client shared between threads sends each call headers
+        """
+        datary = Datary(token=self.test_token)
+        sent = []
+
+        def post(url, data=None, headers=None, **kwargs):
+            # the body is read while the other threads send theirs.
+            data.read()
+            sent.append((headers['Content-Type'], data.content_type))
+            return MockRequestResponse("")
+
+        element = {
+            'path': 'a', 'basename': 'b',
+            'data': {'kern': [[1, 2]], 'meta': {}}}
+
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.post.side_effect = post
+            threads = [
+                threading.Thread(
+                    target=datary.add_file, args=('wdir', element))
+                for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(sent), 8)
+        for content_type, body_content_type in sent:
+            self.assertEqual(content_type, body_content_type)
+        self.assertEqual(
+            datary.headers['Content-Type'],
+            'application/x-www-form-urlencoded')
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Response test file
+"""
+import json
+import mock
+import requests
+
+from datary import Datary
+from datary.requests import DataryJsonCodec, DataryResponse
+from datary.test.test_datary import DataryTestCase
+
+
+def make_response(value, status_code=200):
+    """
+    Returns:
+        (requests.Response) response with the json body of the value.
+    """
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.headers['Content-Type'] = 'application/json'
+    response._content = json.dumps(value).encode('utf-8')
+    return response
+
+
+class DataryResponseTestCase(DataryTestCase):
+    """
+    DataryResponse Test case
+    """
+
+    def test_decode_once(self):
+        """
+        Test DataryResponse decodes its body once & releases it
+        """
+        codec = mock.Mock(wraps=DataryJsonCodec())
+        response = DataryResponse(make_response(self.original), codec)
+
+        self.assertTrue(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers['Content-Type'], 'application/json')
+        self.assertFalse(response.decoded)
+        self.assertTrue(response.content)
+
+        # copies share the body bytes, decoding their own object
+        response_copy = response.copy()
+        self.assertIs(response_copy.content, response.content)
+        self.assertEqual(response_copy.json(), self.original)
+        self.assertIsNone(response_copy.content)
+        self.assertFalse(response.decoded)
+        self.assertTrue(response.response.content)
+
+        value = response.json()
+        self.assertEqual(value, self.original)
+        self.assertIs(response.json(), value)
+        self.assertEqual(codec.decode.call_count, 1)
+
+        # body bytes released
+        self.assertTrue(response.decoded)
+        self.assertIsNone(response.content)
+        self.assertIsNone(response.response.content)
+
+        # copies of a decoded response own the body encoded again
+        response_copy = response.copy()
+        self.assertIsInstance(response_copy, DataryResponse)
+        self.assertEqual(response_copy.json(), self.original)
+        self.assertIsNot(response_copy.json(), value)
+        self.assertIs(response_copy.json(), response_copy.json())
+        self.assertEqual(codec.decode.call_count, 1)
+        self.assertEqual(codec.loads.call_count, 2)
+
+    def test_get_original_decode_once(self):
+        """
+        Test get_original decodes the response once
+        """
+        codec = mock.Mock(wraps=DataryJsonCodec())
+        datary = Datary(codec=codec)
+
+        with mock.patch.object(datary, 'session') as mock_session:
+            mock_session.get.return_value = make_response(self.original)
+            original = datary.get_original(
+                self.dataset_uuid, self.repo_uuid, self.wdir_uuid)
+
+            self.assertEqual(original, self.original)
+            self.assertEqual(codec.decode.call_count, 1)
+
+            # empty in the wdir scope, looks in the repo scope
+            codec.reset_mock()
+            mock_session.get.side_effect = [
+                make_response({}), make_response(self.original)]
+            original = datary.get_original(
+                self.dataset_uuid, self.repo_uuid, self.wdir_uuid)
+
+            self.assertEqual(original, self.original)
+            self.assertEqual(mock_session.get.call_count, 3)
+            self.assertEqual(codec.decode.call_count, 2)
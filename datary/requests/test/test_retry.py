@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Retry test file
+"""
+import unittest
+
+from email.utils import formatdate
+
+import mock
+import requests
+
+from datary.requests import DataryRetryPolicy
+from datary.test.test_datary import DataryTestCase
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryRetryPolicyTestCase(unittest.TestCase):
+    """
+    DataryRetryPolicy Test case
+    """
+
+    policy = DataryRetryPolicy(backoff_base=1, backoff_max=10)
+
+    def test_is_retryable(self):
+        """
+        Test DataryRetryPolicy is_retryable
+        """
+        # throttled requests are always retried
+        for method in ['GET', 'POST', 'PUT', 'DELETE']:
+            self.assertTrue(self.policy.is_retryable(method, 429))
+
+        # gateway errors only retried if idempotent
+        for code in [502, 503, 504]:
+            self.assertTrue(self.policy.is_retryable('GET', code))
+            self.assertTrue(self.policy.is_retryable('DELETE', code))
+            self.assertFalse(self.policy.is_retryable('POST', code))
+
+        self.assertFalse(self.policy.is_retryable('GET', 500))
+        self.assertFalse(self.policy.is_retryable('GET', 404))
+
+        # connection errors only retried if idempotent
+        conn_err = requests.ConnectionError('reset')
+        self.assertTrue(self.policy.is_retryable('GET', exception=conn_err))
+        self.assertFalse(self.policy.is_retryable('POST', exception=conn_err))
+        self.assertFalse(self.policy.is_retryable(
+            'GET', exception=requests.RequestException('err')))
+
+    @mock.patch('datary.requests.retry.random')
+    def test_backoff(self, mock_random):
+        """
+        Test DataryRetryPolicy exponential backoff with full jitter
+        """
+        mock_random.uniform.side_effect = lambda low, high: high
+
+        self.assertEqual(self.policy.backoff(1), 1)
+        self.assertEqual(self.policy.backoff(2), 2)
+        self.assertEqual(self.policy.backoff(4), 8)
+        self.assertEqual(self.policy.backoff(10), 10)
+
+        for call in mock_random.uniform.call_args_list:
+            self.assertEqual(call[0][0], 0)
+
+    def test_retry_after(self):
+        """
+        Test DataryRetryPolicy retry_after
+        """
+        self.assertEqual(self.policy.retry_after(None), None)
+
+        response = MockRequestResponse(
+            "", status_code=429, headers={'Retry-After': '7'})
+        self.assertEqual(self.policy.retry_after(response), 7)
+        self.assertEqual(self.policy.delay(1, response), 7)
+
+        response2 = MockRequestResponse(
+            "", status_code=503,
+            headers={'Retry-After': formatdate(usegmt=True)})
+        self.assertEqual(self.policy.retry_after(response2), 0)
+
+        response3 = MockRequestResponse(
+            "Request limit exceeded, must wait for 12 seconds",
+            status_code=429, headers={})
+        self.assertEqual(self.policy.retry_after(response3), 12)
+
+        response4 = MockRequestResponse(
+            "Request limit exceeded", status_code=429,
+            headers={'Retry-After': 'soon'})
+        self.assertEqual(self.policy.retry_after(response4), None)
+
+        response5 = MockRequestResponse("err 10 seconds", status_code=503)
+        self.assertEqual(self.policy.retry_after(response5), None)
+
+        # longer waits than the max are not waited
+        response6 = MockRequestResponse(
+            "", status_code=429, headers={'Retry-After': '3600'})
+        self.assertEqual(self.policy.retry_after(response6), 3600)
+        self.assertEqual(self.policy.delay(1, response6), None)
+        self.assertEqual(
+            DataryRetryPolicy(max_retry_after=7200).delay(1, response6), 3600)
+
+
+class DataryRequestsRetryTestCase(DataryTestCase):
+    """
+    DataryRequests retry Test case
+    """
+
+    @mock.patch.object(DataryTestCase.datary, 'session')
+    @mock.patch('datary.requests.requests.time')
+    def test_request_retry(self, mock_time, mock_session):
+        """
+        Test DataryRequests request retries
+        """
+        ok_response = MockRequestResponse("ok")
+        unavailable_response = MockRequestResponse(
+            "unavailable", status_code=503, headers={'Retry-After': '3'})
+
+        # idempotent requests are retried after what the server asks.
+        mock_session.get.side_effect = iter(
+            [unavailable_response, ok_response])
+        result = self.datary.request(self.url, 'GET')
+        self.assertEqual(result.text, 'ok')
+        mock_time.sleep.assert_called_once_with(3.0)
+        mock_time.reset_mock()
+
+        # not idempotent requests are not retried.
+        mock_session.post.side_effect = iter(
+            [unavailable_response, ok_response])
+        result2 = self.datary.request(self.url, 'POST')
+        self.assertEqual(result2, None)
+        self.assertEqual(mock_session.post.call_count, 1)
+        self.assertEqual(mock_time.sleep.call_count, 0)
+
+        # connection resets are retried.
+        mock_session.get.reset_mock()
+        mock_session.get.side_effect = iter(
+            [requests.ConnectionError('reset'), ok_response])
+        result3 = self.datary.request(self.url, 'GET')
+        self.assertEqual(result3.text, 'ok')
+        self.assertEqual(mock_session.get.call_count, 2)
+        self.assertEqual(mock_time.sleep.call_count, 1)
+
+        # too long waits asked by the server are not waited.
+        mock_session.get.reset_mock()
+        mock_session.get.side_effect = iter([
+            MockRequestResponse(
+                "", status_code=429, headers={'Retry-After': '3600'}),
+            ok_response])
+        self.assertEqual(self.datary.request(self.url, 'GET'), None)
+        self.assertEqual(mock_session.get.call_count, 1)
+        self.assertEqual(mock_time.sleep.call_count, 1)
+
+        # retries are not recursive and end at the tries limit.
+        mock_session.get.reset_mock()
+        mock_session.get.side_effect = None
+        mock_session.get.return_value = unavailable_response
+        with mock.patch.object(self.datary, 'tries_limit', 50):
+            result4 = self.datary.request(self.url, 'GET')
+        self.assertEqual(result4, None)
+        self.assertEqual(mock_session.get.call_count, 50)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Datary python sdk Requests Singleflight test file
+"""
+import threading
+import time
+import unittest
+
+import mock
+
+from datary import Datary
+from datary.requests import DataryRequestCoalescer
+from datary.test.mock_requests import MockRequestResponse
+
+
+class DataryRequestCoalescerTestCase(unittest.TestCase):
+    """
+    DataryRequestCoalescer Test case
+    """
+
+    url = 'http://api.datary.io/repos/1234'
+
+    def wait_coalesced(self, coalescer, coalesced):
+        deadline = time.time() + 5
+        while coalescer.coalesced < coalesced and time.time() < deadline:
+            time.sleep(0.001)
+
+    def test_key(self):
+        """
+        Test identical requests keys
+        """
+        key = DataryRequestCoalescer.key
+        self.assertEqual(
+            key(self.url, {'a': 1, 'b': 2}, {'Authorization': 'Bearer 1'}),
+            key(self.url, {'b': 2, 'a': 1}, {'Authorization': 'Bearer 1'}))
+        self.assertNotEqual(
+            key(self.url, {}, {'Authorization': 'Bearer 1'}),
+            key(self.url, {}, {'Authorization': 'Bearer 2'}))
+        self.assertNotEqual(key(self.url, {'a': 1}), key(self.url))
+
+    def test_call(self):
+        """
+        Test concurrent calls share the in flight one
+        """
+        coalescer = DataryRequestCoalescer()
+        release = threading.Event()
+        function = mock.Mock(side_effect=lambda: release.wait() and 'result')
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    coalescer.call('key', function)))
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        self.wait_coalesced(coalescer, 7)
+        self.assertEqual(len(coalescer), 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(function.call_count, 1)
+        self.assertEqual(results, ['result'] * 8)
+        self.assertEqual((coalescer.calls, coalescer.coalesced), (1, 7))
+        self.assertEqual(len(coalescer), 0)
+
+        # not cached once it ends
+        self.assertEqual(coalescer.call('key', function), 'result')
+        self.assertEqual(function.call_count, 2)
+
+        # exceptions are shared too
+        function.side_effect = ValueError('err')
+        self.assertRaises(ValueError, coalescer.call, 'key', function)
+        self.assertEqual(len(coalescer), 0)
+
+    @mock.patch('datary.requests.requests.requests.Session.get')
+    def test_request(self, mock_get):
+        """
+        Test concurrent identical GETs of a client send one request
+        """
+        coalescer = DataryRequestCoalescer()
+        datary = Datary(token='123', request_coalescer=coalescer)
+        release = threading.Event()
+
+        def get(url, **kwargs):
+            release.wait()
+            return MockRequestResponse("", json={'uuid': '1234'})
+
+        mock_get.side_effect = get
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                datary.response_json(datary.request(self.url, 'GET'))))
+            for _ in range(8)]
+        for thread in threads:
+            thread.start()
+
+        self.wait_coalesced(coalescer, 7)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(results, [{'uuid': '1234'}] * 8)
+
+        # every caller owns its decoded json
+        results[0]['uuid'] = 'edited'
+        self.assertEqual(results[1], {'uuid': '1234'})
+        self.assertEqual(len(set(map(id, results))), 8)
+
+        # other users, streamed and not GET requests are not coalesced
+        Datary(token='456', request_coalescer=coalescer).request(
+            self.url, 'GET')
+        datary.request(self.url, 'GET', stream=True)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(coalescer.calls, 2)
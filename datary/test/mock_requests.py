@@ -2,6 +2,7 @@
 """
 Mock response module
 """
+import json as jsonlib
 
 
 class MockRequestResponse:
@@ -22,6 +23,18 @@ class MockRequestResponse:
         self._encoding = encoding
 
         self._json = json
+        self.closed = False
+
+    @property
+    def content(self):
+        """
+        Content atribute getter
+        Returns: body bytes of the json introduced in MockRequestResponse
+        class, None without json.
+        """
+        if self._json is None:
+            return None
+        return jsonlib.dumps(self._json).encode('utf-8')
 
     def encoding(self):
         """
@@ -43,3 +56,9 @@ class MockRequestResponse:
         Returns: json introduced in MockRequestResponse class
         """
         return self._json
+
+    def close(self):
+        """
+        Close the response, releasing its connection.
+        """
+        self.closed = True
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Datary Lazy Imports Test
+"""
+import subprocess
+import sys
+import unittest
+
+from datary.lazy import DataryLazyModule, get_logger, lazy_module
+
+
+class DataryLazyTestCase(unittest.TestCase):
+    """
+    Datary lazy imports Test Case
+    """
+
+    def imported(self, code, modules):
+        """
+        Returns:
+            (list) modules imported running the code in a new interpreter.
+        """
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            '{}\nimport sys\nprint(",".join(m for m in {!r} '
+            'if m in sys.modules))'.format(code, modules)])
+        return [m for m in output.decode('utf-8').strip().split(',') if m]
+
+    def test_import(self):
+        """
+        Test the sdk imports its dependencies on their first use
+        """
+        modules = ['requests', 'scrapbag', 'structlog', 'urllib3']
+
+        self.assertEqual(self.imported('import datary', modules), [])
+        self.assertEqual(
+            self.imported('from datary import Datary', modules), [])
+
+        # the client doesn't sign in nor open its session until a request
+        self.assertEqual(self.imported(
+            "from datary import Datary\n"
+            "Datary(username='pepe', password='pass')", modules), [])
+
+        self.assertEqual(self.imported(
+            "from datary import Datary\n"
+            "Datary(token='123').session", modules),
+            ['requests', 'urllib3'])
+
+    def test_lazy_module(self):
+        """
+        Test DataryLazyModule
+        """
+        module = lazy_module('json')
+        self.assertIsInstance(module, DataryLazyModule)
+        self.assertIn('json', repr(module))
+        self.assertNotIn('imported', repr(module))
+
+        self.assertEqual(module.dumps([1]), '[1]')
+        self.assertIn('imported', repr(module))
+
+        self.assertRaises(
+            ImportError, getattr, lazy_module('datary_not_exists'), 'x')
+
+    def test_get_logger(self):
+        """
+        Test DataryLazyLogger
+        """
+        logger = get_logger(__name__)
+        self.assertTrue(callable(logger.info))
+        self.assertIsNotNone(logger._logger)
@@ -6,12 +6,12 @@ import os
 
 from urllib.parse import urljoin
 from datary.repos import DataryRepos
-from scrapbag import force_list, add_element
 
-import structlog
+from datary.lazy import get_logger, lazy_module
 
 
-logger = structlog.getLogger(__name__)
+scrapbag = lazy_module('scrapbag')
+logger = get_logger(__name__)
 
 
 class DataryWorkdirs(DataryRepos):
@@ -31,13 +31,25 @@ class DataryWorkdirs(DataryRepos):
             workdir of all commits done in a repo.
 
         """
+        # commits never change, look for it in the content cache.
+        cache_key = 'commits/{}/filetree'.format(commit_sha1)
+        if self.content_cache is not None and commit_sha1:
+            filetree = self.content_cache.get(cache_key)
+            if filetree is not None:
+                return filetree
+
         url = urljoin(self.URL_BASE,
                       "commits/{}/filetree".format(commit_sha1))
         params = {'namespace': repo_uuid}
         response = self.request(
-            url, 'GET', **{'headers': self.headers, 'params': params})
+            url, 'GET', **{'params': params})
+
+        filetree = self.response_json(response) if response else {}
+
+        if self.content_cache is not None and commit_sha1 and filetree:
+            self.content_cache.put(cache_key, filetree)
 
-        return response.json() if response else {}
+        return filetree
 
     def get_wdir_filetree(self, wdir_uuid):
         """
@@ -53,9 +65,9 @@ class DataryWorkdirs(DataryRepos):
         """
         url = urljoin(self.URL_BASE,
                       "workdirs/{}/filetree".format(wdir_uuid))
-        response = self.request(url, 'GET', **{'headers': self.headers})
+        response = self.request(url, 'GET')
 
-        return response.json() if response else {}
+        return self.response_json(response) if response else {}
 
     def get_wdir_changes(self, wdir_uuid=None, **kwargs):
         """
@@ -76,9 +88,9 @@ class DataryWorkdirs(DataryRepos):
 
         url = urljoin(self.URL_BASE,
                       "workdirs/{}/changes".format(wdir_uuid))
-        response = self.request(url, 'GET', **{'headers': self.headers})
+        response = self.request(url, 'GET')
 
-        return response.json() if response else {}
+        return self.response_json(response) if response else {}
 
     def format_wdir_changes(self, wdir_changes_tree):
         """
@@ -94,8 +106,8 @@ class DataryWorkdirs(DataryRepos):
         result = {}
 
         for sublist in list(wdir_changes_tree):
-            for item in force_list(sublist):
-                add_element(
+            for item in scrapbag.force_list(sublist):
+                scrapbag.add_element(
                     result,
                     os.path.join(item.get('dirname', ''),
                                  item.get('basename', '')),
@@ -30,9 +30,17 @@ setup(
     keywords=['datary', 'sdk', 'api'],  # arbitrary keywords
     classifiers=[
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5'
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12'
     ],
+    python_requires='>=3.7',
     install_requires=required,
+    extras_require={
+        'orjson': ['orjson'],
+        'zstd': ['zstandard'],
+    },
 )